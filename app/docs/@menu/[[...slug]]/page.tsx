@@ -0,0 +1,28 @@
+import DocsMenu from "@/components/docs-menu";
+import { ROUTE_SECTIONS, docs_routes } from "@/lib/routes-config";
+import { RouteSection } from "@/lib/routes-tree";
+
+type MenuProps = {
+    params: Promise<{ slug: string[] }>;
+};
+
+function isRouteSection(segment: string | undefined): segment is RouteSection {
+    return segment !== undefined && Object.hasOwn(ROUTE_SECTIONS, segment);
+}
+
+// The sidebar for a docs page. The branch the page sits in is open on first
+// paint, so its generated links are rendered here; collapsed sections still
+// load on the client when opened.
+export default async function DocsMenuSlot(props: MenuProps) {
+    const { slug = [] } = await props.params;
+    const section = slug[0];
+    const sections = isRouteSection(section) ? { [section]: ROUTE_SECTIONS[section] } : {};
+
+    return <DocsMenu sections={sections} />;
+}
+
+export function generateStaticParams() {
+    return docs_routes.map((item) => ({
+        slug: item.href.split("/").slice(1),
+    }));
+}
@@ -0,0 +1,5 @@
+import DocsMenu from "@/components/docs-menu";
+
+export default function DocsMenuDefault() {
+    return <DocsMenu />;
+}
@@ -3,8 +3,14 @@ import Pagination from "@/components/pagination";
 import Toc from "@/components/toc";
 import { docs_routes } from "@/lib/routes-config";
 import { notFound } from "next/navigation";
-import { getCompiledDocsForSlug, getDocFrontmatter } from "@/lib/markdown";
+import {
+    getCompiledDocsForSlug,
+    getDocFrontmatter,
+    getPrefetchRoutes,
+    getSocialImage,
+} from "@/lib/markdown";
 import { Typography } from "@/components/typography";
+import PrefetchLinks from "@/components/prefetch-links";
 
 type PageProps = {
     params: Promise<{ slug: string[] }>;
@@ -37,6 +43,7 @@ export default async function DocsPage(props: PageProps) {
             </div>
 
             <Toc path={pathName} />
+            <PrefetchLinks routes={getPrefetchRoutes("docs", pathName)} />
         </div>
     );
 }
@@ -51,6 +58,7 @@ export async function generateMetadata(props: PageProps) {
     const { title, description } = res;
     const canonicalPath = pathName ? `/docs/${pathName}` : "/docs";
     const fullUrl = `https://krakenengine.org${canonicalPath}`;
+    const socialImage = await getSocialImage("docs", pathName);
     return {
         title,
         description,
@@ -63,7 +71,9 @@ export async function generateMetadata(props: PageProps) {
             url: fullUrl,
             images: [
                 {
-                    url: "https://krakenengine.org/opengraph-image",
+                    url: socialImage ?? "https://krakenengine.org/opengraph-image",
+                    width: 1200,
+                    height: 630,
                     alt: title,
                 },
             ],
@@ -73,7 +83,7 @@ export async function generateMetadata(props: PageProps) {
             card: "summary_large_image",
             title,
             description,
-            images: ["https://krakenengine.org/twitter-image"],
+            images: [socialImage ?? "https://krakenengine.org/twitter-image"],
         },
     };
 }
@@ -2,12 +2,14 @@ import { Leftbar } from "@/components/leftbar";
 
 export default function DocsLayout({
   children,
+  menu,
 }: Readonly<{
   children: React.ReactNode;
+  menu: React.ReactNode;
 }>) {
   return (
     <div className="flex items-start gap-8">
-      <Leftbar key="leftbar" />
+      <Leftbar key="leftbar" menu={menu} />
       <div className="flex-[5.25]">{children}</div>
     </div>
   );
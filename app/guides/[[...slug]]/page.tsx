@@ -6,8 +6,11 @@ import { notFound } from "next/navigation";
 import {
   getCompiledGuidesForSlug,
   getGuideFrontmatter,
+  getPrefetchRoutes,
+  getSocialImage,
 } from "@/lib/markdown";
 import { Typography } from "@/components/typography";
+import PrefetchLinks from "@/components/prefetch-links";
 
 type PageProps = {
   params: Promise<{ slug: string[] }>;
@@ -40,6 +43,7 @@ export default async function DocsPage(props: PageProps) {
       </div>
 
       <Toc path={pathName} section="guides" />
+      <PrefetchLinks routes={getPrefetchRoutes("guides", pathName)} />
     </div>
   );
 }
@@ -54,6 +58,7 @@ export async function generateMetadata(props: PageProps) {
   const { title, description } = res;
   const canonicalPath = pathName ? `/guides/${pathName}` : "/guides";
   const fullUrl = `https://krakenengine.org${canonicalPath}`;
+  const socialImage = await getSocialImage("guides", pathName);
   return {
     title,
     description,
@@ -66,7 +71,9 @@ export async function generateMetadata(props: PageProps) {
       url: fullUrl,
       images: [
         {
-          url: "https://krakenengine.org/opengraph-image",
+          url: socialImage ?? "https://krakenengine.org/opengraph-image",
+          width: 1200,
+          height: 630,
           alt: title,
         },
       ],
@@ -76,7 +83,7 @@ export async function generateMetadata(props: PageProps) {
       card: "summary_large_image",
       title,
       description,
-      images: ["https://krakenengine.org/twitter-image"],
+      images: [socialImage ?? "https://krakenengine.org/twitter-image"],
     },
   };
 }
@@ -8,6 +8,7 @@ import "@/styles/globals.css";
 import "@/styles/syntax.css";
 
 import MainWrapper from "@/components/MainWrapper";
+import ServiceWorker from "@/components/service-worker";
 
 const sansFont = Space_Grotesk({
   subsets: ["latin"],
@@ -132,6 +133,7 @@ export default function RootLayout({
           <MainWrapper>{children}</MainWrapper>
           <Footer />
         </ThemeProvider>
+        <ServiceWorker />
       </body>
     </html>
   );
@@ -0,0 +1,47 @@
+import React from 'react';
+import Link from 'next/link';
+
+// generated by scripts/generate_api_docs.py
+import hierarchy from '@/public/data/class-hierarchy.json';
+
+type ClassNode = {
+    title: string;
+    href: string;
+    bases: string[];
+    subclasses: string[];
+    members: number;       // members the class defines itself
+    inherited: number;     // members listed under "Inherited from ..."
+};
+
+type ClassTreeProps = {
+    all?: boolean;         // also list classes with no documented subclasses
+};
+
+const classes = hierarchy.classes as Record<string, ClassNode>;
+
+function Branch({ name }: { name: string }) {
+    const node = classes[name];
+    if (!node) return null;
+    return (
+        <li>
+            <Link href={node.href}><code>{node.title}</code></Link>
+            {node.inherited > 0 && (
+                <span className="text-xs text-muted-foreground"> (+{node.inherited} inherited)</span>
+            )}
+            {node.subclasses.length > 0 && (
+                <ul>
+                    {node.subclasses.map((child) => <Branch key={child} name={child} />)}
+                </ul>
+            )}
+        </li>
+    );
+}
+
+export default function ClassTree({ all = false }: ClassTreeProps) {
+    const roots = hierarchy.roots.filter((name) => all || classes[name]?.subclasses.length);
+    return (
+        <ul>
+            {roots.map((name) => <Branch key={name} name={name} />)}
+        </ul>
+    );
+}
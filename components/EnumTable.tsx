@@ -0,0 +1,162 @@
+"use client";
+
+import React from 'react';
+import {
+    Table,
+    TableBody,
+    TableCell,
+    TableHead,
+    TableHeader,
+    TableRow,
+} from '@/components/ui/table';
+
+// generated by scripts/generate_api_docs.py into public/data/constants
+type EnumData = {
+    name: string;
+    members: [string, string][];   // [member name, description]
+};
+
+type EnumTableProps = {
+    name: string;          // enum slug, e.g. "keycode"
+    type: string;          // enum type shown in the Type column
+    count: number;         // member count, used to reserve space before loading
+};
+
+// Tables longer than this are rendered in a fixed-height scroll box and only
+// the rows in view (plus a small overscan) are mounted.
+const VIRTUALIZE_AFTER = 50;
+const ROW_HEIGHT = 53;
+const VISIBLE_ROWS = 12;
+const OVERSCAN = 6;
+
+const cache = new Map<string, Promise<EnumData>>();
+
+const loadEnum = (name: string) => {
+    let data = cache.get(name);
+    if (!data) {
+        data = fetch(`/data/constants/${name}.json`).then((res) => {
+            if (!res.ok) throw new Error(`Failed to load enum data for ${name}`);
+            return res.json();
+        });
+        data.catch(() => cache.delete(name));
+        cache.set(name, data);
+    }
+    return data;
+};
+
+// descriptions are plain text with `inline code` spans
+const renderDescription = (text: string) =>
+    text.split(/(`[^`]+`)/).map((part, index) =>
+        part.length > 2 && part.startsWith('`') && part.endsWith('`')
+            ? <code key={index}>{part.slice(1, -1)}</code>
+            : <React.Fragment key={index}>{part}</React.Fragment>
+    );
+
+export default function EnumTable({ name, type, count }: EnumTableProps) {
+    const rootRef = React.useRef<HTMLDivElement>(null);
+    const [data, setData] = React.useState<EnumData | null>(null);
+    const [error, setError] = React.useState(false);
+    const [scrollTop, setScrollTop] = React.useState(0);
+
+    const virtualized = count > VIRTUALIZE_AFTER;
+    const boxHeight = Math.min(count, VISIBLE_ROWS) * ROW_HEIGHT;
+
+    // fetch only once the table is near the viewport
+    React.useEffect(() => {
+        const root = rootRef.current;
+        if (!root) return;
+
+        let cancelled = false;
+        const observer = new IntersectionObserver((entries) => {
+            if (!entries.some((entry) => entry.isIntersecting)) return;
+            observer.disconnect();
+            loadEnum(name).then(
+                (result) => !cancelled && setData(result),
+                () => !cancelled && setError(true)
+            );
+        }, { rootMargin: '400px 0px' });
+
+        observer.observe(root);
+        return () => {
+            cancelled = true;
+            observer.disconnect();
+        };
+    }, [name]);
+
+    const header = (
+        <TableHeader>
+            <TableRow>
+                <TableHead>Name</TableHead>
+                <TableHead>Description</TableHead>
+                <TableHead>Type</TableHead>
+            </TableRow>
+        </TableHeader>
+    );
+
+    const renderRow = ([member, description]: [string, string]) => (
+        <TableRow key={member} style={virtualized ? { height: ROW_HEIGHT } : undefined}>
+            <TableCell><code>{member}</code></TableCell>
+            <TableCell
+                className={virtualized ? 'max-w-md truncate' : undefined}
+                title={virtualized ? description : undefined}
+            >
+                {renderDescription(description)}
+            </TableCell>
+            <TableCell><code>{type}</code></TableCell>
+        </TableRow>
+    );
+
+    if (error) {
+        return (
+            <div ref={rootRef} className="text-sm text-muted-foreground">
+                Could not load the members of <code>{type}</code>.
+            </div>
+        );
+    }
+
+    if (!data) {
+        // reserve roughly the final height so anchors above don't jump
+        return (
+            <div
+                ref={rootRef}
+                aria-busy="true"
+                style={{ minHeight: (virtualized ? boxHeight : count * ROW_HEIGHT) + ROW_HEIGHT }}
+            />
+        );
+    }
+
+    if (!virtualized) {
+        return (
+            <div ref={rootRef}>
+                <Table>
+                    {header}
+                    <TableBody>{data.members.map(renderRow)}</TableBody>
+                </Table>
+            </div>
+        );
+    }
+
+    const total = data.members.length;
+    const first = Math.max(0, Math.floor(scrollTop / ROW_HEIGHT) - OVERSCAN);
+    const last = Math.min(total, Math.ceil((scrollTop + boxHeight) / ROW_HEIGHT) + OVERSCAN);
+
+    return (
+        <div ref={rootRef}>
+            <div
+                className="overflow-auto"
+                style={{ maxHeight: boxHeight + ROW_HEIGHT }}
+                onScroll={(event) => setScrollTop(event.currentTarget.scrollTop)}
+            >
+                <Table>
+                    {header}
+                    <TableBody>
+                        {first > 0 && <tr aria-hidden style={{ height: first * ROW_HEIGHT }} />}
+                        {data.members.slice(first, last).map(renderRow)}
+                        {last < total && <tr aria-hidden style={{ height: (total - last) * ROW_HEIGHT }} />}
+                    </TableBody>
+                </Table>
+            </div>
+            <p className="text-xs text-muted-foreground">{total} members</p>
+        </div>
+    );
+}
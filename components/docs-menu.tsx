@@ -1,6 +1,11 @@
 "use client";
 
-import { DOC_ROUTES, GUIDE_ROUTES, EachRoute } from "@/lib/routes-config";
+import {
+  DOC_ROUTE_TREE,
+  GUIDE_ROUTES,
+  EachRoute,
+  RouteSection,
+} from "@/lib/routes-tree";
 import SubLink from "./sublink";
 import { usePathname } from "next/navigation";
 
@@ -9,13 +14,18 @@ type SectionMenuProps = {
   basePath: string;
   matchPrefix: string;
   isSheet?: boolean;
+  sections?: SectionItems;
 };
 
+// Generated section links rendered with the menu instead of loaded on the client.
+type SectionItems = Partial<Record<RouteSection, EachRoute[]>>;
+
 function SectionMenu({
   routes,
   basePath,
   matchPrefix,
   isSheet = false,
+  sections = {},
 }: SectionMenuProps) {
   const pathname = usePathname();
   if (!pathname.startsWith(matchPrefix)) return null;
@@ -28,6 +38,7 @@ function SectionMenu({
           href: `${basePath}${item.href}`,
           level: 0,
           isSheet,
+          sectionItems: item.section && sections[item.section],
         };
         return (
           <SubLink
@@ -40,13 +51,20 @@ function SectionMenu({
   );
 }
 
-export default function DocsMenu({ isSheet = false }: { isSheet?: boolean }) {
+export default function DocsMenu({
+  isSheet = false,
+  sections,
+}: {
+  isSheet?: boolean;
+  sections?: SectionItems;
+}) {
   return (
     <SectionMenu
-      routes={DOC_ROUTES}
+      routes={DOC_ROUTE_TREE}
       basePath="/docs"
       matchPrefix="/docs"
       isSheet={isSheet}
+      sections={sections}
     />
   );
 }
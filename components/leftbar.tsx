@@ -12,11 +12,11 @@ import { DialogTitle } from "./ui/dialog";
 import { ScrollArea } from "@/components/ui/scroll-area";
 import DocsMenu, { GuidesMenu } from "./docs-menu";
 
-export function Leftbar() {
+export function Leftbar({ menu }: { menu?: React.ReactNode }) {
   return (
     <aside className="md:flex hidden w-[20rem] sticky top-16 flex-col h-[93.75vh] overflow-y-auto">
       <ScrollArea className="py-4 px-2">
-        <DocsMenu />
+        {menu ?? <DocsMenu />}
         <GuidesMenu />
       </ScrollArea>
     </aside>
@@ -1,25 +1,68 @@
 import { ComponentProps } from "react";
 import NextImage from "next/image";
+import imageManifest from "@/lib/image-manifest.json";
 
 type Height = ComponentProps<typeof NextImage>["height"];
 type Width = ComponentProps<typeof NextImage>["width"];
 
+type ImageInfo = {
+  width: number;
+  height: number;
+  hash: string;
+  variants: [number, string][];
+};
+
+// Written by scripts/image_assets.py
+const IMAGES = imageManifest.images as unknown as Record<string, ImageInfo>;
+
+// Display width when the page gives none (the box NextImage used to get),
+// and the widest the content column gets.
+const DEFAULT_WIDTH = 800;
+
 export default function Image({
   src,
   alt = "alt",
-  width = 800,
-  height = 350,
+  width,
+  height,
   ...props
 }: ComponentProps<"img">) {
   // Only allow src to be string or StaticImport for NextImage
   if (!src || typeof src !== "string") return null;
+
+  const info = IMAGES[src];
+  if (!info) {
+    return (
+      <NextImage
+        src={src}
+        alt={alt}
+        width={(width ?? DEFAULT_WIDTH) as Width}
+        height={(height ?? 350) as Height}
+        quality={40}
+        {...props}
+      />
+    );
+  }
+
+  // The aspect ratio reserves the box before the file arrives; the variants
+  // let the browser pick a file for the column width rather than the
+  // original's, which may be several times wider.
+  const shownWidth = Number(width) || DEFAULT_WIDTH;
+  const shownHeight = Number(height) || Math.round((info.height * shownWidth) / info.width);
+  const srcSet = info.variants.length
+    ? [...info.variants.map(([w, url]) => `${url} ${w}w`), `${src} ${info.width}w`].join(", ")
+    : undefined;
   return (
-    <NextImage
+    // eslint-disable-next-line @next/next/no-img-element
+    <img
       src={src}
       alt={alt}
-      width={width as Width}
-      height={height as Height}
-      quality={40}
+      width={shownWidth}
+      height={shownHeight}
+      srcSet={srcSet}
+      sizes={srcSet ? `(max-width: 768px) 100vw, ${Math.min(shownWidth, DEFAULT_WIDTH)}px` : undefined}
+      loading="lazy"
+      decoding="async"
+      style={{ maxWidth: "100%", height: "auto" }}
       {...props}
     />
   );
@@ -6,6 +6,7 @@ import Anchor from "./anchor";
 import { SheetLeftbar } from "./leftbar";
 import { SheetClose } from "@/components/ui/sheet";
 import AlgoliaSearch from "./algolia-search";
+import SymbolSearch from "./symbol-search";
 import Image from "next/image";
 
 export const NAVLINKS = [
@@ -51,6 +52,7 @@ export function Navbar() {
 
         <div className="flex items-center sm:justify-normal justify-between gap-2 sm:gap-3 ml-1 sm:w-fit w-[90%]">
           <AlgoliaSearch {...algolia_props} />
+          <SymbolSearch />
           <div className="flex items-center gap-2">
             <Link
               id="nav-github-link"
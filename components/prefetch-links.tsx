@@ -0,0 +1,31 @@
+"use client";
+
+import * as React from "react";
+import { useRouter } from "next/navigation";
+
+type PrefetchLinksProps = {
+  routes: string[];
+};
+
+// Warm the router cache for the pages this one links to most (the `prefetch`
+// list in lib/page-manifest.json) once the browser is idle.
+export default function PrefetchLinks({ routes }: PrefetchLinksProps) {
+  const router = useRouter();
+  const key = routes.join("\n");
+
+  React.useEffect(() => {
+    if (!key) return;
+    const connection = (navigator as Navigator & { connection?: { saveData?: boolean } }).connection;
+    if (connection?.saveData) return;
+
+    const run = () => key.split("\n").forEach((route) => router.prefetch(route));
+    if ("requestIdleCallback" in window) {
+      const id = window.requestIdleCallback(run, { timeout: 2000 });
+      return () => window.cancelIdleCallback(id);
+    }
+    const id = window.setTimeout(run, 200);
+    return () => window.clearTimeout(id);
+  }, [router, key]);
+
+  return null;
+}
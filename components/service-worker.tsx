@@ -0,0 +1,24 @@
+"use client";
+
+import * as React from "react";
+
+// Registers public/sw.js, which keeps the API reference available offline.
+// Every page load asks it to sync, so a regenerated precache manifest is
+// fetched and only the changed pages are downloaded. Readers with Save-Data
+// on are not sent the whole reference.
+export default function ServiceWorker() {
+  React.useEffect(() => {
+    if (process.env.NODE_ENV !== "production" || !("serviceWorker" in navigator)) return;
+    const connection = (navigator as Navigator & { connection?: { saveData?: boolean } }).connection;
+    navigator.serviceWorker.register("/sw.js").then(
+      (registration) => {
+        if (connection?.saveData) return;
+        const worker = registration.active ?? registration.waiting ?? registration.installing;
+        worker?.postMessage("sync");
+      },
+      () => undefined
+    );
+  }, []);
+
+  return null;
+}
@@ -1,4 +1,4 @@
-import { EachRoute } from "@/lib/routes-config";
+import { EachRoute, RouteSection, loadRouteSection } from "@/lib/routes-tree";
 import Anchor from "./anchor";
 import {
   Collapsible,
@@ -8,9 +8,32 @@ import {
 import { cn } from "@/lib/utils";
 import { SheetClose } from "@/components/ui/sheet";
 import { ChevronRight } from "lucide-react";
-import { useState } from "react";
+import { useEffect, useState } from "react";
 import { usePathname } from "next/navigation";
 
+// Generated sections (all classes, all function modules) are fetched the
+// first time their branch is open, so their routes stay out of the page bundle.
+// The section the current page is in comes from the server as `preloaded`.
+function useRouteSection(
+  section: RouteSection | undefined,
+  open: boolean,
+  preloaded: EachRoute[] | undefined
+) {
+  const [routes, setRoutes] = useState<EachRoute[]>([]);
+  useEffect(() => {
+    if (!section || !open || preloaded) return;
+    let live = true;
+    loadRouteSection(section).then(
+      (loaded) => live && setRoutes(loaded),
+      () => undefined
+    );
+    return () => {
+      live = false;
+    };
+  }, [section, open, preloaded]);
+  return preloaded ?? routes;
+}
+
 export default function SubLink({
   title,
   href,
@@ -20,7 +43,9 @@ export default function SubLink({
   isSheet,
   tag,
   separator,
-}: EachRoute & { level: number; isSheet: boolean }) {
+  section,
+  sectionItems: preloaded,
+}: EachRoute & { level: number; isSheet: boolean; sectionItems?: EachRoute[] }) {
   const path = usePathname();
   const isActiveBranch = path == href || (href !== "/" && path.startsWith(href));
   const defaultOpen = level == 0 && (title === "Preface" || title === "Getting Started");
@@ -29,6 +54,8 @@ export default function SubLink({
     open: defaultOpen || isActiveBranch,
   }));
   const open = openState.path === path ? openState.open : defaultOpen || isActiveBranch;
+  const sectionItems = useRouteSection(section, open, preloaded);
+  const allItems = section ? [...(items ?? []), ...sectionItems] : items;
 
   const Comp = (
     <Anchor
@@ -63,7 +90,7 @@ export default function SubLink({
     </h4>
   );
 
-  if (!items) {
+  if (!allItems) {
     return (
       <div className="leftbar-sublink flex flex-col">
         {titleOrLink}
@@ -99,7 +126,7 @@ export default function SubLink({
               level > 0 && "pl-4 border-l ml-1.5"
             )}
           >
-            {items?.map((innerLink) => {
+            {allItems.map((innerLink) => {
               const modifiedItems = {
                 ...innerLink,
                 href: `${href + innerLink.href}`,
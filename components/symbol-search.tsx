@@ -0,0 +1,97 @@
+"use client";
+
+import * as React from "react";
+import { useRouter } from "next/navigation";
+
+import { Input } from "@/components/ui/input";
+import { cn } from "@/lib/utils";
+import { SymbolHit, SymbolIndex, loadSymbolIndex } from "@/lib/symbol-index";
+
+export default function SymbolSearch() {
+  const router = useRouter();
+  const [index, setIndex] = React.useState<SymbolIndex | null>(null);
+  const [query, setQuery] = React.useState("");
+  const [active, setActive] = React.useState(0);
+  const [open, setOpen] = React.useState(false);
+
+  const hits: SymbolHit[] = React.useMemo(
+    () => (index ? index.search(query, 12) : []),
+    [index, query]
+  );
+
+  // the index is one small file; fetch it the first time the box is used
+  const load = () => {
+    if (!index) loadSymbolIndex().then(setIndex, () => undefined);
+  };
+
+  const go = (hit: SymbolHit) => {
+    setOpen(false);
+    setQuery("");
+    router.push(hit.href);
+  };
+
+  const onKeyDown = (event: React.KeyboardEvent<HTMLInputElement>) => {
+    if (event.key === "ArrowDown") {
+      event.preventDefault();
+      setActive((i) => Math.min(i + 1, hits.length - 1));
+    } else if (event.key === "ArrowUp") {
+      event.preventDefault();
+      setActive((i) => Math.max(i - 1, 0));
+    } else if (event.key === "Enter" && hits[active]) {
+      event.preventDefault();
+      go(hits[active]);
+    } else if (event.key === "Escape") {
+      setOpen(false);
+    }
+  };
+
+  return (
+    <div className="relative lg:block hidden w-52">
+      <Input
+        type="search"
+        aria-label="Go to symbol"
+        placeholder="Go to symbol..."
+        className="h-9 font-code text-xs"
+        value={query}
+        onFocus={() => {
+          load();
+          setOpen(true);
+        }}
+        onBlur={() => setOpen(false)}
+        onChange={(event) => {
+          setQuery(event.target.value);
+          setActive(0);
+          setOpen(true);
+        }}
+        onKeyDown={onKeyDown}
+      />
+      {open && hits.length > 0 && (
+        <ul
+          role="listbox"
+          className="absolute right-0 top-11 z-50 w-80 max-h-96 overflow-auto rounded-md border bg-background py-1 shadow-md"
+        >
+          {hits.map((hit, i) => (
+            <li
+              key={hit.name}
+              role="option"
+              aria-selected={i === active}
+              className={cn(
+                "flex items-center justify-between gap-3 px-3 py-1.5 text-sm cursor-pointer",
+                i === active && "bg-muted"
+              )}
+              onMouseEnter={() => setActive(i)}
+              // mousedown so the click lands before the input blurs
+              onMouseDown={(event) => {
+                event.preventDefault();
+                go(hit);
+              }}
+            >
+              <span className="font-code truncate">{hit.name}</span>
+              <span className="text-xs text-muted-foreground">{hit.kind}</span>
+            </li>
+          ))}
+        </ul>
+      )}
+    </div>
+  );
+}
@@ -5,6 +5,8 @@ import {
 } from "@ariadocs/react";
 import path from "path";
 import { promises as fs } from "fs";
+import { createHash } from "crypto";
+import { ComponentProps, createElement } from "react";
 import {
     rehypeAutolinkHeadings,
     rehypeCodeRaw,
@@ -21,6 +23,9 @@ import {
 } from "./routes-config";
 import { visit } from "unist-util-visit";
 import { getIconName, hasSupportedExtension } from "./utils";
+import pageManifest from "./page-manifest.json";
+import highlightedCode from "./highlighted-code.json";
+import apiParams from "./api-params.json";
 
 // custom components imports
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
@@ -40,6 +45,22 @@ import {
     TableRow,
 } from "@/components/ui/table";
 import ApiSig from "@/components/ApiSig";
+import EnumTable from "@/components/EnumTable";
+import ClassTree from "@/components/ClassTree";
+
+type ApiSigProps = ComponentProps<typeof ApiSig>;
+
+// parameter lists shared by the generated <ApiSig> tags, which reference
+// them by `paramsId`; written by scripts/generate_api_docs.py
+const API_PARAMS = apiParams.params as Record<string, ApiSigProps["params"]>;
+
+// resolved here, on the server, so the table stays out of the client bundle
+function ApiSigWithParams({ paramsId, ...props }: ApiSigProps & { paramsId?: string }) {
+    return createElement(ApiSig, {
+        ...props,
+        params: props.params ?? (paramsId ? API_PARAMS[paramsId] : undefined),
+    });
+}
 
 // add custom components
 const components = {
@@ -61,7 +82,9 @@ const components = {
     tr: TableRow,
     tbody: TableBody,
     t: TableCell,
-    ApiSig,
+    ApiSig: ApiSigWithParams,
+    EnumTable,
+    ClassTree,
 };
 
 const CONTENT_CONFIG = {
@@ -91,11 +114,87 @@ function getContentPath(section: ContentSection, slug: string) {
     return path.join(process.cwd(), ...config.baseDir, ...segments, "index.mdx");
 }
 
+// generated by scripts/page_manifest.py and scripts/generate_api_docs.py
+type PageManifestEntry = {
+    path: string;
+    hash: string;
+    title: string;
+    description: string;
+    toc: { level: number; text: string; href: string }[];
+    updated?: string; // UTC time the content hash last changed
+    prefetch?: string[]; // most-linked pages, most links first
+    linksHash?: string; // digest of the type links and parameter lists behind prefetch
+};
+
+const PAGE_MANIFEST = (
+    pageManifest as { pages: Record<string, PageManifestEntry> }
+).pages;
+
+function getRoute(section: ContentSection, slug: string) {
+    const segments = slug.split("/").filter(Boolean);
+    return [getSectionConfig(section).baseHref, ...segments].join("/");
+}
+
+// while running `python scripts/generate_api_docs.py --serve`, set
+// API_DOCS_SERVER (e.g. http://127.0.0.1:8765) to preview API pages rendered
+// from the installed engine instead of the generated files on disk
+const API_DOCS_SERVER = process.env.API_DOCS_SERVER;
+
+async function readContent(section: ContentSection, slug: string) {
+    if (API_DOCS_SERVER && section === "docs") {
+        try {
+            const res = await fetch(
+                `${API_DOCS_SERVER}/page${getRoute(section, slug)}`,
+                { cache: "no-store" }
+            );
+            if (res.ok) return await res.text();
+        } catch {
+            // server not running, fall back to the file
+        }
+    }
+    return await fs.readFile(getContentPath(section, slug), "utf-8");
+}
+
+// social preview images pre-rendered by scripts/og_images.py; pages without
+// one fall back to the dynamic app/opengraph-image.tsx
+export async function getSocialImage(section: ContentSection, slug: string) {
+    const route = getRoute(section, slug);
+    try {
+        await fs.access(path.join(process.cwd(), "public", "og", `${route.slice(1)}.png`));
+        return `https://krakenengine.org/og${route}.png`;
+    } catch {
+        return undefined;
+    }
+}
+
+// routes this page links to most, for PrefetchLinks; a stale list only
+// costs a wasted prefetch, so the content hash is not checked here
+export function getPrefetchRoutes(section: ContentSection, slug: string) {
+    return PAGE_MANIFEST[getRoute(section, slug)]?.prefetch ?? [];
+}
+
+async function getManifestEntry(section: ContentSection, slug: string) {
+    const entry = PAGE_MANIFEST[getRoute(section, slug)];
+    if (!entry) return undefined;
+
+    // hand-written pages can change without the manifest being rebuilt, so
+    // only trust entries that still match the file (hashing is far cheaper
+    // than parsing the MDX again)
+    try {
+        const raw = await readContent(section, slug);
+        const hash = createHash("sha256").update(raw).digest("hex");
+        return hash === entry.hash ? entry : undefined;
+    } catch {
+        return undefined;
+    }
+}
+
 const remarkPlugins = [remarkGfm];
 const rehypePlugins = [
     rehypeCodeRaw,
     rehypeCodeTitles,
     rehypeCodeTitlesWithLogo,
+    rehypePrehighlighted,
     rehypePrism,
     rehypeSlug,
     rehypeAutolinkHeadings,
@@ -128,8 +227,7 @@ export async function getCompiledContentForSlug(
     slug: string
 ) {
     try {
-        const contentPath = getContentPath(section, slug);
-        const rawMdx = await fs.readFile(contentPath, "utf-8");
+        const rawMdx = await readContent(section, slug);
         const result = await parseMdx<BaseMdxFrontmatter>(rawMdx);
 
         return {
@@ -153,8 +251,12 @@ export async function getContentTocs(
     section: ContentSection,
     slug: string
 ) {
-    const contentPath = getContentPath(section, slug);
-    const rawMdx = await fs.readFile(contentPath, "utf-8");
+    const entry = await getManifestEntry(section, slug);
+    if (entry) {
+        return entry.toc.filter((item) => item.level >= 2 && item.level <= 4);
+    }
+
+    const rawMdx = await readContent(section, slug);
     const tocs = await getTocRemote({ raw: rawMdx });
     return tocs
         .filter((item) => item.depth >= 2 && item.depth <= 4)
@@ -190,8 +292,12 @@ export async function getContentFrontmatter(
     slug: string
 ) {
     try {
-        const contentPath = getContentPath(section, slug);
-        const rawMdx = await fs.readFile(contentPath, "utf-8");
+        const entry = await getManifestEntry(section, slug);
+        if (entry) {
+            return { title: entry.title, description: entry.description };
+        }
+
+        const rawMdx = await readContent(section, slug);
         return await getFrontmatterRemote<BaseMdxFrontmatter>({ raw: rawMdx });
     } catch {
         return undefined;
@@ -216,7 +322,7 @@ export async function getAllChilds(
 ) {
     const items = pathString.split("/").filter(Boolean);
     const config = getSectionConfig(section);
-    const { routesTree, baseHref, baseDir } = config;
+    const { routesTree, baseHref } = config;
 
     let routesCursor = routesTree;
     let accumulatedHref = "";
@@ -235,14 +341,16 @@ export async function getAllChilds(
     return await Promise.all(
         routesCursor.map(async (route) => {
             const totalHref = `${accumulatedHref}${route.href}`;
-            const slugSegments = totalHref.split("/").filter(Boolean);
-            const totalPath = path.join(
-                process.cwd(),
-                ...baseDir,
-                ...slugSegments,
-                "index.mdx"
-            );
-            const raw = await fs.readFile(totalPath, "utf-8");
+            const entry = await getManifestEntry(section, totalHref);
+            if (entry) {
+                return {
+                    title: entry.title,
+                    description: entry.description,
+                    href: `${baseHref}${totalHref}`,
+                };
+            }
+
+            const raw = await readContent(section, totalHref);
             return {
                 ...(await getFrontmatterRemote<BaseMdxFrontmatter>({ raw })),
                 href: `${baseHref}${totalHref}`,
@@ -287,3 +395,54 @@ function rehypeCodeTitlesWithLogo() {
         });
     };
 }
+
+// Plain text, or [Prism token class, text]; written by scripts/highlight_code.py
+type HighlightToken = string | [string, string];
+
+const HIGHLIGHTED_BLOCKS = highlightedCode.blocks as Record<string, HighlightToken[]>;
+
+// same key as block_key() in scripts/highlight_code.py
+function highlightKey(lang: string, code: string) {
+    return createHash("sha256").update(`${lang}\0${code}\0`).digest("hex").slice(0, 16);
+}
+
+function rehypePrehighlighted() {
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    return (tree: any) => {
+        visit(tree, "element", (node, _index, parent) => {
+            if (node.tagName !== "code" || parent?.tagName !== "pre") return;
+            const className: string[] = node.properties?.className ?? [];
+            const langClass = className.find((name) => name.startsWith("language-"));
+            if (!langClass) return;
+
+            const lang = langClass.slice("language-".length).toLowerCase();
+            const code = node.children
+                // eslint-disable-next-line @typescript-eslint/no-explicit-any
+                .map((child: any) => (child.type === "text" ? child.value : ""))
+                .join("")
+                .replace(/\n$/, "");
+            const tokens = HIGHLIGHTED_BLOCKS[highlightKey(lang, code)];
+            if (!tokens) return;
+
+            node.children = tokens.map((token) =>
+                typeof token === "string"
+                    ? { type: "text", value: token }
+                    : {
+                          type: "element",
+                          tagName: "span",
+                          properties: { className: ["token", token[0]] },
+                          children: [{ type: "text", value: token[1] }],
+                      }
+            );
+            // Prism only highlights code whose class starts with "language-";
+            // the renamed class still matches the [class*="language-"] styles
+            node.properties.className = className.map((name) =>
+                name === langClass ? `highlighted-${langClass}` : name
+            );
+            const preClass: string[] = parent.properties?.className ?? [];
+            if (!preClass.includes(langClass)) {
+                parent.properties = { ...parent.properties, className: [...preClass, langClass] };
+            }
+        });
+    };
+}
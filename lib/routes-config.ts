@@ -1,181 +1,26 @@
-// for page navigation & to sort on leftbar
+// Full route lists for the server: the sidebar tree from routes-tree.ts with
+// the generated sections filled in.
 
-export type EachRoute = {
-  title: string;
-  href: string;
-  noLink?: true; // noLink will create a route segment (section) but cannot be navigated
-  items?: EachRoute[];
-  tag?: string;
-  separator?: true; // adds a separator after this item
+import { EachRoute, RouteSection, DOC_ROUTE_TREE, GUIDE_ROUTES } from "./routes-tree";
+import { ROUTES as CLASS_ROUTES } from "./routes/classes";
+import { ROUTES as FUNCTION_ROUTES } from "./routes/functions";
+
+export type { EachRoute };
+export { GUIDE_ROUTES };
+
+export const ROUTE_SECTIONS: Record<RouteSection, EachRoute[]> = {
+  classes: CLASS_ROUTES,
+  functions: FUNCTION_ROUTES,
 };
 
-export const DOC_ROUTES: EachRoute[] = [
-  {
-    title: "Preface",
-    href: "/preface",
-    noLink: true,
-    items: [
-      { title: "Navigating the Docs", href: "" },
-      { title: "Building Docs", href: "/building" }
-    ]
-  },
-  {
-    title: "Manual",
-    href: "/manual",
-    noLink: true,
-    items: [
-      { title: "The Input Types", href: "/the-input-types" },
-      { title: "Formats and Codecs", href: "/formats-and-codecs" },
-      { title: "Framework Comparison", href: "/comparison" },
-      { title: "Constants", href: "/constants" },
-      { title: "Event Attributes", href: "/event-attributes" },
-      { title: "Changelog", href: "/changelog" },
-    ],
-  },
-  {
-    title: "Classes",
-    href: "/classes",
-    noLink: true,
-    items: [
-      { title: "Overview", href: "", separator: true },
-      { title: "Anchor", href: "/anchor" },
-      { title: "AnimationController", href: "/animation-controller" },
-      { title: "Audio", href: "/audio" },
-      { title: "Batcher", href: "/batcher" },
-      { title: "Body", href: "/body" },
-      { title: "Camera", href: "/camera" },
-      { title: "Capsule", href: "/capsule" },
-      { title: "CastHit", href: "/cast-hit" },
-      { title: "CharacterBody", href: "/character-body" },
-      { title: "Circle", href: "/circle" },
-      { title: "Collision", href: "/collision" },
-      { title: "Color", href: "/color" },
-      { title: "DistanceJoint", href: "/distance-joint" },
-      { title: "Effect", href: "/effect" },
-      { title: "Event", href: "/event" },
-      { title: "FilterJoint", href: "/filter-joint" },
-      { title: "Flip (Texture)", href: "/texture-flip" },
-      { title: "Font", href: "/font" },
-      { title: "ImageLayer", href: "/image-layer" },
-      { title: "InputAction", href: "/input-action" },
-      { title: "Joint", href: "/joint" },
-      { title: "Layer", href: "/layer" },
-      { title: "Line", href: "/line" },
-      { title: "Map", href: "/map" },
-      { title: "MapObject", href: "/map-object" },
-      { title: "Mask", href: "/mask" },
-      { title: "MotorJoint", href: "/motor-joint" },
-      { title: "MouseJoint", href: "/mouse-joint" },
-      { title: "ObjectGroup", href: "/object-group" },
-      { title: "Orchestrator", href: "/orchestrator" },
-      { title: "PixelArray", href: "/pixel-array" },
-      { title: "PolarCoordinate", href: "/polar-coordinate" },
-      { title: "Polygon", href: "/polygon" },
-      { title: "PrismaticJoint", href: "/prismatic-joint" },
-      { title: "Rect", href: "/rect" },
-      { title: "RevoluteJoint", href: "/revolute-joint" },
-      { title: "RigidBody", href: "/rigid-body" },
-      { title: "Sample", href: "/sample" },
-      { title: "Sampler", href: "/sampler" },
-      { title: "Shader", href: "/shader" },
-      { title: "SheetStrip", href: "/sheet-strip" },
-      { title: "StaticBody", href: "/static-body" },
-      { title: "Stream", href: "/stream" },
-      { title: "Style", href: "/style" },
-      { title: "Terrain (TileSet)", href: "/tile-set-terrain" },
-      { title: "Text", href: "/text" },
-      { title: "TextProperties", href: "/text-properties" },
-      { title: "Texture", href: "/texture" },
-      { title: "Tile (TileLayer)", href: "/tile-layer-tile" },
-      { title: "Tile (TileSet)", href: "/tile-set-tile" },
-      { title: "TileLayer", href: "/tile-layer" },
-      { title: "TileResult (TileLayer)", href: "/tile-layer-tile-result" },
-      { title: "TileSet", href: "/tile-set" },
-      { title: "Timer", href: "/timer" },
-      { title: "Transform", href: "/transform" },
-      { title: "Tween", href: "/tween" },
-      { title: "Vec2", href: "/vec2" },
-      { title: "Vertex", href: "/vertex" },
-      { title: "WeldJoint", href: "/weld-joint" },
-      { title: "WheelJoint", href: "/wheel-joint" },
-      { title: "World", href: "/world" },
-    ],
-  },
-  {
-    title: "Functions",
-    href: "/functions",
-    noLink: true,
-    items: [
-      { title: "Overview", href: "", separator: true },
-      { title: "Camera", href: "/camera" },
-      { title: "Color", href: "/color" },
-      { title: "Draw", href: "/draw" },
-      { title: "Ease", href: "/ease" },
-      { title: "Event", href: "/event" },
-      { title: "Fx", href: "/fx" },
-      { title: "Gamepad", href: "/gamepad" },
-      { title: "Input", href: "/input" },
-      { title: "Log", href: "/log" },
-      { title: "Math", href: "/math" },
-      { title: "Mixer", href: "/mixer" },
-      { title: "Mouse", href: "/mouse" },
-      { title: "Physics", href: "/physics" },
-      { title: "Pixel Array", href: "/pixel-array" },
-      { title: "Renderer", href: "/renderer" },
-      { title: "Shaders", href: "/shaders" },
-      { title: "Time", href: "/time" },
-      { title: "Transform", href: "/transform" },
-      { title: "Ui", href: "/ui" },
-      { title: "Viewport", href: "/viewport" },
-      { title: "Window", href: "/window" },
-    ],
-  },
-];
+function withSections({ section, ...node }: EachRoute): EachRoute {
+  if (!node.items && !section) return node;
+  const items = (node.items ?? []).map(withSections);
+  if (section) items.push(...ROUTE_SECTIONS[section]);
+  return { ...node, items };
+}
 
-export const GUIDE_ROUTES: EachRoute[] = [
-  {
-    title: "Getting Started",
-    href: "/getting-started",
-    noLink: true,
-    items: [
-      { title: "Installation", href: "/installation" },
-      { title: "Creating a Window", href: "/create-window" },
-      { title: "Building an Executable", href: "/build-executable" },
-    ],
-  },
-  {
-    title: "Using The Renderer",
-    href: "/using-the-renderer",
-    noLink: true,
-    items: [
-      { title: "How It Works", href: "/how-it-works" },
-      { title: "Drawing Shapes", href: "/drawing-shapes" },
-      { title: "Rendering Textures", href: "/rendering-textures" },
-    ],
-  },
-  {
-    title: "Implementing Shaders",
-    href: "/implementing-shaders",
-    noLink: true,
-    items: [
-      { title: "What is a Shader?", href: "/what-is-a-shader" },
-      { title: "Using Shaders", href: "/using-shaders" },
-      { title: "Uniforms", href: "/uniforms" },
-      { title: "Texture Samplers", href: "/texture-samplers" },
-    ]
-  },
-  {
-    title: "Game Essentials",
-    href: "/game-essentials",
-    noLink: true,
-    items: [
-      { title: "Vectors for Game Physics", href: "/vector-physics" },
-      { title: "Spritesheet Animation", href: "/spritesheet-animation"},
-      { title: "Fonts and Text", href: "/fonts-and-text" },
-      { title: "Using the Orchestrator", href: "/using-orchestrator" },
-    ]
-  }
-];
+export const DOC_ROUTES: EachRoute[] = DOC_ROUTE_TREE.map(withSections);
 
 type Page = { title: string; href: string };
 
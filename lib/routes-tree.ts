@@ -0,0 +1,121 @@
+// for page navigation & to sort on leftbar
+// Classes, functions, constants and the changelog entry are generated into
+// lib/routes/ (see scripts/route_modules.py); the two large sections are only
+// referenced here by `section`. The docs menu slot (app/docs/@menu) renders
+// the section of the current page on the server; the sidebar loads the others
+// when it opens them.
+
+import { ROUTES as CHANGELOG_ROUTES } from "./routes/changelog";
+import { ROUTES as CONSTANTS_ROUTES } from "./routes/constants";
+
+export type EachRoute = {
+  title: string;
+  href: string;
+  noLink?: true; // noLink will create a route segment (section) but cannot be navigated
+  items?: EachRoute[];
+  tag?: string;
+  separator?: true; // adds a separator after this item
+  section?: RouteSection; // generated items appended after `items`
+};
+
+export type RouteSection = "classes" | "functions";
+
+export const DOC_ROUTE_TREE: EachRoute[] = [
+  {
+    title: "Preface",
+    href: "/preface",
+    noLink: true,
+    items: [
+      { title: "Navigating the Docs", href: "" },
+      { title: "Building Docs", href: "/building" }
+    ]
+  },
+  {
+    title: "Manual",
+    href: "/manual",
+    noLink: true,
+    items: [
+      { title: "The Input Types", href: "/the-input-types" },
+      { title: "Formats and Codecs", href: "/formats-and-codecs" },
+      { title: "Framework Comparison", href: "/comparison" },
+      ...CONSTANTS_ROUTES,
+      { title: "Event Attributes", href: "/event-attributes" },
+      ...CHANGELOG_ROUTES,
+    ],
+  },
+  {
+    title: "Classes",
+    href: "/classes",
+    noLink: true,
+    section: "classes",
+    items: [
+      { title: "Overview", href: "", separator: true },
+    ],
+  },
+  {
+    title: "Functions",
+    href: "/functions",
+    noLink: true,
+    section: "functions",
+    items: [
+      { title: "Overview", href: "", separator: true },
+    ],
+  },
+];
+
+export const GUIDE_ROUTES: EachRoute[] = [
+  {
+    title: "Getting Started",
+    href: "/getting-started",
+    noLink: true,
+    items: [
+      { title: "Installation", href: "/installation" },
+      { title: "Creating a Window", href: "/create-window" },
+      { title: "Building an Executable", href: "/build-executable" },
+    ],
+  },
+  {
+    title: "Using The Renderer",
+    href: "/using-the-renderer",
+    noLink: true,
+    items: [
+      { title: "How It Works", href: "/how-it-works" },
+      { title: "Drawing Shapes", href: "/drawing-shapes" },
+      { title: "Rendering Textures", href: "/rendering-textures" },
+    ],
+  },
+  {
+    title: "Implementing Shaders",
+    href: "/implementing-shaders",
+    noLink: true,
+    items: [
+      { title: "What is a Shader?", href: "/what-is-a-shader" },
+      { title: "Using Shaders", href: "/using-shaders" },
+      { title: "Uniforms", href: "/uniforms" },
+      { title: "Texture Samplers", href: "/texture-samplers" },
+    ]
+  },
+  {
+    title: "Game Essentials",
+    href: "/game-essentials",
+    noLink: true,
+    items: [
+      { title: "Vectors for Game Physics", href: "/vector-physics" },
+      { title: "Spritesheet Animation", href: "/spritesheet-animation"},
+      { title: "Fonts and Text", href: "/fonts-and-text" },
+      { title: "Using the Orchestrator", href: "/using-orchestrator" },
+    ]
+  }
+];
+
+const SECTION_LOADERS: Record<RouteSection, () => Promise<EachRoute[]>> = {
+  classes: () => import("./routes/classes").then((mod) => mod.ROUTES),
+  functions: () => import("./routes/functions").then((mod) => mod.ROUTES),
+};
+
+const loadedSections: Partial<Record<RouteSection, Promise<EachRoute[]>>> = {};
+
+export function loadRouteSection(section: RouteSection): Promise<EachRoute[]> {
+  loadedSections[section] ??= SECTION_LOADERS[section]();
+  return loadedSections[section];
+}
@@ -0,0 +1,6 @@
+// Generated by scripts/sync_changelog.py; do not edit. content-hash: 15fb35beafcf822b
+import type { EachRoute } from "@/lib/routes-tree";
+
+export const ROUTES: EachRoute[] = [
+  { title: "Changelog", href: "/changelog" },
+];
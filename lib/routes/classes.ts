@@ -0,0 +1,66 @@
+// Generated by scripts/generate_api_docs.py; do not edit. content-hash: 3c9ae875f1b695ef
+import type { EachRoute } from "@/lib/routes-tree";
+
+export const ROUTES: EachRoute[] = [
+  { title: "Anchor", href: "/anchor" },
+  { title: "AnimationController", href: "/animation-controller" },
+  { title: "Audio", href: "/audio" },
+  { title: "Batcher", href: "/batcher" },
+  { title: "Body", href: "/body" },
+  { title: "Camera", href: "/camera" },
+  { title: "Capsule", href: "/capsule" },
+  { title: "CastHit", href: "/cast-hit" },
+  { title: "CharacterBody", href: "/character-body" },
+  { title: "Circle", href: "/circle" },
+  { title: "Collision", href: "/collision" },
+  { title: "Color", href: "/color" },
+  { title: "DistanceJoint", href: "/distance-joint" },
+  { title: "Effect", href: "/effect" },
+  { title: "Event", href: "/event" },
+  { title: "FilterJoint", href: "/filter-joint" },
+  { title: "Flip (Texture)", href: "/texture-flip" },
+  { title: "Font", href: "/font" },
+  { title: "ImageLayer", href: "/image-layer" },
+  { title: "InputAction", href: "/input-action" },
+  { title: "Joint", href: "/joint" },
+  { title: "Layer", href: "/layer" },
+  { title: "Line", href: "/line" },
+  { title: "Map", href: "/map" },
+  { title: "MapObject", href: "/map-object" },
+  { title: "Mask", href: "/mask" },
+  { title: "MotorJoint", href: "/motor-joint" },
+  { title: "MouseJoint", href: "/mouse-joint" },
+  { title: "ObjectGroup", href: "/object-group" },
+  { title: "Orchestrator", href: "/orchestrator" },
+  { title: "PixelArray", href: "/pixel-array" },
+  { title: "PolarCoordinate", href: "/polar-coordinate" },
+  { title: "Polygon", href: "/polygon" },
+  { title: "PrismaticJoint", href: "/prismatic-joint" },
+  { title: "Rect", href: "/rect" },
+  { title: "RevoluteJoint", href: "/revolute-joint" },
+  { title: "RigidBody", href: "/rigid-body" },
+  { title: "Sample", href: "/sample" },
+  { title: "Sampler", href: "/sampler" },
+  { title: "Shader", href: "/shader" },
+  { title: "SheetStrip", href: "/sheet-strip" },
+  { title: "StaticBody", href: "/static-body" },
+  { title: "Stream", href: "/stream" },
+  { title: "Style", href: "/style" },
+  { title: "Terrain (TileSet)", href: "/tile-set-terrain" },
+  { title: "Text", href: "/text" },
+  { title: "TextProperties", href: "/text-properties" },
+  { title: "Texture", href: "/texture" },
+  { title: "Tile (TileLayer)", href: "/tile-layer-tile" },
+  { title: "Tile (TileSet)", href: "/tile-set-tile" },
+  { title: "TileLayer", href: "/tile-layer" },
+  { title: "TileResult (TileLayer)", href: "/tile-layer-tile-result" },
+  { title: "TileSet", href: "/tile-set" },
+  { title: "Timer", href: "/timer" },
+  { title: "Transform", href: "/transform" },
+  { title: "Tween", href: "/tween" },
+  { title: "Vec2", href: "/vec2" },
+  { title: "Vertex", href: "/vertex" },
+  { title: "WeldJoint", href: "/weld-joint" },
+  { title: "WheelJoint", href: "/wheel-joint" },
+  { title: "World", href: "/world" },
+];
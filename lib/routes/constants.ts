@@ -0,0 +1,6 @@
+// Generated by scripts/generate_api_docs.py; do not edit. content-hash: 81a7698d6745dc33
+import type { EachRoute } from "@/lib/routes-tree";
+
+export const ROUTES: EachRoute[] = [
+  { title: "Constants", href: "/constants" },
+];
@@ -0,0 +1,26 @@
+// Generated by scripts/generate_api_docs.py; do not edit. content-hash: 97ff5ac43c1cccba
+import type { EachRoute } from "@/lib/routes-tree";
+
+export const ROUTES: EachRoute[] = [
+  { title: "Camera", href: "/camera" },
+  { title: "Color", href: "/color" },
+  { title: "Draw", href: "/draw" },
+  { title: "Ease", href: "/ease" },
+  { title: "Event", href: "/event" },
+  { title: "Fx", href: "/fx" },
+  { title: "Gamepad", href: "/gamepad" },
+  { title: "Input", href: "/input" },
+  { title: "Log", href: "/log" },
+  { title: "Math", href: "/math" },
+  { title: "Mixer", href: "/mixer" },
+  { title: "Mouse", href: "/mouse" },
+  { title: "Physics", href: "/physics" },
+  { title: "Pixel Array", href: "/pixel-array" },
+  { title: "Renderer", href: "/renderer" },
+  { title: "Shaders", href: "/shaders" },
+  { title: "Time", href: "/time" },
+  { title: "Transform", href: "/transform" },
+  { title: "Ui", href: "/ui" },
+  { title: "Viewport", href: "/viewport" },
+  { title: "Window", href: "/window" },
+];
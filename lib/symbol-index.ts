@@ -0,0 +1,90 @@
+// generated by scripts/generate_api_docs.py into public/data/symbols.json
+type SymbolIndexData = {
+  version: number;
+  kinds: string[];
+  pages: string[];
+  // [dotted name, kind index, page index, "#anchor" or ""], sorted by lowercase name
+  symbols: [string, number, number, string][];
+};
+
+export type SymbolHit = {
+  name: string;
+  kind: string;
+  href: string;
+};
+
+// first index whose key is >= prefix
+function lowerBound(keys: string[], prefix: string) {
+  let lo = 0;
+  let hi = keys.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (keys[mid] < prefix) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+export class SymbolIndex {
+  private keys: string[];
+  private leafKeys: string[];
+  private leafRows: number[];
+
+  constructor(private data: SymbolIndexData) {
+    this.keys = data.symbols.map(([name]) => name.toLowerCase());
+
+    // second sorted view on the last segment, so "rotate" finds Vec2.rotate
+    const leaves = this.keys.map((key) => key.slice(key.lastIndexOf(".") + 1));
+    this.leafRows = leaves
+      .map((_, row) => row)
+      .sort((a, b) => (leaves[a] < leaves[b] ? -1 : leaves[a] > leaves[b] ? 1 : a - b));
+    this.leafKeys = this.leafRows.map((row) => leaves[row]);
+  }
+
+  private hit(row: number): SymbolHit {
+    const [name, kind, page, anchor] = this.data.symbols[row];
+    return {
+      name,
+      kind: this.data.kinds[kind],
+      href: `${this.data.pages[page]}${anchor}`,
+    };
+  }
+
+  search(query: string, limit = 20): SymbolHit[] {
+    const prefix = query.trim().toLowerCase();
+    if (!prefix) return [];
+
+    const rows: number[] = [];
+    for (let i = lowerBound(this.keys, prefix); i < this.keys.length && rows.length < limit; i++) {
+      if (!this.keys[i].startsWith(prefix)) break;
+      rows.push(i);
+    }
+
+    if (!prefix.includes(".")) {
+      const seen = new Set(rows);
+      for (let i = lowerBound(this.leafKeys, prefix); i < this.leafKeys.length && rows.length < limit; i++) {
+        if (!this.leafKeys[i].startsWith(prefix)) break;
+        if (!seen.has(this.leafRows[i])) rows.push(this.leafRows[i]);
+      }
+    }
+
+    return rows.map((row) => this.hit(row));
+  }
+}
+
+let loading: Promise<SymbolIndex> | undefined;
+
+export function loadSymbolIndex() {
+  if (!loading) {
+    loading = fetch("/data/symbols.json")
+      .then((res) => {
+        if (!res.ok) throw new Error("Failed to load the symbol index");
+        return res.json();
+      })
+      .then((data: SymbolIndexData) => new SymbolIndex(data));
+    loading.catch(() => {
+      loading = undefined;
+    });
+  }
+  return loading;
+}
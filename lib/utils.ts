@@ -1,6 +1,6 @@
 import { type ClassValue, clsx } from "clsx";
 import { twMerge } from "tailwind-merge";
-import { EachRoute, DOC_ROUTES } from "./routes-config";
+import type { EachRoute } from "./routes-tree";
 
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs));
@@ -41,8 +41,8 @@ export function helperSearch(
   return res;
 }
 
-export function advanceSearch(query: string) {
-  return DOC_ROUTES.map((node) =>
+export function advanceSearch(query: string, routes: EachRoute[]) {
+  return routes.map((node) =>
     helperSearch(query, node, "", 1, query.length == 0 ? 2 : undefined)
   ).flat();
 }
@@ -1,16 +1,32 @@
+// lastmod comes from lib/page-manifest.json (scripts/page_manifest.py and
+// scripts/generate_api_docs.py), which only moves a page's `updated` time
+// when its content hash changes, instead of stamping every page per deploy
+const { pages } = require('./lib/page-manifest.json');
+
 /** @type {import('next-sitemap').IConfig} */
 module.exports = {
   siteUrl: 'https://krakenengine.org',
   generateRobotsTxt: true,
-  additionalPaths: async () => [
-    { loc: '/docs' },
-    { loc: '/docs/manual' },
-    { loc: '/docs/classes' },
-    { loc: '/docs/functions' },
-    { loc: '/guides' },
-    { loc: '/guides/getting-started' },
-    { loc: '/guides/using-the-renderer' },
-    { loc: '/guides/implementing-shaders' },
-    { loc: '/guides/game-essentials' },
-  ],
+  autoLastmod: false,
+  transform: async (config, path) => ({
+    loc: path,
+    changefreq: config.changefreq,
+    priority: config.priority,
+    lastmod: pages[path]?.updated,
+    alternateRefs: config.alternateRefs ?? [],
+  }),
+  additionalPaths: async (config) =>
+    Promise.all(
+      [
+        '/docs',
+        '/docs/manual',
+        '/docs/classes',
+        '/docs/functions',
+        '/guides',
+        '/guides/getting-started',
+        '/guides/using-the-renderer',
+        '/guides/implementing-shaders',
+        '/guides/game-essentials',
+      ].map((path) => config.transform(config, path))
+    ),
 };
@@ -0,0 +1,209 @@
+// Offline cache for the API reference, driven by /precache-manifest.json
+// (written by scripts/precache_manifest.py). Every entry has a revision; a
+// sync downloads only the entries whose revision changed since the last one
+// and drops entries that left the manifest. Cached pages are served first,
+// so repeat visits do not touch the network. The build's scripts and styles
+// a precached page loads are precached with it, so the page also runs
+// offline. With Save-Data on, nothing is precached; pages and chunks are
+// still cached as they are visited.
+
+const PRECACHE = "kraken-docs-precache-v2";
+const RUNTIME = "kraken-docs-runtime-v1";
+const MANIFEST_URL = "/precache-manifest.json";
+const STATE_URL = "/__precache-state";
+const BATCH_SIZE = 6;
+// hashed chunks of earlier builds are never requested again; the oldest
+// entries go first once the runtime cache holds more than this. Chunks of
+// precached pages live in PRECACHE and are not counted.
+const RUNTIME_MAX_ENTRIES = 200;
+// content-hashed build output referenced by a page's HTML
+const STATIC_ASSET_RE = /\/_next\/static\/[^"'\s\\)?]+/g;
+
+// { version, revisions: { url: revision }, assets: { url: [asset url] } }
+// for what is in PRECACHE
+let state = null;
+let syncing = null;
+// set once a request carries `Save-Data: on`
+let saveDataSeen = false;
+
+function saveData() {
+  return saveDataSeen || Boolean(self.navigator.connection && self.navigator.connection.saveData);
+}
+
+async function loadState() {
+  if (!state) {
+    const cached = await caches.match(STATE_URL, { cacheName: PRECACHE });
+    state = cached ? await cached.json() : { version: null, revisions: {}, assets: {} };
+  }
+  return state;
+}
+
+async function saveState(cache) {
+  await cache.put(
+    STATE_URL,
+    new Response(JSON.stringify(state), { headers: { "Content-Type": "application/json" } })
+  );
+}
+
+async function fetchEntry(cache, url, revision) {
+  try {
+    const res = await fetch(url, { cache: "no-cache" });
+    // redirected responses cannot answer navigations
+    if (!res.ok || res.redirected) return;
+    if ((res.headers.get("Content-Type") || "").includes("text/html")) {
+      const html = await res.clone().text();
+      state.assets[url] = [...new Set(html.match(STATIC_ASSET_RE))];
+    } else {
+      delete state.assets[url];
+    }
+    await cache.put(url, res);
+    state.revisions[url] = revision;
+  } catch {
+    // offline or flaky: picked up by the next sync
+  }
+}
+
+// Precache the chunks the cached pages load and drop the ones none of them
+// loads any more. Returns whether every chunk is cached.
+async function syncAssets(cache) {
+  const wanted = new Set(Object.values(state.assets).flat());
+  const cached = new Set();
+  for (const request of await cache.keys()) {
+    const { pathname } = new URL(request.url);
+    if (!pathname.startsWith("/_next/static/")) continue;
+    if (wanted.has(pathname)) cached.add(pathname);
+    else await cache.delete(request);
+  }
+
+  const missing = [...wanted].filter((url) => !cached.has(url));
+  let complete = true;
+  for (let i = 0; i < missing.length; i += BATCH_SIZE) {
+    const results = await Promise.all(
+      missing.slice(i, i + BATCH_SIZE).map(async (url) => {
+        try {
+          const res = await fetch(url);
+          if (!res.ok) return false;
+          await cache.put(url, res);
+          return true;
+        } catch {
+          return false;
+        }
+      })
+    );
+    complete = complete && results.every(Boolean);
+  }
+  return complete;
+}
+
+async function runSync() {
+  let manifest;
+  try {
+    const res = await fetch(MANIFEST_URL, { cache: "no-cache" });
+    if (!res.ok) return;
+    manifest = await res.json();
+  } catch {
+    return;
+  }
+
+  await loadState();
+  if (state.version === manifest.version) return;
+
+  const cache = await caches.open(PRECACHE);
+  const wanted = new Map(manifest.entries);
+  const changed = manifest.entries.filter(([url, revision]) => state.revisions[url] !== revision);
+  for (let i = 0; i < changed.length; i += BATCH_SIZE) {
+    await Promise.all(
+      changed.slice(i, i + BATCH_SIZE).map(([url, revision]) => fetchEntry(cache, url, revision))
+    );
+    await saveState(cache);
+  }
+
+  for (const url of Object.keys(state.revisions)) {
+    if (!wanted.has(url)) {
+      await cache.delete(url);
+      delete state.revisions[url];
+      delete state.assets[url];
+    }
+  }
+  const assetsComplete = await syncAssets(cache);
+  if (assetsComplete && changed.every(([url, revision]) => state.revisions[url] === revision)) {
+    state.version = manifest.version;
+  }
+  await saveState(cache);
+}
+
+function sync() {
+  if (saveData()) return Promise.resolve();
+  if (!syncing) syncing = runSync().finally(() => (syncing = null));
+  return syncing;
+}
+
+async function trimRuntime(cache) {
+  // keys() lists entries in insertion order, so the oldest come first
+  const keys = await cache.keys();
+  await Promise.all(keys.slice(0, Math.max(0, keys.length - RUNTIME_MAX_ENTRIES)).map((key) => cache.delete(key)));
+}
+
+async function cacheFirst(cacheName, request) {
+  const cached = await caches.match(request, { cacheName });
+  if (cached) return cached;
+  const res = await fetch(request);
+  if (res.ok) {
+    const cache = await caches.open(cacheName);
+    await cache.put(request, res.clone());
+    await trimRuntime(cache);
+  }
+  return res;
+}
+
+async function fromPrecache(key, request) {
+  const { revisions } = await loadState();
+  if (revisions[key]) {
+    const cached = await caches.match(key, { cacheName: PRECACHE });
+    if (cached) return cached;
+  }
+  return fetch(request);
+}
+
+self.addEventListener("install", () => self.skipWaiting());
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    (async () => {
+      const names = await caches.keys();
+      await Promise.all(
+        names.filter((name) => name !== PRECACHE && name !== RUNTIME).map((name) => caches.delete(name))
+      );
+      await self.clients.claim();
+      await sync();
+    })()
+  );
+});
+
+// pages post "sync" on load, so a regenerated manifest is picked up without
+// a new worker
+self.addEventListener("message", (event) => {
+  if (event.data === "sync") event.waitUntil(sync());
+});
+
+self.addEventListener("fetch", (event) => {
+  const { request } = event;
+  if (request.method !== "GET") return;
+  const url = new URL(request.url);
+  if (url.origin !== self.location.origin) return;
+  if (request.headers.get("Save-Data") === "on") saveDataSeen = true;
+
+  // content-hashed build output never changes under the same URL
+  if (url.pathname.startsWith("/_next/static/")) {
+    event.respondWith(
+      caches.match(url.pathname, { cacheName: PRECACHE }).then((cached) => cached || cacheFirst(RUNTIME, request))
+    );
+    return;
+  }
+  // RSC payloads (?_rsc=...) and other queries go to the network; offline,
+  // Next falls back to a full navigation, which is answered below
+  if (url.search || url.pathname === MANIFEST_URL) return;
+
+  const key = url.pathname.length > 1 ? url.pathname.replace(/\/$/, "") : url.pathname;
+  event.respondWith(fromPrecache(key, request));
+});
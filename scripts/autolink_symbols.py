@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Link inline-code mentions of API symbols in the guides and changelog.
+
+Usage:
+  python scripts/autolink_symbols.py [PATH ...] [--check] [--jobs N] [--no-cache]
+
+Notes:
+- Symbols and their pages come from public/data/symbols.json, written by
+  `generate_api_docs.py`, so run that first after an engine update.
+- Only whole inline-code spans are linked: `Texture`, `Renderer.draw`,
+  `kn.Vec2.rotate()` become links, prose and fenced code blocks are left
+  alone, as are spans already inside a link, headings, and mentions of the
+  page being edited.
+- Results are cached per file in `.cache/autolink.json`, keyed by the file
+  content and the symbol index, so unchanged files are skipped.
+- With `--check`, files are not rewritten and the exit status is 1 if any
+  file would change.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from build_cache import JsonCache, file_digest, text_digest
+from mdx_index import CONTENT_ROOT, FENCE_RE, HEADING_RE, MD_LINK_RE, route_for, split_frontmatter
+
+# Bump when the linking rules below change.
+AUTOLINK_VERSION = "1"
+
+SYMBOL_INDEX_PATH = Path("public") / "data" / "symbols.json"
+DEFAULT_PATHS = [CONTENT_ROOT / "guides", CONTENT_ROOT / "docs" / "manual" / "changelog"]
+
+CODE_SPAN_RE = re.compile(r"(?<!`)`([^`\n]+)`(?!`)")
+HTML_LINK_RE = re.compile(r"<a\s[^>]*>.*?</a>", re.IGNORECASE)
+# `kn.Texture`, `pykraken.Vec2.rotate()`, `Rect.move(dx, dy)` -> the dotted name
+MENTION_RE = re.compile(r"(?:kn\.|pykraken\.)?([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)(?:\([^()]*\))?")
+
+_LINKS: Dict[str, str] = {}
+
+
+def load_symbol_links(path: Path = SYMBOL_INDEX_PATH) -> Dict[str, str]:
+    """Dotted symbol name -> href, from the generated symbol index."""
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    pages = data["pages"]
+    return {name: f"{pages[page]}{anchor}" for name, _, page, anchor in data["symbols"]}
+
+
+def page_route(path: Path) -> str:
+    """Route of a content file, or "" for files outside contents/."""
+    return route_for(path) if path.is_relative_to(CONTENT_ROOT) else ""
+
+
+def link_line(line: str, links: Dict[str, str], route: str) -> Tuple[str, int]:
+    # Spans inside an existing Markdown or <a> link are left as they are.
+    linked = [m.span() for m in MD_LINK_RE.finditer(line)] + [m.span() for m in HTML_LINK_RE.finditer(line)]
+    out: List[str] = []
+    pos = 0
+    count = 0
+    for match in CODE_SPAN_RE.finditer(line):
+        start, end = match.span()
+        if any(a <= start and end <= b for a, b in linked):
+            continue
+        mention = MENTION_RE.fullmatch(match.group(1).strip())
+        href = links.get(mention.group(1)) if mention else None
+        if href is None or href.partition("#")[0] == route:
+            continue
+        out.append(line[pos:start])
+        out.append(f"[{match.group(0)}]({href})")
+        pos = end
+        count += 1
+    if not count:
+        return line, 0
+    out.append(line[pos:])
+    return "".join(out), count
+
+
+def link_symbols(text: str, links: Dict[str, str], route: str = "") -> Tuple[str, int]:
+    """Link symbol mentions in one MDX document in a single pass over its lines.
+
+    Returns the new text and the number of links added.
+    """
+    _, _, offset = split_frontmatter(text)
+    lines = text.split("\n")
+    fence: Optional[str] = None
+    total = 0
+
+    for idx in range(offset, len(lines)):
+        line = lines[idx]
+        fence_match = FENCE_RE.match(line)
+        if fence:
+            if fence_match and fence_match.group(1)[0] == fence[0] and len(fence_match.group(1)) >= len(fence):
+                fence = None
+            continue
+        if fence_match:
+            fence = fence_match.group(1)
+            continue
+        if "`" not in line or HEADING_RE.match(line):
+            continue
+
+        lines[idx], count = link_line(line, links, route)
+        total += count
+
+    return "\n".join(lines), total
+
+
+def init_worker(links: Dict[str, str]) -> None:
+    global _LINKS
+    _LINKS = links
+
+
+def link_file_text(item: Tuple[str, str]) -> Tuple[str, int]:
+    text, route = item
+    return link_symbols(text, _LINKS, route)
+
+
+def collect_files(paths: List[Path]) -> List[Path]:
+    files: List[Path] = []
+    for path in paths:
+        files.extend(sorted(path.rglob("*.mdx")) if path.is_dir() else [path])
+    return files
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Link API symbol mentions in guides and the changelog.")
+    parser.add_argument("paths", nargs="*", help="Files or directories (default: guides and changelog)")
+    parser.add_argument("--index", default=str(SYMBOL_INDEX_PATH), help="Symbol index written by generate_api_docs.py")
+    parser.add_argument("--check", action="store_true", help="Only report files that would change")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Parallel workers")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the result cache")
+    args = parser.parse_args()
+
+    index_path = Path(args.index)
+    links = load_symbol_links(index_path)
+    if not links:
+        print(f"No symbols found in {index_path}; run generate_api_docs.py first")
+        return 1
+
+    fingerprint = file_digest(index_path)
+    cache = JsonCache("autolink", version=AUTOLINK_VERSION, enabled=not args.no_cache)
+
+    files = collect_files([Path(p) for p in args.paths] or DEFAULT_PATHS)
+    results: Dict[Path, Tuple[str, int]] = {}
+    pending: List[Tuple[Path, str, str]] = []
+    for path in files:
+        text = path.read_text(encoding="utf-8")
+        key = text_digest(fingerprint, text)
+        cached = cache.get(key)
+        if cached is not None:
+            results[path] = (cached[0] if cached[0] is not None else text, cached[1])
+        else:
+            pending.append((path, key, text))
+
+    if pending:
+        items = [(text, page_route(path)) for path, _, text in pending]
+        if args.jobs > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=args.jobs, initializer=init_worker, initargs=(links,)) as pool:
+                linked = list(pool.map(link_file_text, items, chunksize=4))
+        else:
+            init_worker(links)
+            linked = [link_file_text(item) for item in items]
+
+        for (path, key, text), (new_text, count) in zip(pending, linked):
+            # Unchanged files only store the count, not a second copy of the text.
+            cache.set(key, [new_text if new_text != text else None, count])
+            results[path] = (new_text, count)
+    cache.save()
+
+    changed = 0
+    added = 0
+    for path in files:
+        new_text, count = results[path]
+        if not count:
+            continue
+        changed += 1
+        added += count
+        if args.check:
+            print(f"{path}: {count} unlinked symbol mention(s)")
+        else:
+            path.write_text(new_text, encoding="utf-8")
+            print(f"{path}: linked {count} symbol mention(s)")
+
+    print(
+        f"Scanned {len(files)} file(s) ({cache.misses} scanned, {cache.hits} cached): "
+        f"{added} link(s) {'missing' if args.check else 'added'} in {changed} file(s)"
+    )
+    return 1 if args.check and changed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
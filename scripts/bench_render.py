@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark rendering API pages from an already-loaded model.
+
+Usage:
+  python scripts/bench_render.py [--package NAME ...] [--stubs DIR] [--repeat N]
+
+Notes:
+- Loads the model once (as `generate_api_docs.py --serve` does), then renders
+  every class, functions and constants page per round and reports the best
+  round, in total and per page.
+- Each run is timed twice: with the page templates as shipped (PageTemplate,
+  parsed once into a `str.format` pattern) and with the same templates filled
+  by `string.Template.substitute`, which parses the template on every call.
+- Template fills are a small share of a page's render time, so the fills one
+  round makes are also recorded and replayed on their own with both.
+- Nothing is written; pages are rendered into memory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import string
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import generate_api_docs
+from generate_api_docs import ApiModel, PageTemplate, find_stub_root
+
+
+@contextmanager
+def patched_templates(wrap: Callable[[PageTemplate], Callable[..., str]]) -> Iterator[None]:
+    """Replace every module-level PageTemplate with `wrap(template)` for the block."""
+    originals: Dict[str, PageTemplate] = {
+        name: value for name, value in vars(generate_api_docs).items() if isinstance(value, PageTemplate)
+    }
+    try:
+        for name, template in originals.items():
+            setattr(generate_api_docs, name, wrap(template))
+        yield
+    finally:
+        for name, template in originals.items():
+            setattr(generate_api_docs, name, template)
+
+
+def substitute(template: PageTemplate) -> Callable[..., str]:
+    return string.Template(template.source).substitute
+
+
+def page_routes(model: ApiModel) -> List[str]:
+    routes = [f"/docs/classes/{slug}" for slug in model.classes]
+    routes.extend(f"/docs/functions/{slug}" for slug in model.modules)
+    routes.append("/docs/manual/constants")
+    return routes
+
+
+def render_round(model: ApiModel, routes: List[str]) -> float:
+    model.pages = {}
+    model.anchors = {}
+    start = time.perf_counter()
+    for route in routes:
+        model._render(route)
+    return time.perf_counter() - start
+
+
+def record_fills(model: ApiModel, routes: List[str]) -> List[Tuple[PageTemplate, Dict[str, object]]]:
+    """Every template fill one render round makes, with its values."""
+    fills: List[Tuple[PageTemplate, Dict[str, object]]] = []
+
+    def recorder(template: PageTemplate) -> Callable[..., str]:
+        def fill(**values: object) -> str:
+            fills.append((template, values))
+            return template(**values)
+
+        return fill
+
+    with patched_templates(recorder):
+        render_round(model, routes)
+    return fills
+
+
+def replay_fills(fills: List[Tuple[Callable[..., str], Dict[str, object]]]) -> float:
+    start = time.perf_counter()
+    for fill, values in fills:
+        fill(**values)
+    return time.perf_counter() - start
+
+
+def best_of(repeat: int, run: Callable[[], float]) -> float:
+    return min(run() for _ in range(repeat))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time API page rendering from a loaded model.")
+    parser.add_argument("--package", dest="packages", action="append", help="Package to load (default: pykraken)")
+    parser.add_argument("--stubs", help="Read .pyi stubs under this directory instead of importing")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds per variant; the best is reported")
+    args = parser.parse_args()
+
+    packages = args.packages or ["pykraken"]
+    stub_root: Optional[Path] = None
+    if args.stubs:
+        stub_root = find_stub_root(Path(args.stubs), packages)
+        if stub_root is None:
+            parser.error(f"no stubs for {', '.join(packages)} under {args.stubs}")
+
+    model = ApiModel(packages, stub_root=stub_root)
+    routes = page_routes(model)
+    render_round(model, routes)  # warm-up: first-call caches and lazy imports
+
+    compiled = best_of(args.repeat, lambda: render_round(model, routes))
+    with patched_templates(substitute):
+        substituted = best_of(args.repeat, lambda: render_round(model, routes))
+
+    print(f"Rendering {len(routes)} page(s), best of {args.repeat}:")
+    for label, seconds in (("PageTemplate", compiled), ("string.Template", substituted)):
+        print(f"  {label:<16} {seconds * 1000:8.1f} ms  {seconds / len(routes) * 1e6:7.0f} us/page")
+
+    fills = record_fills(model, routes)
+    substitutes = {template: substitute(template) for template, _ in fills}
+    fill_compiled = best_of(args.repeat, lambda: replay_fills(fills))
+    fill_substituted = best_of(args.repeat, lambda: replay_fills([(substitutes[t], v) for t, v in fills]))
+    print(f"Template fills only ({len(fills)} per round):")
+    for label, seconds in (("PageTemplate", fill_compiled), ("string.Template", fill_substituted)):
+        print(f"  {label:<16} {seconds * 1000:8.1f} ms  {seconds / len(routes) * 1e6:7.0f} us/page")
+    print(f"Speedup: {substituted / compiled:.2f}x per page, {fill_substituted / fill_compiled:.2f}x per fill")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
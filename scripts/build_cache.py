@@ -0,0 +1,98 @@
+"""
+Small content-hash cache shared by the docs scripts.
+
+Entries are stored as JSON under `.cache/` (ignored by git) and keyed by a
+hash of whatever inputs produced them, so stale entries are simply never hit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+CACHE_DIR = Path(".cache")
+
+
+def text_digest(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def bytes_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    return bytes_digest(path.read_bytes())
+
+
+def package_fingerprint(package_name: str, search_path: Optional[Path] = None) -> str:
+    """Hash the paths, sizes and mtimes of the package's files.
+
+    The installed package by default; with `search_path`, the package
+    directory under it (e.g. a directory of stubs), without importing it.
+    """
+    if search_path is not None:
+        roots = [search_path / package_name] if (search_path / package_name).is_dir() else []
+    else:
+        spec = importlib.util.find_spec(package_name)
+        roots = list(getattr(spec, "submodule_search_locations", None) or []) if spec else []
+    stats: List[str] = []
+    for root in roots:
+        for path in sorted(Path(root).rglob("*")):
+            if path.is_file() and "__pycache__" not in path.parts:
+                stat = path.stat()
+                stats.append(f"{path}:{stat.st_size}:{stat.st_mtime_ns}")
+    return text_digest(*stats)
+
+
+class JsonCache:
+    """A flat key -> JSON value store persisted to `.cache/<name>.json`.
+
+    `version` should change whenever the shape of cached values changes; a
+    mismatch discards the whole file. Keys not touched by `get`/`set` during a
+    run are dropped on `save`, which keeps the file from growing forever.
+    """
+
+    def __init__(self, name: str, version: str = "1", enabled: bool = True) -> None:
+        self.path = CACHE_DIR / f"{name}.json"
+        self.version = version
+        self.enabled = enabled
+        self._entries: Dict[str, Any] = {}
+        self._used: Dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+        if enabled and self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == version:
+                self._entries = data.get("entries", {})
+
+    def get(self, key: str) -> Optional[Any]:
+        if key in self._entries:
+            self.hits += 1
+            value = self._entries[key]
+            self._used[key] = value
+            return value
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._used[key] = value
+
+    def save(self) -> None:
+        if not self.enabled:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": self.version, "entries": self._used}
+        self.path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Run the docs build steps as one dependency graph, skipping unchanged stages.
+
+Usage:
+  python scripts/build_docs.py [--skip changelog] [--site] [--force] [--jobs N]
+  python scripts/build_docs.py --package pykraken kraken_extras
+  python scripts/build_docs.py --stubs path/to/stubs-or-sdist
+
+Notes:
+- Stages and what they wait for (see `build_stages`):
+    api        generate_api_docs.py   pages, routes, type links, data indexes
+    changelog  sync_changelog.py      after api (symbol links, page manifest)
+    autolink   autolink_symbols.py    after api and changelog
+    manifest   page_manifest.py       after every stage that writes contents/
+    highlight  highlight_code.py      after every stage that writes contents/
+    images     image_assets.py        after every stage that writes contents/
+    og         og_images.py           after manifest
+    precache   precache_manifest.py   after manifest, highlight and images
+    site       `pnpm build`           only with --site, after everything else
+- Each stage has a fingerprint: the stage's command, the content of the
+  scripts it runs (including the local modules they import), the files
+  matched by its input globs, for `api` the installed package (or the
+  stubs given with `--stubs`, passed on to generate_api_docs.py) and the
+  pages it generated, and for `precache` the shell digest
+  precache_manifest.py computes itself. It is
+  taken once the stage's dependencies have finished, so a stage whose
+  dependency ran but rewrote identical files is still skipped.
+- A stage runs when its fingerprint differs from the one recorded after its
+  last successful run in `.cache/build-docs.json`, or when a declared output
+  is missing. `changelog` fetches from GitHub, so it always runs unless
+  skipped (`--skip changelog` for offline builds).
+- Independent stages run concurrently (`--jobs`, default CPU count). Stage
+  output is printed when the stage finishes, or only on failure with
+  `--quiet`. A failed stage stops the stages that depend on it; the exit
+  status is then 1.
+- After a docstring change in the engine, `api` rewrites the affected pages;
+  `manifest`, `highlight`, `images`, `og` and `precache` follow because their
+  inputs changed (`images` finds every image in its cache and encodes
+  nothing), while `autolink` is skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from build_cache import JsonCache, file_digest, package_fingerprint, text_digest
+from precache_manifest import shell_digest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+# Bump when the fingerprint recipe below changes.
+BUILD_CACHE_VERSION = "1"
+
+# Files every rendered page depends on; inputs of the site build. The precache
+# stage uses precache_manifest.py's own shell digest instead, which leaves out
+# generated files each page's hash already covers.
+SHELL_INPUTS = [
+    "app/**/*",
+    "components/**/*",
+    "lib/**/*",
+    "styles/**/*",
+    "package.json",
+    "pnpm-lock.yaml",
+    "next.config.ts",
+]
+
+
+@dataclass
+class Stage:
+    name: str
+    command: List[str]
+    deps: List[str] = field(default_factory=list)
+    inputs: List[str] = field(default_factory=list)
+    outputs: List[str] = field(default_factory=list)
+    # extra fingerprint input computed at run time (e.g. the installed package)
+    extra: Optional[Callable[[], str]] = None
+    # inputs cannot be fingerprinted locally (network); always runs
+    volatile: bool = False
+
+
+@dataclass
+class StageResult:
+    name: str
+    status: str  # ran, skipped, failed, blocked
+    seconds: float = 0.0
+    output: str = ""
+
+
+def python_stage(script: str, *args: str) -> List[str]:
+    return [sys.executable, str(Path("scripts") / script), *args]
+
+
+def stubs_fingerprint(path: Path) -> str:
+    if path.is_file():
+        return file_digest(path)
+    stats = [f"{p}:{p.stat().st_size}:{p.stat().st_mtime_ns}" for p in sorted(path.rglob("*")) if p.is_file()]
+    return text_digest(*stats)
+
+
+def build_stages(packages: List[str], site: bool, stubs: Optional[str] = None) -> List[Stage]:
+    contents = ["contents/**/*.mdx", "contents/**/*.md"]
+    # written by generate_api_docs.py; edited or deleted pages rerun `api`
+    api_pages = [
+        "contents/docs/classes/*/index.mdx",
+        "contents/docs/functions/*/index.mdx",
+        "contents/docs/manual/constants/index.mdx",
+    ]
+    api_args = ["--package", *packages] + (["--stubs", stubs] if stubs else [])
+
+    def api_fingerprint() -> str:
+        if stubs:
+            return stubs_fingerprint(Path(stubs))
+        return text_digest(*(package_fingerprint(name) for name in packages))
+
+    stages = [
+        Stage(
+            "api",
+            python_stage("generate_api_docs.py", *api_args),
+            inputs=["page-budgets.json"] + api_pages,
+            outputs=[
+                "public/data/symbols.json",
+                "lib/type-links.ts",
+                "lib/api-params.json",
+                "lib/routes/classes.ts",
+                "contents/docs/manual/constants/index.mdx",
+            ],
+            extra=api_fingerprint,
+        ),
+        Stage(
+            "changelog",
+            python_stage("sync_changelog.py"),
+            deps=["api"],
+            outputs=["contents/docs/manual/changelog/index.mdx"],
+            volatile=True,
+        ),
+        Stage(
+            "autolink",
+            python_stage("autolink_symbols.py"),
+            deps=["api", "changelog"],
+            inputs=["public/data/symbols.json", "contents/guides/**/*", "contents/docs/manual/changelog/**/*"],
+        ),
+        Stage(
+            "manifest",
+            python_stage("page_manifest.py"),
+            deps=["api", "changelog", "autolink"],
+            inputs=contents + ["lib/type-links.ts", "lib/api-params.json"],
+            outputs=["lib/page-manifest.json"],
+        ),
+        Stage(
+            "highlight",
+            python_stage("highlight_code.py"),
+            deps=["api", "changelog", "autolink"],
+            inputs=contents,
+            outputs=["lib/highlighted-code.json"],
+        ),
+        Stage(
+            "images",
+            python_stage("image_assets.py"),
+            deps=["api", "changelog", "autolink"],
+            inputs=contents + ["public/images/**/*"],
+            outputs=["lib/image-manifest.json"],
+        ),
+        Stage(
+            "og",
+            python_stage("og_images.py"),
+            deps=["manifest"],
+            inputs=["lib/page-manifest.json", "scripts/fonts/*.ttf"],
+        ),
+        Stage(
+            "precache",
+            python_stage("precache_manifest.py"),
+            deps=["manifest", "images", "highlight"],
+            inputs=["lib/page-manifest.json", "lib/image-manifest.json", "public/data/**/*.json", "public/images/**/*"],
+            outputs=["public/precache-manifest.json"],
+            extra=shell_digest,
+        ),
+    ]
+    if site:
+        stages.append(
+            Stage(
+                "site",
+                ["pnpm", "build"],
+                deps=[stage.name for stage in stages],
+                inputs=SHELL_INPUTS + contents + ["public/**/*", "tsconfig.json", "next-sitemap.config.js"],
+            )
+        )
+    return stages
+
+
+def script_sources(script: Path, seen: Optional[Set[Path]] = None) -> Set[Path]:
+    """The script plus the local scripts/ modules it imports, recursively."""
+    seen = set() if seen is None else seen
+    if script in seen or not script.exists():
+        return seen
+    seen.add(script)
+    for node in ast.walk(ast.parse(script.read_text(encoding="utf-8"))):
+        if isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        elif isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        else:
+            continue
+        for name in names:
+            script_sources(SCRIPTS_DIR / f"{name.split('.')[0]}.py", seen)
+    return seen
+
+
+def expand_inputs(patterns: List[str]) -> List[Path]:
+    files: Set[Path] = set()
+    for pattern in patterns:
+        if any(char in pattern for char in "*?["):
+            files.update(path for path in Path(".").glob(pattern) if path.is_file())
+        elif Path(pattern).is_file():
+            files.add(Path(pattern))
+    return sorted(files)
+
+
+def stage_fingerprint(stage: Stage) -> str:
+    parts = [BUILD_CACHE_VERSION, *stage.command]
+    scripts = [Path(arg) for arg in stage.command if arg.endswith(".py")]
+    for script in sorted({source for path in scripts for source in script_sources(path.resolve())}):
+        parts.append(f"{script.name}:{file_digest(script)}")
+    for path in expand_inputs(stage.inputs):
+        parts.append(f"{path.as_posix()}:{file_digest(path)}")
+    if stage.extra:
+        parts.append(stage.extra())
+    return text_digest(*parts)
+
+
+def run_stage(stage: Stage, cache: JsonCache, force: bool) -> Tuple[StageResult, Optional[str]]:
+    """Run one stage unless it is current; returns the fingerprint to record."""
+    started = time.perf_counter()
+    outputs_present = all(Path(path).exists() for path in stage.outputs)
+    if not stage.volatile and not force and outputs_present:
+        if cache.get(stage.name) == stage_fingerprint(stage):
+            return StageResult(stage.name, "skipped", time.perf_counter() - started), None
+
+    try:
+        proc = subprocess.run(stage.command, capture_output=True, text=True)
+        output = proc.stdout + proc.stderr
+        ok = proc.returncode == 0
+    except OSError as exc:
+        output = f"{exc}\n"
+        ok = False
+    if not ok:
+        return StageResult(stage.name, "failed", time.perf_counter() - started, output), None
+    # taken after the run: stages like autolink rewrite their own inputs
+    fingerprint = None if stage.volatile else stage_fingerprint(stage)
+    return StageResult(stage.name, "ran", time.perf_counter() - started, output), fingerprint
+
+
+def run_graph(stages: List[Stage], cache: JsonCache, jobs: int, force: bool, quiet: bool) -> Dict[str, StageResult]:
+    by_name = {stage.name: stage for stage in stages}
+    results: Dict[str, StageResult] = {}
+    running: Dict[Future, Stage] = {}
+
+    def ready(stage: Stage) -> bool:
+        return all(dep in results for dep in stage.deps)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while len(results) < len(stages):
+            for stage in stages:
+                if stage.name in results or stage in running.values() or not ready(stage):
+                    continue
+                failed = [dep for dep in stage.deps if results[dep].status in ("failed", "blocked")]
+                if failed:
+                    results[stage.name] = StageResult(stage.name, "blocked", output=f"needs {', '.join(failed)}")
+                    print(f"[{stage.name}] blocked by {', '.join(failed)}")
+                    continue
+                running[pool.submit(run_stage, stage, cache, force)] = stage
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                result, fingerprint = future.result()
+                results[stage.name] = result
+                if fingerprint:
+                    cache.set(stage.name, fingerprint)
+                print(f"[{stage.name}] {result.status} in {result.seconds:.2f}s")
+                if result.output and (result.status == "failed" or not quiet):
+                    for line in result.output.rstrip("\n").splitlines():
+                        print(f"  {line}")
+    return {name: results[name] for name in by_name}
+
+
+def print_timings(results: Dict[str, StageResult], wall: float) -> None:
+    print(f"{'stage':<10} {'status':<8} {'seconds':>8}")
+    for result in results.values():
+        print(f"{result.name:<10} {result.status:<8} {result.seconds:>8.2f}")
+    counts = {status: sum(1 for r in results.values() if r.status == status) for status in ("ran", "skipped")}
+    print(
+        f"{counts['ran']} ran, {counts['skipped']} skipped in {wall:.2f}s "
+        f"(stage time {sum(r.seconds for r in results.values()):.2f}s)"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the docs as a cached dependency graph of stages.")
+    parser.add_argument(
+        "--package",
+        nargs="+",
+        default=["pykraken"],
+        help="Package name(s) passed to generate_api_docs.py (default: pykraken)",
+    )
+    parser.add_argument("--stubs", help="Read the API from .pyi stubs (passed to generate_api_docs.py)")
+    parser.add_argument("--skip", nargs="+", default=[], metavar="STAGE", help="Stages to leave out")
+    parser.add_argument("--site", action="store_true", help="Also run `pnpm build` once the other stages are done")
+    parser.add_argument("--force", action="store_true", help="Run every stage, ignoring fingerprints")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Stages run at the same time")
+    parser.add_argument("--quiet", action="store_true", help="Only print stage output on failure")
+    args = parser.parse_args()
+
+    stages = build_stages(args.package, args.site, args.stubs)
+    names = {stage.name for stage in stages}
+    unknown = [name for name in args.skip if name not in names]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)} (stages: {', '.join(sorted(names))})")
+    skipped = set(args.skip)
+    # skipped stages count as done; dependents use whatever is on disk
+    stages = [
+        Stage(**{**stage.__dict__, "deps": [dep for dep in stage.deps if dep not in skipped]})
+        for stage in stages
+        if stage.name not in skipped
+    ]
+
+    cache = JsonCache("build-docs", version=BUILD_CACHE_VERSION)
+    for name in names:
+        # keep the fingerprints of stages left out of this run
+        cache.get(name)
+    started = time.perf_counter()
+    try:
+        results = run_graph(stages, cache, args.jobs, args.force, args.quiet)
+    finally:
+        cache.save()
+    print_timings(results, time.perf_counter() - started)
+    return 1 if any(result.status in ("failed", "blocked") for result in results.values()) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Statically check Python snippets in the guides against the PyKraken API.
+
+Usage:
+  python scripts/check_guide_samples.py [--package pykraken] [--jobs N] [--no-cache]
+
+Notes:
+- Requires the `pykraken` package to be installed in the active Python env
+  (the API is read with Griffe, snippets are never executed).
+- Every fenced `py`/`python` block under contents/guides is parsed; `kn.` and
+  `pykraken.` attribute chains (plus names imported from the package) are
+  resolved against the API, and calls to engine functions and classes are
+  checked against their signatures and overloads, including positional-only
+  and keyword-only parameters. Methods called on their class
+  (`kn.Vec2.rotate(v, 90)`) take the instance as the first argument.
+- Results are cached per block in `.cache/guide-samples.json`, keyed by the
+  block source and a fingerprint of the API, so unchanged blocks are skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import os
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from griffe import Class, Function, Module, ParameterKind, load
+
+from build_cache import JsonCache, text_digest
+from generate_api_docs import griffe_function_sig
+from mdx_index import CONTENT_ROOT, iter_code_blocks
+
+# Bump when the checks below change.
+CHECK_VERSION = "3"
+
+PYTHON_LANGS = {"py", "python", "python3"}
+ROOT_ALIASES = ("kn", "pykraken")
+
+POSITIONAL_ONLY = ParameterKind.positional_only.value
+POSITIONAL_OR_KEYWORD = ParameterKind.positional_or_keyword.value
+VAR_POSITIONAL = ParameterKind.var_positional.value
+KEYWORD_ONLY = ParameterKind.keyword_only.value
+VAR_KEYWORD = ParameterKind.var_keyword.value
+
+# A parameter spec is (name, required, kind), kind being a Griffe ParameterKind value.
+ParamSpec = Tuple[str, bool, str]
+# Symbol table entry: (kind, overload param specs or None when unknown).
+Symbol = Tuple[str, Optional[List[List[ParamSpec]]]]
+
+_SYMBOLS: Dict[str, Symbol] = {}
+
+
+def function_specs(func: Function, through_class: bool = False) -> Optional[List[List[ParamSpec]]]:
+    """Parameter specs of `func`, one per overload; None when the signature is unknown.
+
+    With `through_class`, the function is called on its class
+    (`kn.Vec2.rotate(v, 90)`), so an instance method takes the instance as its
+    first positional argument; class and static methods bind or take none.
+    """
+    overloads = getattr(func, "overloads", None) or []
+    specs = [overload_spec(overload, through_class) for overload in overloads or [func]]
+    if not overloads and any(param[0] == "arg0" for param in specs[0]):
+        return None  # an inspected signature without parameter names
+    return specs
+
+
+def overload_spec(func: Function, through_class: bool) -> List[ParamSpec]:
+    labels = getattr(func, "labels", set())
+    takes_instance = through_class and not ({"classmethod", "staticmethod"} & labels)
+    parameters = list(getattr(func, "parameters", []))
+    if parameters:
+        spec = [
+            (
+                param.name,
+                param.default is None and param.kind not in {ParameterKind.var_positional, ParameterKind.var_keyword},
+                param.kind.value,
+            )
+            for param in parameters
+        ]
+        if spec[0][0] in {"self", "cls"} and spec[0][2] != KEYWORD_ONLY:
+            receiver = spec.pop(0)
+            if takes_instance and receiver[0] == "self":
+                spec.insert(0, (receiver[0], True, POSITIONAL_ONLY))
+        return spec
+
+    # Inspected functions without a signature: fall back to the one in the
+    # docstring, which does not record parameter kinds.
+    spec = [("self", True, POSITIONAL_ONLY)] if takes_instance else []
+    for param in griffe_function_sig(func).params:
+        if param.name.startswith("**"):
+            spec.append((param.name[2:], False, VAR_KEYWORD))
+        elif param.name.startswith("*"):
+            spec.append((param.name[1:], False, VAR_POSITIONAL))
+        else:
+            spec.append((param.name, param.default is None, POSITIONAL_OR_KEYWORD))
+    return spec
+
+
+def build_symbol_table(package: Module, package_name: str) -> Dict[str, Symbol]:
+    """Flatten the public API into dotted paths relative to the package root."""
+    symbols: Dict[str, Symbol] = {}
+    visited = set()
+
+    def resolve(obj: object) -> Optional[object]:
+        if getattr(obj, "is_alias", False):
+            try:
+                return obj.final_target
+            except Exception:
+                return None
+        return obj
+
+    def visit(container: Module | Class, prefix: str) -> None:
+        members = getattr(container, "all_members", None) or container.members
+        for name, member in members.items():
+            if name.startswith("_"):
+                continue
+            target = resolve(member)
+            if target is None:
+                continue
+
+            path = f"{prefix}{name}"
+            if path in symbols:
+                continue
+
+            if isinstance(target, Module):
+                # Only descend into real submodules, not modules a stub imports.
+                if str(target.path) != f"{container.path}.{name}":
+                    continue
+                symbols[path] = ("module", None)
+            elif isinstance(target, Class):
+                init = resolve(target.members.get("__init__"))
+                specs = function_specs(init) if isinstance(init, Function) else None
+                symbols[path] = ("class", specs)
+            elif isinstance(target, Function):
+                symbols[path] = ("function", function_specs(target, isinstance(container, Class)))
+                continue
+            else:
+                symbols[path] = ("attribute", None)
+                continue
+
+            key = str(target.path)
+            if key not in visited:
+                visited.add(key)
+                visit(target, f"{path}.")
+
+        # Stubs may declare only `@overload`s without an implementation; Griffe
+        # keeps those off `members`, so pick them up separately.
+        for name, overloads in (getattr(container, "overloads", None) or {}).items():
+            path = f"{prefix}{name}"
+            if name.startswith("_") or path in symbols or not overloads:
+                continue
+            through_class = isinstance(container, Class)
+            symbols[path] = ("function", [overload_spec(func, through_class) for func in overloads])
+
+    visit(package, "")
+    private = package.members.get(f"_{package_name}")
+    if isinstance(private, Module):
+        visit(private, "")
+    return symbols
+
+
+def arity_error(spec: List[ParamSpec], positional: int, keywords: List[str]) -> Optional[str]:
+    by_position = [p for p in spec if p[2] in {POSITIONAL_ONLY, POSITIONAL_OR_KEYWORD}]
+    by_keyword = {p[0] for p in spec if p[2] in {POSITIONAL_OR_KEYWORD, KEYWORD_ONLY}}
+    positional_only = {p[0] for p in spec if p[2] == POSITIONAL_ONLY}
+    has_varargs = any(p[2] == VAR_POSITIONAL for p in spec)
+    has_varkw = any(p[2] == VAR_KEYWORD for p in spec)
+
+    if positional > len(by_position) and not has_varargs:
+        return f"takes at most {len(by_position)} positional argument(s), got {positional}"
+
+    filled = {p[0] for p in by_position[:positional]}
+    for keyword in keywords:
+        if keyword in by_keyword:
+            if keyword in filled:
+                return f"got multiple values for '{keyword}'"
+            filled.add(keyword)
+        elif has_varkw:
+            continue  # collected by **kwargs, even when it names a positional-only parameter
+        elif keyword in positional_only:
+            return f"got positional-only argument '{keyword}' passed as keyword"
+        else:
+            return f"got an unexpected keyword argument '{keyword}'"
+
+    missing = [p[0] for p in spec if p[1] and p[2] not in {VAR_POSITIONAL, VAR_KEYWORD} and p[0] not in filled]
+    if missing:
+        return f"missing required argument(s): {', '.join(missing)}"
+    return None
+
+
+class SampleChecker(ast.NodeVisitor):
+    def __init__(self, symbols: Dict[str, Symbol]) -> None:
+        self.symbols = symbols
+        self.bindings: Dict[str, str] = {alias: "" for alias in ROOT_ALIASES}
+        self.problems: List[Tuple[int, str]] = []
+
+    def chain(self, node: ast.AST) -> Optional[Tuple[str, List[str]]]:
+        attrs: List[str] = []
+        while isinstance(node, ast.Attribute):
+            attrs.append(node.attr)
+            node = node.value
+        if isinstance(node, ast.Name) and node.id in self.bindings:
+            return self.bindings[node.id], list(reversed(attrs))
+        return None
+
+    def resolve(self, node: ast.AST, report: bool) -> Optional[str]:
+        """Resolve an attribute chain to a known symbol path, if it has one."""
+        found = self.chain(node)
+        if found is None:
+            return None
+
+        path, attrs = found
+        for index, attr in enumerate(attrs):
+            kind = self.symbols[path][0] if path else "module"
+            candidate = f"{path}.{attr}" if path else attr
+            if candidate not in self.symbols:
+                if report and kind in {"module", "class"}:
+                    shown = f"kn.{candidate}" if path else f"kn.{attr}"
+                    self.problems.append((node.lineno, f"unknown symbol `{shown}`"))
+                return None
+            path = candidate
+            if self.symbols[path][0] not in {"module", "class"}:
+                return path if index == len(attrs) - 1 else None
+        return path or None
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            if alias.name.split(".")[0] == "pykraken":
+                rest = alias.name.partition(".")[2]
+                if rest and rest not in self.symbols:
+                    self.problems.append((node.lineno, f"unknown symbol `{alias.name}`"))
+                    continue
+                self.bindings[alias.asname or alias.name.split(".")[0]] = rest if alias.asname else ""
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        module = node.module or ""
+        if module.split(".")[0] != "pykraken":
+            return
+        base = module.partition(".")[2]
+        for alias in node.names:
+            path = f"{base}.{alias.name}" if base else alias.name
+            if path not in self.symbols:
+                self.problems.append((node.lineno, f"unknown symbol `{module}.{alias.name}`"))
+                continue
+            self.bindings[alias.asname or alias.name] = path
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        if self.chain(node) is not None:
+            self.resolve(node, report=True)
+            return
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        path = self.resolve(node.func, report=False)
+        if path is None and isinstance(node.func, ast.Name):
+            path = self.bindings.get(node.func.id) or None
+
+        dynamic = any(isinstance(arg, ast.Starred) for arg in node.args) or any(
+            kw.arg is None for kw in node.keywords
+        )
+        if path is not None and not dynamic:
+            kind, specs = self.symbols[path]
+            if specs:
+                keywords = [kw.arg for kw in node.keywords if kw.arg]
+                errors = [arity_error(spec, len(node.args), keywords) for spec in specs]
+                if all(errors):
+                    label = f"kn.{path}"
+                    detail = errors[0] if len(specs) == 1 else "no overload matches the given arguments"
+                    self.problems.append((node.lineno, f"{label}() {detail}"))
+
+        self.generic_visit(node)
+
+
+def prepare_source(code: str) -> str:
+    """Turn REPL transcripts into plain code and dedent the block."""
+    lines = code.splitlines()
+    if any(line.lstrip().startswith(">>>") for line in lines):
+        # Keep line numbers stable by blanking output lines instead of dropping them.
+        lines = [
+            line.lstrip()[4:] if line.lstrip().startswith((">>> ", "... ")) else ""
+            for line in lines
+        ]
+    return textwrap.dedent("\n".join(lines))
+
+
+def parse_block(source: str) -> ast.Module:
+    try:
+        return ast.parse(source)
+    except IndentationError as exc:
+        # Illustrative fragments often end in a header with only a comment
+        # body (`while kn.window.is_open():  # ...`); complete them with `...`.
+        if "expected an indented block" not in exc.msg or not exc.lineno:
+            raise
+        header = source.splitlines()[exc.lineno - 2] if exc.lineno >= 2 else ""
+        indent = len(header) - len(header.lstrip()) + 4
+        return ast.parse(f"{source}\n{' ' * indent}...")
+
+
+def check_block(code: str) -> List[Tuple[int, str]]:
+    try:
+        tree = parse_block(prepare_source(code))
+    except SyntaxError as exc:
+        return [(exc.lineno or 1, f"syntax error: {exc.msg}")]
+
+    checker = SampleChecker(_SYMBOLS)
+    checker.visit(tree)
+    return checker.problems
+
+
+def init_worker(symbols: Dict[str, Symbol]) -> None:
+    global _SYMBOLS
+    _SYMBOLS = symbols
+
+
+def collect_blocks(root: Path) -> List[Tuple[Path, int, str]]:
+    blocks: List[Tuple[Path, int, str]] = []
+    for path in sorted(root.rglob("*.mdx")):
+        for info, code, start in iter_code_blocks(path.read_text(encoding="utf-8")):
+            lang = info.split(":", 1)[0].split(" ", 1)[0].lower()
+            if lang in PYTHON_LANGS:
+                blocks.append((path, start, code))
+    return blocks
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check guide code samples against the PyKraken API.")
+    parser.add_argument("--package", default="pykraken", help="Package name (default: pykraken)")
+    parser.add_argument("--root", default=str(CONTENT_ROOT / "guides"), help="Guides directory")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Parallel check workers")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the result cache")
+    args = parser.parse_args()
+
+    symbols = build_symbol_table(load(args.package), args.package)
+    fingerprint = text_digest(json.dumps(symbols, sort_keys=True))
+    cache = JsonCache("guide-samples", version=CHECK_VERSION, enabled=not args.no_cache)
+
+    blocks = collect_blocks(Path(args.root))
+    results: Dict[int, List[Tuple[int, str]]] = {}
+    pending: List[Tuple[int, str]] = []
+    for idx, (_, _, code) in enumerate(blocks):
+        key = text_digest(fingerprint, code)
+        cached = cache.get(key)
+        if cached is not None:
+            results[idx] = cached
+        else:
+            pending.append((idx, key))
+
+    if pending:
+        codes = [blocks[idx][2] for idx, _ in pending]
+        if args.jobs > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(
+                max_workers=args.jobs, initializer=init_worker, initargs=(symbols,)
+            ) as pool:
+                checked = list(pool.map(check_block, codes, chunksize=4))
+        else:
+            init_worker(symbols)
+            checked = [check_block(code) for code in codes]
+
+        for (idx, key), problems in zip(pending, checked):
+            cache.set(key, problems)
+            results[idx] = problems
+    cache.save()
+
+    total = 0
+    for idx, (path, start, _) in enumerate(blocks):
+        for lineno, message in results[idx]:
+            total += 1
+            print(f"{path}:{start + lineno - 1}: {message}")
+
+    print(
+        f"Checked {len(blocks)} Python block(s) "
+        f"({cache.misses} checked, {cache.hits} cached): {total} problem(s)"
+    )
+    return 1 if total else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
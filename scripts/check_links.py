@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Check internal links and anchors across all docs and guide pages.
+
+Usage:
+  python scripts/check_links.py [--jobs N] [--no-cache]
+
+Notes:
+- Builds one index of every page route and its heading/`<a id>` anchors,
+  then checks every site-internal link (`/docs/...`, `/guides/...`, `#...`,
+  `/images/...`) against it. External URLs are not fetched.
+- Per-file scan results are cached in `.cache/check-links.json` by content
+  hash, so only edited pages are re-scanned on later runs.
+- Exits with status 1 when any dangling link or anchor is found.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import posixpath
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+from build_cache import JsonCache, text_digest
+from mdx_index import CONTENT_ROOT, iter_content_files, route_for, scan_mdx
+
+# Bump when scan_mdx output changes shape or semantics.
+SCAN_VERSION = "1"
+
+# Routes served by app/ rather than by an MDX file.
+STATIC_ROUTES = {"/", "/docs", "/guides", "/showcase"}
+
+SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
+
+
+def scan_file(text: str) -> Dict[str, object]:
+    result = scan_mdx(text)
+    return {
+        "anchors": [h["slug"] for h in result["headings"]] + list(result["anchors"]),
+        "links": result["links"],
+    }
+
+
+def scan_all(paths: List[Path], jobs: int, cache: JsonCache) -> Dict[Path, Dict[str, object]]:
+    results: Dict[Path, Dict[str, object]] = {}
+    pending: List[Tuple[Path, str, str]] = []
+
+    for path in paths:
+        text = path.read_text(encoding="utf-8")
+        key = text_digest(SCAN_VERSION, text)
+        cached = cache.get(key)
+        if cached is not None:
+            results[path] = cached
+        else:
+            pending.append((path, key, text))
+
+    if pending:
+        texts = [text for _, _, text in pending]
+        if jobs > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                scanned = list(pool.map(scan_file, texts, chunksize=8))
+        else:
+            scanned = [scan_file(text) for text in texts]
+
+        for (path, key, _), result in zip(pending, scanned):
+            cache.set(key, result)
+            results[path] = result
+
+    return results
+
+
+def resolve_link(href: str, current_route: str) -> Tuple[str, str]:
+    """Returns (route, fragment) for a site-internal href."""
+    path, _, fragment = href.partition("#")
+    path = path.split("?", 1)[0]
+    if not path:
+        return current_route, fragment
+    if not path.startswith("/"):
+        path = posixpath.normpath(posixpath.join(current_route, path))
+    if len(path) > 1:
+        path = path.rstrip("/")
+    return path, fragment
+
+
+def check_links(
+    scans: Dict[Path, Dict[str, object]], root: Path, public_dir: Path
+) -> List[Tuple[Path, int, str, str]]:
+    anchors_by_route: Dict[str, Set[str]] = {route: set() for route in STATIC_ROUTES}
+    for path, scan in scans.items():
+        anchors_by_route[route_for(path, root)] = set(scan["anchors"])
+
+    problems: List[Tuple[Path, int, str, str]] = []
+    for path, scan in sorted(scans.items()):
+        current_route = route_for(path, root)
+        for href, lineno in scan["links"]:
+            if SCHEME_RE.match(href) or href.startswith("//"):
+                continue
+
+            route, fragment = resolve_link(href, current_route)
+            anchors = anchors_by_route.get(route)
+            if anchors is None:
+                if (public_dir / route.lstrip("/")).is_file():
+                    continue
+                problems.append((path, lineno, href, "no such page or asset"))
+            elif fragment and fragment not in anchors:
+                problems.append((path, lineno, href, f"no anchor '#{fragment}' on {route}"))
+
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check internal links in docs and guides.")
+    parser.add_argument("--root", default=str(CONTENT_ROOT), help="Content directory (default: contents)")
+    parser.add_argument("--public", default="public", help="Static assets directory (default: public)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Parallel scan workers")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the scan cache")
+    args = parser.parse_args()
+
+    root = Path(args.root)
+    paths = iter_content_files(root)
+    cache = JsonCache("check-links", version=SCAN_VERSION, enabled=not args.no_cache)
+
+    scans = scan_all(paths, args.jobs, cache)
+    cache.save()
+
+    problems = check_links(scans, root, Path(args.public))
+    for path, lineno, href, reason in problems:
+        print(f"{path}:{lineno}: {href} ({reason})")
+
+    link_count = sum(len(scan["links"]) for scan in scans.values())
+    print(
+        f"Checked {link_count} link(s) in {len(paths)} file(s) "
+        f"({cache.misses} scanned, {cache.hits} cached): {len(problems)} problem(s)"
+    )
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
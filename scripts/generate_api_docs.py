@@ -4,26 +4,110 @@ Generate MDX API docs for PyKraken with Griffe.
 
 Usage:
   python scripts/generate_api_docs.py
+  python scripts/generate_api_docs.py --serve [--port 8765]
+  python scripts/generate_api_docs.py --package pykraken kraken_extras [--jobs N]
+  python scripts/generate_api_docs.py --stubs path/to/stubs-or-sdist
 
 Notes:
-- Requires the `pykraken` package to be installed in the active Python env.
+- Requires the `pykraken` package to be installed in the active Python env,
+  unless `--stubs` is given: the API is then read from the .pyi stubs in a
+  directory or an sdist/wheel (unpacked to `.cache/stubs/`), and neither the
+  package nor its compiled `_pykraken` extension is imported. Enum member
+  docs come from the stubs' docstrings and comments instead of the runtime
+  objects. Defaults and constant values the stubs elide as `...` stay `...`.
 - Generates/updates:
     contents/docs/classes/<class-slug>/index.mdx
     contents/docs/functions/<module>/index.mdx
+    contents/docs/manual/constants/index.mdx
+    public/data/constants/<enum-slug>.json (members of each enum)
+    public/data/symbols.json(.gz) (go-to-symbol prefix index)
+    public/data/class-hierarchy.json(.gz) (class tree and inherited-member counts)
+    public/data/api.md(.gz), public/data/api.json(.gz) (whole-API digest)
+    lib/page-manifest.json (entries for the pages written here)
+    lib/api-params.json (parameter lists shared by the pages' <ApiSig> tags)
+    lib/routes/{classes,functions,constants}.ts (sidebar sections)
+- Several packages are documented as one API: each is loaded in its own
+  worker process and the results are merged in argument order, so a class
+  defined twice resolves the same way whichever worker finishes first.
+- Written pages are measured as in `page_weight.py`; pages over a budget in
+  page-budgets.json are reported, or fail the run with `--budget fail`.
+- <ApiSig> tags reference their parameter list by `paramsId`; identical
+  lists (shared constructors, overloads) are stored once in lib/api-params.json
+  and resolved by lib/markdown.ts when the page is compiled.
+- With `--serve`, nothing is written: the model stays loaded and pages are
+  rendered on request for the Next dev server (set API_DOCS_SERVER, e.g.
+  `API_DOCS_SERVER=http://127.0.0.1:8765 pnpm dev`). Served pages inline
+  their parameter lists, since the table on disk is not updated.
 """
 
 from __future__ import annotations
 
 import argparse
+import ast
+import gzip
 import importlib
+import io
+import json
+import os
 import re
 import shutil
 import textwrap
+import threading
+import time
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-
-from griffe import Attribute, Class, Function, Module, load
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, TextIO, Tuple
+
+from griffe import Attribute, Class, Extension, Function, Module, load, load_extensions
+
+from build_cache import CACHE_DIR, file_digest, package_fingerprint, text_digest
+from mdx_index import API_SIG_PARAMS_ID_RE, CONTENT_ROOT, iter_content_files, route_for
+from page_manifest import (
+    API_PARAMS_PATH,
+    API_PARAMS_VERSION,
+    MANIFEST_PATH,
+    load_api_params,
+    page_entry,
+    update_manifest_entries,
+)
+from page_weight import Violation, check_budgets, format_violation, load_budgets, measure_page
+from route_modules import ROUTES_DIR, write_route_module
+
+# The site's API pages. The shared files a run writes outside `--out`
+# (parameter table, enum data) keep what these pages use, whatever `--out` is.
+SITE_DOCS_DIR = CONTENT_ROOT / "docs"
+
+# Per-enum member data for the constants page, served as static files.
+CONSTANTS_DATA_DIR = Path("public") / "data" / "constants"
+CONSTANTS_PAGE = Path("manual") / "constants" / "index.mdx"
+ENUM_TABLE_NAME_RE = re.compile(r'<EnumTable name="([^"]*)"')
+
+# Sorted symbol table for the go-to-symbol box (see lib/symbol-index.ts).
+SYMBOL_INDEX_PATH = Path("public") / "data" / "symbols.json"
+SYMBOL_INDEX_VERSION = 1
+SYMBOL_KINDS = ["class", "method", "property", "function", "enum", "member"]
+
+# (dotted name, kind, href)
+Symbol = Tuple[str, str, str]
+
+# One-file digest of the whole API (Markdown and JSON) for tools and offline
+# readers, rewritten only when the package or this script changes.
+API_BUNDLE_MD_PATH = Path("public") / "data" / "api.md"
+API_BUNDLE_JSON_PATH = Path("public") / "data" / "api.json"
+API_BUNDLE_VERSION = 1
+BUNDLE_FINGERPRINT_RE = re.compile(r'"fingerprint":"([0-9a-f]+)"')
+
+# Inheritance tree of the documented classes (see components/ClassTree.tsx).
+CLASS_HIERARCHY_PATH = Path("public") / "data" / "class-hierarchy.json"
+CLASS_HIERARCHY_VERSION = 1
+
+# Parameter lists of the <ApiSig> tags on the written pages, keyed by the
+# `paramsId` the tags carry (see ParamTable); lib/markdown.ts resolves them.
+PARAM_ID_LENGTH = 10
 
 
 @dataclass
@@ -65,6 +149,68 @@ class ModuleInfo:
     name: str
     doc: Optional[str]
     functions: List[FunctionSig] = field(default_factory=list)
+    module_name: Optional[str] = None
+
+
+@dataclass
+class ClassRef:
+    """The part of a class other pages need in order to link to it."""
+
+    name: str
+    module_name: Optional[str] = None
+    is_enum: bool = False
+
+
+class PageWriter:
+    """Streams page lines to `out`, dropping trailing blank lines.
+
+    Equivalent to `"\n".join(lines).rstrip() + "\n"` without holding the
+    lines: blank lines are only written once a non-blank line follows them.
+    """
+
+    def __init__(self, out: TextIO, param_table: Optional[ParamTable] = None) -> None:
+        self.out = out
+        # <ApiSig> parameter lists go here when set, else inline
+        self.param_table = param_table
+        self.pending: List[str] = []
+        self.started = False
+
+    def line(self, text: str = "") -> None:
+        if not text.strip():
+            self.pending.append(text)
+            return
+        for item in self.pending:
+            self._emit(item)
+        self.pending.clear()
+        self._emit(text)
+
+    def lines(self, items: List[str]) -> None:
+        for item in items:
+            self.line(item)
+
+    def close(self) -> None:
+        self.out.write("\n")
+
+    def _emit(self, text: str) -> None:
+        if self.started:
+            self.out.write("\n")
+        self.out.write(text)
+        self.started = True
+
+
+class TeeWriter:
+    """Writes through to a file while keeping the current page's text."""
+
+    def __init__(self, out: TextIO) -> None:
+        self.out = out
+        self.chunks: List[str] = []
+
+    def write(self, text: str) -> None:
+        self.out.write(text)
+        self.chunks.append(text)
+
+    def getvalue(self) -> str:
+        return "".join(self.chunks)
 
 
 def clean_floats(text: str) -> str:
@@ -96,25 +242,91 @@ def escape_attr(value: str) -> str:
     return value.replace("\\", "\\\\").replace('"', '\\"')
 
 
-def params_to_mdx(params: List[Param]) -> str:
-    if not params:
-        return "[]"
-    items: List[str] = []
+def param_items(params: List[Param]) -> List[Dict[str, str]]:
+    """The `params` prop of <ApiSig>, as {name, type?, default?} objects."""
+    items: List[Dict[str, str]] = []
     for p in params:
-        parts = [f'name: "{escape_attr(p.name)}"']
+        item = {"name": p.name}
         if p.type:
-            parts.append(f'type: "{escape_attr(simplify_type(p.type))}"')
+            item["type"] = simplify_type(p.type)
         if p.default is not None:
-            parts.append(f'default: "{escape_attr(simplify_type(p.default))}"')
-        items.append("{ " + ", ".join(parts) + " }")
+            item["default"] = simplify_type(p.default)
+        items.append(item)
+    return items
+
+
+def params_to_mdx(params: List[Param]) -> str:
+    if not params:
+        return "[]"
+    items = [
+        "{ " + ", ".join(f'{key}: "{escape_attr(value)}"' for key, value in item.items()) + " }"
+        for item in param_items(params)
+    ]
     return "[" + ", ".join(items) + "]"
 
 
-def mdx_api_sig(name: str, sig: FunctionSig) -> str:
-    params = params_to_mdx(sig.params) if sig.params else None
+@dataclass
+class ParamTable:
+    """Parameter lists shared by the <ApiSig> tags of the written pages.
+
+    A tag references its list by `paramsId` instead of inlining it, so
+    constructors and overloads with the same parameters (common across
+    classes) are stored and compiled once. The id hashes the inline form.
+    """
+
+    entries: Dict[str, List[Dict[str, str]]] = field(default_factory=dict)
+
+    def intern(self, params: List[Param]) -> str:
+        key = text_digest(params_to_mdx(params))[:PARAM_ID_LENGTH]
+        if key not in self.entries:
+            self.entries[key] = param_items(params)
+        return key
+
+
+def dump_param_table(entries: Mapping[str, List[Dict[str, str]]]) -> str:
+    # One list per line, like the page manifest, so changes show up in diffs.
+    lines = [
+        f"    {json.dumps(key)}: {json.dumps(entries[key], ensure_ascii=False, separators=(',', ':'))}"
+        for key in sorted(entries)
+    ]
+    body = ",\n".join(lines)
+    return f'{{\n  "version": {API_PARAMS_VERSION},\n  "params": {{\n{body}\n  }}\n}}\n'
+
+
+def pages_dirs(out_dir: Path) -> List[Path]:
+    """`out_dir` and, when a run writes elsewhere, the site's own API pages."""
+    if out_dir.resolve() == SITE_DOCS_DIR.resolve():
+        return [out_dir]
+    return [out_dir, SITE_DOCS_DIR]
+
+
+def write_param_table(target: Path, table: ParamTable, dirs: List[Path]) -> bool:
+    """Write the lists interned this run, plus those still referenced by
+    pages under `dirs` that were not rewritten (stale pages kept without
+    --prune, or the site's pages when --out is elsewhere). Returns False
+    when the file is unchanged."""
+    entries = dict(table.entries)
+    previous = load_api_params(target)
+    for pages_dir in dirs:
+        for path in iter_content_files(pages_dir):
+            for key in API_SIG_PARAMS_ID_RE.findall(path.read_text(encoding="utf-8")):
+                if key not in entries and key in previous:
+                    entries[key] = previous[key]
+    content = dump_param_table(entries)
+    if target.exists() and target.read_text(encoding="utf-8") == content:
+        return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(content, encoding="utf-8")
+    return True
+
+
+def mdx_api_sig(name: str, sig: FunctionSig, param_table: Optional[ParamTable] = None) -> str:
+    """One <ApiSig> tag; with `param_table`, the parameters are referenced by id."""
     parts = [f'<ApiSig name="{escape_attr(name)}"']
-    if params is not None and params != "[]":
-        parts.append(f"params={{{params}}}")
+    if sig.params and param_table is not None:
+        parts.append(f'paramsId="{param_table.intern(sig.params)}"')
+    elif sig.params:
+        parts.append(f"params={{{params_to_mdx(sig.params)}}}")
     if sig.returns:
         parts.append(f'returns="{escape_attr(simplify_type(sig.returns))}"')
     return " ".join(parts) + " />"
@@ -289,15 +501,19 @@ def griffe_param_to_info(param: object) -> Optional[Param]:
         return None
 
     kind = str(getattr(param, "kind", ""))
+    variadic = True
     if kind.endswith("variadic positional") or "var positional" in kind:
         name = f"*{name}"
     elif kind.endswith("variadic keyword") or "var keyword" in kind:
         name = f"**{name}"
+    else:
+        variadic = False
 
     return Param(
         name=name,
         type=griffe_expr(getattr(param, "annotation", None)),
-        default=griffe_expr(getattr(param, "default", None), keep_none=True),
+        # static loads give *args/**kwargs an implicit () / {} default
+        default=None if variadic else griffe_expr(getattr(param, "default", None), keep_none=True),
     )
 
 
@@ -340,7 +556,110 @@ def griffe_function_with_overloads(func: Function) -> Optional[FunctionSig]:
     return sig
 
 
-def griffe_class_info(cls: Class, module_name: str) -> ClassInfo:
+def is_native_module(module_name: str, package_name: str) -> bool:
+    """Whether the module is the compiled extension (inspected at runtime)."""
+    return module_name == f"{package_name}._pykraken"
+
+
+def griffe_members(obj: Class | Module, static: bool, native: bool = False) -> List[object]:
+    """Members of a class or module, as a runtime-assisted load lists them.
+
+    Loading only stubs differs from loading them over the inspected extension
+    in two ways, evened out here: functions whose every definition is an
+    `@overload` (usual in .pyi files) are only in `obj.overloads`, and in the
+    `native` module, members keep their source order instead of the inspected,
+    alphabetical one.
+    """
+    members = list(obj.members.values())
+    if not static:
+        return members
+    for name, overloads in obj.overloads.items():
+        if overloads and name not in obj.members:
+            func = Function(name, lineno=overloads[0].lineno, endlineno=overloads[-1].endlineno, parent=obj)
+            func.overloads = overloads
+            members.append(func)
+    if native:
+        # dir() of an Enum hides aliases (a value seen before), so the
+        # inspected load adds them after the others, in source order
+        aliases: List[object] = []
+        if isinstance(obj, Class) and griffe_is_enum(obj):
+            values = set()
+            for member in members:
+                value = str(getattr(member, "value", None) or "") if isinstance(member, Attribute) else ""
+                if value in values:
+                    aliases.append(member)
+                elif value:
+                    values.add(value)
+        alias_ids = {id(member) for member in aliases}
+        return sorted((m for m in members if id(m) not in alias_ids), key=lambda member: member.name) + aliases
+    # overload-only functions back in their source position
+    return sorted(members, key=lambda member: member.lineno or 0)
+
+
+StubSpans = Tuple[List[str], Dict[str, Tuple[int, int]]]
+
+
+def griffe_stub_spans(cls: Class) -> StubSpans:
+    """Lines of the `.pyi` stub defining `cls`, and the line span of each attribute it assigns.
+
+    A stub merged over a `.py` module leaves its members with the module's file
+    path (and, for members in both, the module's line numbers), so the stub
+    is located beside the module and its class body read here.
+    """
+    try:
+        filepath = cls.module.filepath
+        stub = filepath if filepath.suffix == ".pyi" else filepath.with_suffix(".pyi")
+        lines = cls.lines_collection[stub]
+        tree = ast.parse("\n".join(lines))
+    except (AttributeError, KeyError, ValueError, SyntaxError):
+        return [], {}
+
+    body: List[ast.stmt] = tree.body
+    for name in cls.path[len(cls.module.path) + 1 :].split("."):
+        node = next((node for node in body if isinstance(node, ast.ClassDef) and node.name == name), None)
+        if node is None:
+            return [], {}
+        body = node.body
+
+    spans: Dict[str, Tuple[int, int]] = {}
+    for node in body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign):
+            targets = [node.target]
+        else:
+            continue
+        for target in targets:
+            if isinstance(target, ast.Name):
+                spans[target.id] = (node.lineno, node.end_lineno or node.lineno)
+    return lines, spans
+
+
+def griffe_comment_doc(member: Attribute, stub: StubSpans) -> Optional[str]:
+    """Doc of a stub attribute from `#:` lines above it or a trailing comment."""
+    lines, spans = stub
+    if member.name not in spans:
+        return None
+    lineno, endlineno = spans[member.name]
+
+    above: List[str] = []
+    index = lineno - 2
+    while index >= 0 and lines[index].strip().startswith("#:"):
+        above.insert(0, lines[index].strip()[2:].strip())
+        index -= 1
+    if any(above):
+        return "\n".join(above).strip()
+
+    last = lines[endlineno - 1]
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO(last).readline))
+    except (tokenize.TokenError, SyntaxError):
+        return None
+    comment = next((token.string for token in tokens if token.type == tokenize.COMMENT), "")
+    return comment.lstrip("#").strip() or None
+
+
+def griffe_class_info(cls: Class, module_name: str, static: bool = False, native: bool = False) -> ClassInfo:
     full_name = griffe_class_name(cls, module_name)
     is_enum = griffe_is_enum(cls)
     bases = [
@@ -359,7 +678,8 @@ def griffe_class_info(cls: Class, module_name: str) -> ClassInfo:
         bases=bases,
     )
 
-    for member in getattr(cls, "members", {}).values():
+    stub: StubSpans = griffe_stub_spans(cls) if static and is_enum else ([], {})
+    for member in griffe_members(cls, static, native):
         if isinstance(member, Class):
             continue
 
@@ -371,6 +691,9 @@ def griffe_class_info(cls: Class, module_name: str) -> ClassInfo:
             is_class_attribute = "class-attribute" in labels
             if is_enum or is_property or is_class_attribute:
                 prop_doc = griffe_doc(member)
+                if static and is_enum and not prop_doc:
+                    # what enrich_enum_member_docs would read from the extension
+                    prop_doc = griffe_comment_doc(member, stub)
                 if (
                     is_class_attribute
                     and not is_enum
@@ -410,8 +733,11 @@ def griffe_class_info(cls: Class, module_name: str) -> ClassInfo:
     return info
 
 
-def class_preference(info: ClassInfo, package_name: str) -> Tuple[int, int]:
-    module_name = info.module_name or ""
+def class_preference(info: ClassInfo | ClassRef, package_name: str) -> Tuple[int, int]:
+    return module_preference(info.module_name or "", package_name)
+
+
+def module_preference(module_name: str, package_name: str) -> Tuple[int, int]:
     if module_name == package_name:
         return (3, len(module_name))
     if f"{package_name}._pykraken" not in module_name:
@@ -419,92 +745,339 @@ def class_preference(info: ClassInfo, package_name: str) -> Tuple[int, int]:
     return (1, len(module_name))
 
 
-def collect_griffe_classes(module: Module, package_name: str) -> Dict[str, ClassInfo]:
-    classes: Dict[str, ClassInfo] = {}
+class ApiCollector(Extension):
+    """Griffe extension that converts classes and modules while the package loads.
 
-    def visit(container: Module | Class, module_name: str) -> None:
-        for member in getattr(container, "members", {}).values():
-            if isinstance(member, Module):
-                visit(member, str(member.path))
-                continue
+    Griffe fires these load events once per object of the final (stub-merged)
+    tree, depth first in member order, so no second walk is needed. A class
+    is only converted when its module beats the copy seen so far under the
+    same name (`module_preference`), e.g. a package-level re-export over the
+    `_pykraken` original. With `static`, the tree comes from stubs alone (see
+    `griffe_members`).
+    """
 
-            if not isinstance(member, Class):
-                continue
+    def __init__(self, package_name: str, static: bool = False) -> None:
+        super().__init__()
+        self.package_name = package_name
+        self.static = static
+        self.classes: Dict[str, ClassInfo] = {}
+        self.modules: Dict[str, ModuleInfo] = {}
+
+    def on_class(self, *, cls: Class, **kwargs: object) -> None:
+        owner: object = cls
+        while isinstance(owner, Class):
+            if owner.name.startswith("_") or owner.name.endswith("List"):
+                return
+            owner = owner.parent
+
+        module_name = str(cls.module.path)
+        name = griffe_class_name(cls, module_name)
+        current = self.classes.get(name)
+        if current is not None and module_preference(module_name, self.package_name) <= class_preference(
+            current, self.package_name
+        ):
+            return
+        self.classes[name] = griffe_class_info(
+            cls, module_name, self.static, is_native_module(module_name, self.package_name)
+        )
 
-            if member.name.startswith("_") or member.name.endswith("List"):
-                continue
+    def on_module(self, *, mod: Module, **kwargs: object) -> None:
+        # Only direct submodules of the package get a functions page.
+        parent = mod.parent
+        if parent is None or parent.parent is not None:
+            return
+        short_name = mod.name
+        if short_name in {self.package_name, "_pykraken", "cli"} or short_name.startswith("_"):
+            return
 
-            info = griffe_class_info(member, module_name)
-            current = classes.get(info.name)
-            if current is None or class_preference(info, package_name) > class_preference(current, package_name):
-                classes[info.name] = info
+        functions: List[FunctionSig] = []
+        for child in griffe_members(mod, self.static, is_native_module(str(mod.path), self.package_name)):
+            if isinstance(child, Function) and not child.name.startswith("_"):
+                sig = griffe_function_with_overloads(child)
+                if sig is not None:
+                    functions.append(sig)
+        if functions:
+            self.modules[str(mod.path)] = ModuleInfo(
+                name=short_name, doc=griffe_doc(mod), functions=functions, module_name=str(mod.path)
+            )
 
-            visit(member, module_name)
 
-    visit(module, str(module.path))
-    return classes
+def load_api_model(package_name: str, stub_root: Optional[Path] = None) -> ApiCollector:
+    """Load the package with `ApiCollector`; the Griffe tree is dropped on return.
 
+    With `stub_root`, only that directory is searched and nothing is imported
+    or inspected, so the compiled extension is never loaded.
+    """
+    collector = ApiCollector(package_name, static=stub_root is not None)
+    if stub_root is None:
+        load(package_name, extensions=load_extensions(collector))
+    else:
+        load(
+            package_name,
+            extensions=load_extensions(collector),
+            search_paths=[stub_root],
+            allow_inspection=False,
+        )
+    return collector
 
-def collect_griffe_modules(module: Module, package_name: str) -> Dict[str, ModuleInfo]:
-    modules: Dict[str, ModuleInfo] = {}
 
-    for member in getattr(module, "members", {}).values():
-        if not isinstance(member, Module):
-            continue
-        module_name = str(member.path)
-        short_name = member.name
-        if short_name in {package_name, "_pykraken", "cli"} or short_name.startswith("_"):
-            continue
+def find_stub_root(source: Path, package_names: List[str]) -> Optional[Path]:
+    """The directory holding the packages' stubs, or None.
 
-        functions: List[FunctionSig] = []
-        for child in getattr(member, "members", {}).values():
-            if isinstance(child, Function) and not child.name.startswith("_"):
-                sig = griffe_function_with_overloads(child)
-                if sig is not None:
-                    functions.append(sig)
+    `source` is a directory containing the package directories, a package
+    directory itself, or an sdist/wheel, unpacked once to `.cache/stubs/`.
+    """
+    if source.is_file():
+        target = CACHE_DIR / "stubs" / file_digest(source)[:16]
+        if not target.exists():
+            partial_dir = target.with_name(f"{target.name}.partial")
+            shutil.rmtree(partial_dir, ignore_errors=True)
+            shutil.unpack_archive(str(source), partial_dir, format="zip" if source.suffix == ".whl" else None)
+            partial_dir.rename(target)
+        source = target
+    if not source.is_dir():
+        return None
 
-        if functions:
-            modules[module_name] = ModuleInfo(name=short_name, doc=griffe_doc(member), functions=functions)
+    def has_packages(root: Path) -> bool:
+        return all((root / name).is_dir() for name in package_names)
 
-    return modules
+    for root in (source, source.parent):
+        if has_packages(root):
+            return root
+    # sdist layouts: <name>-<version>/<package>, .../src/<package>
+    for init in sorted(source.rglob("__init__.py*"), key=lambda path: len(path.parts)):
+        if init.parent.name == package_names[0] and has_packages(init.parent.parent):
+            return init.parent.parent
+    return None
 
 
-def escape_html(text: str) -> str:
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace("{", "&#123;")
-        .replace("}", "&#125;")
-        .replace("|", "&#124;")
-    )
+@dataclass
+class ApiSlice:
+    """One package's converted classes and modules, as returned by a worker."""
 
+    package_name: str
+    classes: Dict[str, ClassInfo] = field(default_factory=dict)
+    modules: Dict[str, ModuleInfo] = field(default_factory=dict)
 
-def escape_outside_code(text: str) -> str:
-    """Escapes HTML special characters outside of code blocks."""
-    # Pattern matches backtick sequences and content: (`+)(.*?)(\1)
-    pattern = re.compile(r"(`+)(.*?)(\1)", re.DOTALL)
 
-    last_pos = 0
-    out = []
+def extract_package(package_name: str, stub_root: Optional[Path] = None) -> ApiSlice:
+    api = load_api_model(package_name, stub_root)
+    return ApiSlice(package_name, api.classes, api.modules)
+
+
+def extract_packages(package_names: List[str], jobs: int, stub_root: Optional[Path] = None) -> List[ApiSlice]:
+    """Load each package in its own worker process; slices come back in argument order."""
+    extract = partial(extract_package, stub_root=stub_root)
+    if jobs > 1 and len(package_names) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(package_names))) as pool:
+            return list(pool.map(extract, package_names))
+    return [extract(name) for name in package_names]
+
+
+def merge_api_slices(slices: List[ApiSlice]) -> ApiSlice:
+    """Merge per-package slices into one model.
+
+    A class name defined by several packages goes to the copy with the best
+    `class_preference` within its own package; ties keep the earlier package.
+    Functions pages are keyed by the short module name, so a later module
+    with a name already taken is skipped.
+    """
+    merged = ApiSlice(", ".join(part.package_name for part in slices))
+    owners: Dict[str, str] = {}
+    page_names = set()
+    for part in slices:
+        for name, info in part.classes.items():
+            current = merged.classes.get(name)
+            if current is not None and class_preference(info, part.package_name) <= class_preference(
+                current, owners[name]
+            ):
+                continue
+            merged.classes[name] = info
+            owners[name] = part.package_name
+        for path, mod in part.modules.items():
+            if mod.name in page_names:
+                print(f"Skipping {path}: another package already has a '{mod.name}' functions page")
+                continue
+            page_names.add(mod.name)
+            merged.modules[path] = mod
+    return merged
+
+
+def owning_package(module_name: Optional[str], package_names: List[str]) -> str:
+    top = (module_name or "").split(".", 1)[0]
+    return top if top in package_names else package_names[0]
+
+
+def class_ref(info: ClassInfo) -> ClassRef:
+    return ClassRef(name=info.name, module_name=info.module_name, is_enum=info.is_enum)
+
+
+class ClassHierarchy:
+    """Inheritance graph of the documented classes, built once per run.
+
+    Only names are kept: each class's resolved bases and its own members'
+    names and kinds, so the converted classes can be released as their pages
+    are written. Base names are resolved once and MROs are memoized, so
+    listing a page's inherited members is one pass over its ancestors' own
+    members however deep the tree is.
+    """
+
+    def __init__(self, classes: Mapping[str, ClassInfo]) -> None:
+        by_leaf: Dict[str, List[str]] = {}
+        for name in classes:
+            by_leaf.setdefault(name.split(".")[-1], []).append(name)
+
+        self.bases: Dict[str, List[str]] = {}
+        self.subclasses: Dict[str, List[str]] = {name: [] for name in classes}
+        for name, info in classes.items():
+            resolved: List[str] = []
+            for base in info.bases:
+                candidates = [base] if base in classes else by_leaf.get(base.split(".")[-1], [])
+                if len(candidates) == 1 and candidates[0] != name and candidates[0] not in resolved:
+                    resolved.append(candidates[0])
+            self.bases[name] = resolved
+            for base in resolved:
+                self.subclasses[base].append(name)
+
+        # member name -> "property" or "method", for the members each class defines
+        self._own: Dict[str, Dict[str, str]] = {}
+        for name, info in classes.items():
+            members = {prop.name: "property" for prop in info.properties}
+            members.update((method.name, "method") for method in info.methods)
+            self._own[name] = members
+        self._mro: Dict[str, List[str]] = {}
+
+    def mro(self, name: str) -> List[str]:
+        """C3 linearization over documented classes (`name` first)."""
+        if name in self._mro:
+            return self._mro[name]
+        self._mro[name] = [name]  # guards against cycles while resolving
+        if len(self.bases[name]) == 1:
+            self._mro[name] = [name] + self.mro(self.bases[name][0])
+            return self._mro[name]
+        sequences = [list(self.mro(base)) for base in self.bases[name]] + [list(self.bases[name])]
+        result = [name]
+        while any(sequences):
+            for seq in sequences:
+                head = seq[0] if seq else None
+                if head is not None and not any(head in other[1:] for other in sequences):
+                    break
+            else:
+                # inconsistent order; fall back to depth-first, first seen wins
+                head = next((item for seq in sequences for item in seq if item not in result), None)
+                if head is None:
+                    raise ValueError(f"cannot linearize the bases of {name}: {', '.join(self.bases[name])}")
+            result.append(head)
+            sequences = [[item for item in seq if item != head] for seq in sequences]
+        self._mro[name] = result
+        return result
+
+    def ancestors_first(self, names: Iterable[str]) -> List[str]:
+        """`names` reordered so every class comes after its documented ancestors."""
+        order: List[str] = []
+        seen = set()
+        for name in names:
+            for ancestor in reversed(self.mro(name)):
+                if ancestor not in seen:
+                    seen.add(ancestor)
+                    order.append(ancestor)
+        return order
+
+    def own_members(self, name: str) -> Dict[str, str]:
+        """Member name -> "property" or "method" for the members `name` defines."""
+        return self._own[name]
+
+    def inherited(self, name: str) -> List[Tuple[str, List[Tuple[str, str]]]]:
+        """(ancestor, [(member, kind)]) in MRO order, skipping overridden members."""
+        seen = set(self.own_members(name))
+        groups: List[Tuple[str, List[Tuple[str, str]]]] = []
+        for ancestor in self.mro(name)[1:]:
+            members = [(member, kind) for member, kind in self.own_members(ancestor).items() if member not in seen]
+            seen.update(member for member, _ in members)
+            if members:
+                groups.append((ancestor, members))
+        return groups
+
+    def to_json(self) -> Dict[str, object]:
+        classes: Dict[str, object] = {}
+        for name in sorted(self.bases):
+            classes[name] = {
+                "title": class_title(name),
+                "href": f"/docs/classes/{camel_to_kebab(name)}",
+                "bases": self.bases[name],
+                "subclasses": sorted(self.subclasses[name]),
+                "members": len(self.own_members(name)),
+                "inherited": sum(len(members) for _, members in self.inherited(name)),
+            }
+        return {
+            "version": CLASS_HIERARCHY_VERSION,
+            "roots": sorted(name for name in self.bases if not self.bases[name]),
+            "classes": classes,
+        }
+
+
+def write_class_hierarchy(target: Path, hierarchy: ClassHierarchy) -> bool:
+    return write_precompressed(target, json.dumps(hierarchy.to_json(), ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+HTML_ESCAPES = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        "{": "&#123;",
+        "}": "&#125;",
+        "|": "&#124;",
+    }
+)
+
+BACKTICK_RUN_RE = re.compile(r"`+")
+
+
+def escape_html(text: str) -> str:
+    return text.translate(HTML_ESCAPES)
 
-    for match in pattern.finditer(text):
-        # Text before code -> escape
-        pre_text = text[last_pos:match.start()]
-        out.append(escape_html(pre_text))
 
-        # Code segment -> keep as is
-        out.append(match.group(0))
+@lru_cache(maxsize=4096)
+def escape_outside_code(text: str) -> str:
+    """Escapes HTML/MDX special characters outside of inline code spans.
 
-        last_pos = match.end()
+    Code spans follow CommonMark: a run of N backticks is closed by the next
+    run of exactly N backticks, and a run with no partner is literal text.
+    Each run is paired with the next one of equal length in a single backwards
+    pass, so the scan stays linear even for unbalanced input.
+    """
+    runs = [(match.start(), match.end()) for match in BACKTICK_RUN_RE.finditer(text)]
+    if not runs:
+        return text.translate(HTML_ESCAPES)
+
+    next_same: List[Optional[int]] = [None] * len(runs)
+    last_by_length: Dict[int, int] = {}
+    for idx in range(len(runs) - 1, -1, -1):
+        length = runs[idx][1] - runs[idx][0]
+        next_same[idx] = last_by_length.get(length)
+        last_by_length[length] = idx
+
+    out: List[str] = []
+    last_pos = 0
+    idx = 0
+    while idx < len(runs):
+        closer = next_same[idx]
+        if closer is None:
+            idx += 1
+            continue
 
-    # Remaining text -> escape
-    out.append(escape_html(text[last_pos:]))
+        start, end = runs[idx][0], runs[closer][1]
+        out.append(text[last_pos:start].translate(HTML_ESCAPES))
+        out.append(text[start:end])
+        last_pos = end
+        idx = closer + 1
 
+    out.append(text[last_pos:].translate(HTML_ESCAPES))
     return "".join(out)
 
 
-def format_type_for_table(type_str: str, linkable_classes: Dict[str, ClassInfo]) -> str:
+def format_type_for_table(type_str: str, linkable_classes: Mapping[str, ClassRef]) -> str:
     # Strip private module prefixes used in stubs
     type_str = type_str.replace("pykraken.", "")
     type_str = shorten_external_qualified_names(type_str)
@@ -531,31 +1104,6 @@ def format_type_for_table(type_str: str, linkable_classes: Dict[str, ClassInfo])
     return "".join(out)
 
 
-def get_qualified_name(
-    name: str, current_module: str, classes_map: Dict[str, ClassInfo], package_name: str
-) -> str:
-    # Basic qualified check if needed again, mostly for sigs
-    if name not in classes_map:
-        return name
-    info = classes_map[name]
-    if not info.module_name or info.module_name == current_module:
-        return name
-    # We stripped submodule prefixes earlier, but preserving linking logic requires knowing
-    # if it's external.
-    # For now we are not prepending "module." per user request, but we need linking.
-    return name
-
-
-def format_type_for_sig(
-    type_str: str, current_module: str, classes_map: Dict[str, ClassInfo], package_name: str
-) -> str:
-    # Just need basic linking?
-    # Actually the user asked to undo "showing which submodule an object comes from".
-    # But previous code had `format_type_for_sig`.
-    # Let's restore `process_sig` logic.
-    return type_str
-
-
 def simplify_type(type_str: Optional[str]) -> str:
     """Shorten long annotation strings (especially Annotated[NDArray[..., dict(...)]]).
 
@@ -706,13 +1254,143 @@ def format_docstring(doc: Optional[str]) -> str:
     return "\n".join(out_lines).strip()
 
 
-def render_class_page(
-    info: ClassInfo, package_name: str, linkable_classes: Dict[str, ClassInfo]
-) -> str:
-    title = info.name
-    if "." in title:
-        parts = title.split(".")
-        title = f"{parts[-1]} ({parts[0]})"
+TEMPLATE_FIELD_RE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+class PageTemplate:
+    """A `${field}` template parsed once into a `str.format` pattern.
+
+    Literal braces are escaped and each `${field}` becomes `{field}` up front,
+    so filling the template is a single C-level format call with no parsing
+    in Python; `string.Template.substitute` re-runs its regex on every call.
+    """
+
+    __slots__ = ("source", "pattern")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        pieces = TEMPLATE_FIELD_RE.split(source)
+        # split() alternates literal text and field names
+        self.pattern = "".join(
+            "{" + piece + "}" if index % 2 else piece.replace("{", "{{").replace("}", "}}")
+            for index, piece in enumerate(pieces)
+        )
+
+    def __call__(self, **values: object) -> str:
+        return self.pattern.format(**values)
+
+
+FRONTMATTER = PageTemplate("---\ntitle: ${title}\ndescription: ${description}\n---")
+
+EXPERIMENTAL_NOTE = PageTemplate(
+    '<Note type="warning" title="Experimental API">\n'
+    "  The ${module} submodule is an experimental and new API that is highly susceptible to breaking changes in the future.\n"
+    "</Note>"
+)
+
+CONSTRUCTOR_CARD = PageTemplate('## Constructor\n<div className="api-card">\n\n${sigs}${summary}\n</div>')
+
+API_CARD = PageTemplate('<div className="api-card">\n${body}\n\n</div>')
+
+PROPERTIES_HEADER = PageTemplate(
+    "## Properties\n<hr style={{marginBottom: 0}} />\n\n| Name | Description | Type |\n| --- | --- | --- |"
+)
+
+PROPERTY_ROW = PageTemplate("| `${name}` | ${desc} | <code>${type}</code> |")
+
+INHERITED_HEADER = PageTemplate("## Inherited from ${title}\n---")
+
+INHERITED_GROUP = PageTemplate("**${label}:** ${links}")
+
+ENUM_HEADER = PageTemplate('<a id="${anchor}"></a>\n## ${title}')
+
+ENUM_TABLE = PageTemplate('<EnumTable name="${slug}" type="${type}" count={${count}} />')
+
+OVERLOAD_SEPARATOR = "\n\n---\n\n"
+
+
+def write_page_header(page: PageWriter, title: str, description: str, module_path: str) -> None:
+    page.line(FRONTMATTER(title=title, description=description))
+    page.line("")
+
+    # Add disclaimer
+    parts = set(module_path.split(".")) if module_path else set()
+    if mod := next((p for p in ["physics", "ui"] if p in parts), None):
+        page.line(EXPERIMENTAL_NOTE(module=mod))
+        page.line("")
+
+
+def write_function_card(page: PageWriter, heading: str, func: FunctionSig, processed: FunctionSig) -> None:
+    """Write one function/method section, with one card for all its overloads.
+
+    Overloads with more than one distinct docstring get a card section per
+    overload; otherwise all signatures share the function's docstring.
+    """
+    page.line(f"{heading} {snake_to_title(func.name)}")
+
+    overloads = getattr(processed, "overloads", None)
+    has_multi_docs = overloads and sum(1 for s in overloads if s.doc) > 1
+
+    if has_multi_docs and overloads:
+        sections = [
+            mdx_api_sig(func.name, sig, page.param_table)
+            + (f"\n\n{format_docstring(sig.doc)}" if sig.doc else "")
+            for sig in overloads
+        ]
+        body = OVERLOAD_SEPARATOR.join(sections)
+    else:
+        body = "\n".join(mdx_api_sig(func.name, sig, page.param_table) for sig in (overloads or [processed]))
+        if func.doc:
+            body += f"\n\n{format_docstring(func.doc)}"
+
+    page.line(API_CARD(body=body))
+    page.line("")
+
+
+def class_title(name: str) -> str:
+    """Page title for a class, e.g. "Flip (Texture)" for a nested class."""
+    if "." in name:
+        parts = name.split(".")
+        return f"{parts[-1]} ({parts[0]})"
+    return name
+
+
+def write_inherited_sections(
+    page: PageWriter, info: ClassInfo, hierarchy: ClassHierarchy, anchors: Mapping[str, Mapping[str, str]]
+) -> None:
+    """One section per ancestor, linking the members this class inherits from it.
+
+    `anchors` maps each ancestor to its `member_anchors`, so the links use the
+    slugs its page actually got.
+    """
+    for ancestor, members in hierarchy.inherited(info.name):
+        href = f"/docs/classes/{camel_to_kebab(ancestor)}"
+        groups = []
+        for label, kind in (("Properties", "property"), ("Methods", "method")):
+            links = [
+                f"[`{member}`]({href}{anchors[ancestor][member]})"
+                for member, member_kind in members
+                if member_kind == kind
+            ]
+            if links:
+                groups.append(INHERITED_GROUP(label=label, links=", ".join(links)))
+        page.line("")
+        page.line(INHERITED_HEADER(title=class_title(ancestor)))
+        page.line("")
+        page.line("\n\n".join(groups))
+
+
+def write_class_page(
+    out: TextIO,
+    info: ClassInfo,
+    package_name: str,
+    linkable_classes: Mapping[str, ClassRef],
+    hierarchy: Optional[ClassHierarchy] = None,
+    param_table: Optional[ParamTable] = None,
+    anchors: Optional[Mapping[str, Mapping[str, str]]] = None,
+) -> None:
+    """Write a class page; inherited sections need `hierarchy` and the ancestors' `anchors`."""
+    title = class_title(info.name)
 
     description = summary_from_doc(info.doc, f"API reference for {info.name}.")
     current_module = info.module_name or ""
@@ -728,22 +1406,8 @@ def render_class_page(
         if submodule:
             description = f"{description} Access via the '{submodule}' submodule."
 
-    lines: List[str] = []
-    lines.append("---")
-    lines.append(f"title: {title}")
-    lines.append(f"description: {description}")
-    lines.append("---")
-    lines.append("")
-
-    # Add disclaimer
-    parts = set(current_module.split(".")) if current_module else set()
-    if mod := next((p for p in ["physics", "ui"] if p in parts), None):
-        lines.extend([
-            '<Note type="warning" title="Experimental API">',
-            f"  The {mod} submodule is an experimental and new API that is highly susceptible to breaking changes in the future.",
-            "</Note>",
-            ""
-        ])
+    page = PageWriter(out, param_table)
+    write_page_header(page, title, description, current_module)
 
     if info.bases:
         inherited = []
@@ -756,33 +1420,26 @@ def render_class_page(
                 # (though usually we'd want to link if it's an internal class)
                 inherited.append(f"`{base}`")
         if inherited:
-            lines.append(f"Inherits from {', '.join(inherited)}.")
-            lines.append("")
+            page.line(f"Inherits from {', '.join(inherited)}.")
+            page.line("")
 
     if info.init_sigs and not info.is_enum:
-        lines.append("## Constructor")
-        lines.append('<div className="api-card">')
-        lines.append("")
-
-        for sig in info.init_sigs:
-            # Constructor returns the class instance
-            sig_fixed = FunctionSig(
-                name=sig.name, params=sig.params, returns=info.name, doc=sig.doc
+        # Constructor returns the class instance
+        sigs = "\n".join(
+            "- "
+            + mdx_api_sig(
+                info.name,
+                FunctionSig(name=sig.name, params=sig.params, returns=info.name, doc=sig.doc),
+                param_table,
             )
-            lines.append(f"- {mdx_api_sig(info.name, sig_fixed)}")
-
-        if info.doc:
-            lines.append("")
-            lines.append(escape_outside_code(summary_from_doc(info.doc, "")))
-        lines.append("</div>")
+            for sig in info.init_sigs
+        )
+        summary = f"\n\n{escape_outside_code(summary_from_doc(info.doc, ''))}" if info.doc else ""
+        page.line(CONSTRUCTOR_CARD(sigs=sigs, summary=summary))
 
     if info.properties:
-        lines.append("")
-        lines.append("## Properties")
-        lines.append("<hr style={{marginBottom: 0}} />")
-        lines.append("")
-        lines.append("| Name | Description | Type |")
-        lines.append("| --- | --- | --- |")
+        page.line("")
+        page.line(PROPERTIES_HEADER())
         for prop in info.properties:
             desc = escape_outside_code(summary_from_doc(prop.doc, ""))
             if not desc and prop.type and "ClassVar" in prop.type:
@@ -791,159 +1448,141 @@ def render_class_page(
             type_str = prop.type or "Any"
             # For enums, if type matches class name, it's just the enum type
             formatted_type = format_type_for_table(type_str, linkable_classes)
-            lines.append(f"| `{prop.name}` | {desc} | <code>{formatted_type}</code> |")
+            page.line(PROPERTY_ROW(name=prop.name, desc=desc, type=formatted_type))
 
     if info.methods:
-        lines.append("")
-        lines.append("## Methods")
-        lines.append("---")
-        lines.append("")
+        page.line("")
+        page.line("## Methods\n---")
+        page.line("")
         for method in info.methods:
             method_processed = process_sig(method, current_module, linkable_classes, package_name)
-            lines.append(f"### {snake_to_title(method.name)}")
-
-            overloads = getattr(method_processed, "overloads", None)
-            has_multi_docs = overloads and sum(1 for s in overloads if s.doc) > 1
-
-            if has_multi_docs and overloads:
-                lines.append('<div className="api-card">')
-                for i, sig in enumerate(overloads):
-                    if i > 0:
-                        lines.append("")
-                        lines.append("---")
-                        lines.append("")
-
-                    lines.append(mdx_api_sig(method.name, sig))
-                    if sig.doc:
-                        lines.append("")
-                        lines.append(format_docstring(sig.doc))
-                lines.append("")
-                lines.append("</div>")
-                lines.append("")
-            else:
-                lines.append('<div className="api-card">')
-                if overloads:
-                    for sig in overloads:
-                        lines.append(mdx_api_sig(method.name, sig))
-                else:
-                    lines.append(mdx_api_sig(method.name, method_processed))
-
-                if method.doc:
-                    lines.append("")
-                    lines.append(format_docstring(method.doc))
+            write_function_card(page, "###", method, method_processed)
 
-                lines.append("")
-                lines.append("</div>")
-                lines.append("")
+    if hierarchy is not None and anchors is not None and info.name in hierarchy.bases:
+        write_inherited_sections(page, info, hierarchy, anchors)
 
-    return "\n".join(lines).rstrip() + "\n"
+    page.close()
 
 
-def render_module_page(
-    info: ModuleInfo, package_name: str, classes_map: Dict[str, ClassInfo]
-) -> str:
+def write_module_page(
+    out: TextIO,
+    info: ModuleInfo,
+    package_name: str,
+    classes_map: Mapping[str, ClassRef],
+    param_table: Optional[ParamTable] = None,
+) -> None:
     title = snake_to_title(info.name)
     description = summary_from_doc(info.doc, f"Functions in {info.name}.")
     current_module = f"{package_name}.{info.name}"  # approximate module path for functions page
 
-    lines: List[str] = []
-    lines.append("---")
-    lines.append(f"title: {title}")
-    lines.append(f"description: {description}")
-    lines.append("---")
-    lines.append("")
+    page = PageWriter(out, param_table)
+    write_page_header(page, title, description, current_module)
 
-    # Add disclaimer
-    parts = set(current_module.split(".")) if current_module else set()
-    if mod := next((p for p in ["physics", "ui"] if p in parts), None):
-        lines.extend([
-            '<Note type="warning" title="Experimental API">',
-            f"  The {mod} submodule is an experimental and new API that is highly susceptible to breaking changes in the future.",
-            "</Note>",
-            ""
-        ])
-
-    lines.append("---")
-    lines.append("")
+    page.line("---")
+    page.line("")
 
     for func in info.functions:
         func_processed = process_sig(func, current_module, classes_map, package_name)
-        lines.append(f"## {snake_to_title(func.name)}")
-
-        overloads = getattr(func_processed, "overloads", None)
-        has_multi_docs = overloads and sum(1 for s in overloads if s.doc) > 1
-
-        if has_multi_docs and overloads:
-            lines.append('<div className="api-card">')
-            for i, sig in enumerate(overloads):
-                if i > 0:
-                    lines.append("")
-                    lines.append("---")
-                    lines.append("")
-
-                lines.append(mdx_api_sig(func.name, sig))
-                if sig.doc:
-                    lines.append("")
-                    lines.append(format_docstring(sig.doc))
-            lines.append("")
-            lines.append("</div>")
-            lines.append("")
-        else:
-            lines.append('<div className="api-card">')
-            if overloads:
-                for sig in overloads:
-                    lines.append(mdx_api_sig(func.name, sig))
-            else:
-                lines.append(mdx_api_sig(func.name, func_processed))
+        write_function_card(page, "##", func, func_processed)
 
-            if func.doc:
-                lines.append("")
-                lines.append(format_docstring(func.doc))
-            lines.append("")
-            lines.append("</div>")
-            lines.append("")
+    page.close()
 
-    return "\n".join(lines).rstrip() + "\n"
 
+def write_constants_page(out: TextIO, enums: List[ClassInfo]) -> None:
+    """Write the constants index: one section per enum, members load on demand.
 
-def render_constants_page(enums: List[ClassInfo]) -> str:
-    lines = []
-    lines.append("---")
-    lines.append("title: Constants")
-    lines.append("description: A comprehensive list of constants used in the Kraken Engine.")
-    lines.append("---")
-    lines.append("")
+    Member tables are not inlined; each section embeds an `EnumTable` that
+    fetches the enum's data file (see `write_constants_data`) when it scrolls
+    into view, so the page stays small however many enums the engine has.
+    """
+    page = PageWriter(out)
+    page.line(
+        FRONTMATTER(
+            title="Constants",
+            description="A comprehensive list of constants used in the Kraken Engine.",
+        )
+    )
+    page.line("")
 
     # Sort enums by name
     enums.sort(key=lambda x: x.name)
 
     for info in enums:
-        # Title of the section: CamelCase -> Title Case (e.g. MouseButton -> Mouse Button)
-        # using snake_to_title on camel case kind of works if we split it first or just use space
-        # But let's just use the class name for clarity or a simple spread.
-        # title = snake_to_title(camel_to_kebab(info.name).replace("-", "_"))
         title = info.name
         if "." in title:
             name_parts = title.split(".")
             title = f"{name_parts[-1]} ({'.'.join(name_parts[:-1])})"
 
-        lines.append(f'<a id="{camel_to_kebab(info.name)}"></a>')
-        lines.append(f"## {title}")
+        slug = camel_to_kebab(info.name)
+        page.line(ENUM_HEADER(anchor=slug, title=title))
         if info.doc:
-             lines.append(escape_outside_code(summary_from_doc(info.doc, "")))
-             lines.append("")
+            page.line(escape_outside_code(summary_from_doc(info.doc, "")))
+            page.line("")
 
-        lines.append("| Name | Description | Type |")
-        lines.append("| --- | --- | --- |")
+        page.line(ENUM_TABLE(slug=slug, type=info.name, count=len(info.properties)))
+        page.line("")
 
-        for prop in info.properties:
-            desc = escape_outside_code(summary_from_doc(prop.doc, ""))
-            # For enums, the type is the enum class itself
-            lines.append(f"| `{prop.name}` | {desc} | `{info.name}` |")
+    page.close()
+
+
+def enum_data(info: ClassInfo) -> Dict[str, object]:
+    # Descriptions stay raw Markdown; EnumTable renders them as text/code.
+    return {
+        "name": info.name,
+        "members": [[prop.name, summary_from_doc(prop.doc, "")] for prop in info.properties],
+    }
+
+
+def write_constants_data(data_dir: Path, enums: List[ClassInfo], dirs: List[Path]) -> int:
+    """Write one compact JSON file per enum and remove files for stale enums,
+    those no constants page under `dirs` embeds any more."""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    keep = set()
+    for info in enums:
+        target = data_dir / f"{camel_to_kebab(info.name)}.json"
+        keep.add(target.name)
+        content = json.dumps(enum_data(info), ensure_ascii=False, separators=(",", ":")) + "\n"
+        if target.exists() and target.read_text(encoding="utf-8") == content:
+            continue
+        target.write_text(content, encoding="utf-8")
+        written += 1
+
+    for pages_dir in dirs:
+        page = pages_dir / CONSTANTS_PAGE
+        if page.exists():
+            keep.update(f"{slug}.json" for slug in ENUM_TABLE_NAME_RE.findall(page.read_text(encoding="utf-8")))
+
+    for stale in data_dir.glob("*.json"):
+        if stale.name not in keep:
+            stale.unlink()
+    return written
+
+
+def render_class_page(
+    info: ClassInfo,
+    package_name: str,
+    linkable_classes: Mapping[str, ClassRef],
+    hierarchy: Optional[ClassHierarchy] = None,
+    anchors: Optional[Mapping[str, Mapping[str, str]]] = None,
+) -> str:
+    out = io.StringIO()
+    write_class_page(out, info, package_name, linkable_classes, hierarchy, anchors=anchors)
+    return out.getvalue()
+
+
+def render_module_page(
+    info: ModuleInfo, package_name: str, classes_map: Mapping[str, ClassRef]
+) -> str:
+    out = io.StringIO()
+    write_module_page(out, info, package_name, classes_map)
+    return out.getvalue()
 
-        lines.append("")
 
-    return "\n".join(lines).rstrip() + "\n"
+def render_constants_page(enums: List[ClassInfo]) -> str:
+    out = io.StringIO()
+    write_constants_page(out, enums)
+    return out.getvalue()
 
 
 def enrich_enum_member_docs(enums: List[ClassInfo], package_name: str) -> None:
@@ -996,63 +1635,39 @@ def enrich_enum_member_docs(enums: List[ClassInfo], package_name: str) -> None:
                 prop.doc = doc.strip()
 
 
-def build_routes_items(titles_and_slugs: List[Tuple[str, str]], prepend_overview: bool = False) -> str:
-    lines = []
-    if prepend_overview:
-        lines.append('      { title: "Overview", href: "", separator: true },')
-    lines.extend([f"      {{ title: \"{title}\", href: \"/{slug}\" }}," for title, slug in titles_and_slugs])
-    return "\n".join(lines)
-
-
-def replace_routes_items(content: str, section_title: str, new_items: str) -> str:
-    pattern = re.compile(
-        rf"(\{{\n\s+title: \"{re.escape(section_title)}\"[\s\S]*?\n\s+items: \[)([\s\S]*?)(\n\s+\]\s*,\n\s+\}})",
-        re.MULTILINE,
-    )
-    match = pattern.search(content)
-    if not match:
-        return content
-    return content[: match.start(2)] + "\n" + new_items + content[match.end(2) :]
-
-
-def update_routes_config(routes_path: Path, class_names: List[str], module_names: List[str]) -> bool:
-    if not routes_path.exists():
-        return False
-
-    content = routes_path.read_text(encoding="utf-8")
+def format_sidebar_name(name: str) -> str:
+    if "." in name:
+        parts = name.split(".")
+        return f"{parts[-1]} ({parts[0]})"
+    return name
 
-    def format_sidebar_name(name: str) -> str:
-        if "." in name:
-            parts = name.split(".")
-            return f"{parts[-1]} ({parts[0]})"
-        return name
 
+def class_route_items(class_names: List[str]) -> List[Tuple[str, str]]:
     class_items = [(format_sidebar_name(name), camel_to_kebab(name)) for name in class_names]
     class_items.sort(key=lambda x: x[0].lower())
+    return class_items
 
+
+def module_route_items(module_names: List[str]) -> List[Tuple[str, str]]:
     module_items = [(snake_to_title(name), camel_to_kebab(name)) for name in module_names]
     module_items.sort(key=lambda x: x[0].lower())
-
-    updated = replace_routes_items(content, "Classes", build_routes_items(class_items, prepend_overview=True))
-    updated = replace_routes_items(updated, "Functions", build_routes_items(module_items, prepend_overview=True))
-
-    if updated != content:
-        routes_path.write_text(updated, encoding="utf-8")
-        return True
-    return False
+    return module_items
 
 
-def write_type_links_file(
-    target: Path, class_names: List[str], enum_names: List[str]
-) -> bool:
+def type_link_items(class_names: List[str], enum_names: List[str]) -> List[Tuple[str, str]]:
     class_items = [(name, f"/docs/classes/{camel_to_kebab(name)}") for name in class_names]
     enum_items = [(name, f"/docs/manual/constants#{camel_to_kebab(name)}") for name in enum_names]
     class_items.extend(enum_items)
     class_items.sort(key=lambda x: x[0].lower())
+    return class_items
+
 
+def write_type_links_file(
+    target: Path, class_names: List[str], enum_names: List[str]
+) -> bool:
     lines: List[str] = []
     lines.append("export const TYPE_LINKS = {")
-    for name, href in class_items:
+    for name, href in type_link_items(class_names, enum_names):
         lines.append(f"  \"{name}\": \"{href}\",")
     lines.append("} as const;")
     lines.append("")
@@ -1066,82 +1681,592 @@ def write_type_links_file(
     return True
 
 
+def toc_hrefs(entry: Mapping[str, object]) -> Dict[str, str]:
+    """Heading text -> "#slug" for a page manifest entry (first heading wins)."""
+    return {item["text"]: item["href"] for item in reversed(entry["toc"])}
+
+
+def member_anchors(info: ClassInfo, toc: List[Mapping[str, object]]) -> Dict[str, str]:
+    """Member name -> "#slug" on the class's page, read from the page's TOC.
+
+    Properties share the Properties heading. Each method is matched to the
+    next level-3 heading under Methods with its title, so slugs the slugger
+    de-duplicated (`-1`, `-2`) resolve to the right section.
+    """
+    hrefs = toc_hrefs({"toc": toc})
+    anchors = {prop.name: hrefs.get("Properties", "") for prop in info.properties}
+    start = next(
+        (index for index, item in enumerate(toc) if item["level"] == 2 and item["text"] == "Methods"), len(toc)
+    )
+    headings = iter(item for item in toc[start + 1 :] if item["level"] == 3)
+    for method in info.methods:
+        title = snake_to_title(method.name)
+        href = next((item["href"] for item in headings if item["text"] == title), hrefs.get("Methods", ""))
+        anchors[method.name] = href
+    return anchors
+
+
+def class_symbols(info: ClassInfo, route: str, anchors: Mapping[str, str]) -> Iterator[Symbol]:
+    yield info.name, "class", route
+    for prop in info.properties:
+        yield f"{info.name}.{prop.name}", "property", route + anchors[prop.name]
+    for method in info.methods:
+        yield f"{info.name}.{method.name}", "method", route + anchors[method.name]
+
+
+def module_symbols(info: ModuleInfo, route: str, hrefs: Mapping[str, str]) -> Iterator[Symbol]:
+    for func in info.functions:
+        yield f"{info.name}.{func.name}", "function", route + hrefs.get(snake_to_title(func.name), "")
+
+
+def enum_symbols(info: ClassInfo) -> Iterator[Symbol]:
+    href = f"/docs/manual/constants#{camel_to_kebab(info.name)}"
+    yield info.name, "enum", href
+    for prop in info.properties:
+        yield f"{info.name}.{prop.name}", "member", href
+
+
+def build_symbol_index(symbols: List[Symbol]) -> Dict[str, object]:
+    """Pack symbols into a table sorted by lowercase name for prefix lookups.
+
+    Each row is [name, kind index, page index, anchor]; page routes and kinds
+    are stored once, which keeps the file small enough to load in one go.
+    """
+    pages: Dict[str, int] = {}
+    rows: List[List[object]] = []
+    seen = set()
+    for name, kind, href in sorted(symbols, key=lambda item: (item[0].lower(), item[0])):
+        if name in seen:
+            continue
+        seen.add(name)
+        route, _, anchor = href.partition("#")
+        page = pages.setdefault(route, len(pages))
+        rows.append([name, SYMBOL_KINDS.index(kind), page, f"#{anchor}" if anchor else ""])
+    return {
+        "version": SYMBOL_INDEX_VERSION,
+        "kinds": SYMBOL_KINDS,
+        "pages": list(pages),
+        "symbols": rows,
+    }
+
+
+def write_precompressed(target: Path, content: str) -> bool:
+    """Write `target` and a gzip copy next to it, if the content changed.
+
+    The .gz copy is deterministic (no name or mtime in the header) so it only
+    shows up in diffs when the content does.
+    """
+    gz_target = target.with_name(f"{target.name}.gz")
+    if target.exists() and gz_target.exists() and target.read_text(encoding="utf-8") == content:
+        return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(content, encoding="utf-8")
+    with gz_target.open("wb") as raw, gzip.GzipFile(filename="", mode="wb", fileobj=raw, compresslevel=9, mtime=0) as fh:
+        fh.write(content.encode("utf-8"))
+    return True
+
+
+def write_symbol_index(target: Path, symbols: List[Symbol]) -> bool:
+    index = build_symbol_index(symbols)
+    return write_precompressed(target, json.dumps(index, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+class PrecompressedWriter:
+    """Streams text to `target` and its gzip copy at once.
+
+    Both go to temporary files that replace the targets on a clean exit, so
+    readers never see a half-written file; the .gz copy is deterministic like
+    the ones from `write_precompressed`.
+    """
+
+    def __init__(self, target: Path) -> None:
+        self.targets = [target, target.with_name(f"{target.name}.gz")]
+        self.temps = [path.with_name(f".{path.name}.tmp") for path in self.targets]
+        target.parent.mkdir(parents=True, exist_ok=True)
+        self.out = self.temps[0].open("w", encoding="utf-8", newline="\n")
+        self.raw = self.temps[1].open("wb")
+        self.gz = gzip.GzipFile(filename="", mode="wb", fileobj=self.raw, compresslevel=9, mtime=0)
+
+    def write(self, text: str) -> None:
+        self.out.write(text)
+        self.gz.write(text.encode("utf-8"))
+
+    def __enter__(self) -> "PrecompressedWriter":
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        self.out.close()
+        self.gz.close()
+        self.raw.close()
+        for temp, target in zip(self.temps, self.targets):
+            if exc_type is None:
+                os.replace(temp, target)
+            else:
+                temp.unlink(missing_ok=True)
+
+
+def param_text(param: Param) -> str:
+    text = param.name
+    if param.type:
+        text += f": {simplify_type(param.type)}"
+    if param.default is not None:
+        text += f" = {simplify_type(param.default)}"
+    return text
+
+
+def sig_text(name: str, sig: FunctionSig, returns: Optional[str] = None) -> str:
+    """Plain signature line, e.g. `rotate(angle: float) -> Vec2`."""
+    result = returns or simplify_type(sig.returns)
+    text = f"{name}({', '.join(param_text(param) for param in sig.params)})"
+    return f"{text} -> {result}" if result else text
+
+
+def function_sig_texts(func: FunctionSig) -> List[str]:
+    return [sig_text(func.name, sig) for sig in getattr(func, "overloads", None) or [func]]
+
+
+def class_bundle_item(info: ClassInfo) -> Dict[str, object]:
+    return {
+        "name": info.name,
+        "module": (info.module_name or "").replace("._pykraken", ""),
+        "href": f"/docs/classes/{camel_to_kebab(info.name)}",
+        "bases": info.bases,
+        "summary": summary_from_doc(info.doc, ""),
+        "constructors": [sig_text(info.name, sig, info.name) for sig in info.init_sigs],
+        # [name, type, summary]
+        "properties": [
+            [prop.name, simplify_type(prop.type), summary_from_doc(prop.doc, "")] for prop in info.properties
+        ],
+        # [name, [signature, ...], summary]
+        "methods": [
+            [method.name, function_sig_texts(method), summary_from_doc(method.doc, "")] for method in info.methods
+        ],
+    }
+
+
+def module_bundle_item(info: ModuleInfo) -> Dict[str, object]:
+    return {
+        "name": info.name,
+        "href": f"/docs/functions/{camel_to_kebab(info.name)}",
+        "summary": summary_from_doc(info.doc, ""),
+        "functions": [
+            [func.name, function_sig_texts(func), summary_from_doc(func.doc, "")] for func in info.functions
+        ],
+    }
+
+
+def enum_bundle_item(info: ClassInfo) -> Dict[str, object]:
+    return {
+        "name": info.name,
+        "href": f"/docs/manual/constants#{camel_to_kebab(info.name)}",
+        "summary": summary_from_doc(info.doc, ""),
+        "members": enum_data(info)["members"],
+    }
+
+
+def write_bundle_markdown(
+    out: PrecompressedWriter,
+    package_name: str,
+    fingerprint: str,
+    classes: List[ClassInfo],
+    modules: List[ModuleInfo],
+    enums: List[ClassInfo],
+) -> None:
+    out.write(f"# {package_name} API reference\n\n")
+    out.write(f"<!-- generated by scripts/generate_api_docs.py; fingerprint: {fingerprint} -->\n\n")
+    out.write("Every class, function and enum in one file. Full pages: https://krakenengine.org/docs\n")
+
+    out.write("\n## Classes\n")
+    for info in classes:
+        item = class_bundle_item(info)
+        out.write(f"\n### {info.name}\n\n")
+        if item["summary"]:
+            out.write(f"{item['summary']}\n\n")
+        if info.bases:
+            out.write(f"Inherits from {', '.join(info.bases)}.\n\n")
+        for sig in item["constructors"]:
+            out.write(f"- `{sig}`\n")
+        for name, type_str, summary in item["properties"]:
+            out.write(f"- property `{name}: {type_str or 'Any'}`" + (f" - {summary}" if summary else "") + "\n")
+        for name, sigs, summary in item["methods"]:
+            out.write("".join(f"- `{sig}`" + (f" - {summary}" if summary else "") + "\n" for sig in sigs))
+
+    out.write("\n## Functions\n")
+    for info in modules:
+        out.write(f"\n### {info.name}\n\n")
+        for func in info.functions:
+            summary = summary_from_doc(func.doc, "")
+            out.write("".join(f"- `{sig}`" + (f" - {summary}" if summary else "") + "\n" for sig in function_sig_texts(func)))
+
+    out.write("\n## Enums\n")
+    for info in enums:
+        out.write(f"\n### {info.name}\n\n")
+        for name, description in enum_data(info)["members"]:
+            out.write(f"- `{name}`" + (f" - {description}" if description else "") + "\n")
+
+
+def write_bundle_json(
+    out: PrecompressedWriter,
+    package_name: str,
+    fingerprint: str,
+    classes: List[ClassInfo],
+    modules: List[ModuleInfo],
+    enums: List[ClassInfo],
+) -> None:
+    # One item per line, streamed; the head carries the fingerprint so the
+    # next run can tell whether the bundle is current without parsing it.
+    out.write(
+        f'{{"version":{API_BUNDLE_VERSION},"fingerprint":"{fingerprint}","package":{json.dumps(package_name)}'
+    )
+    sections = (
+        ("classes", classes, class_bundle_item),
+        ("functions", modules, module_bundle_item),
+        ("enums", enums, enum_bundle_item),
+    )
+    for key, items, convert in sections:
+        out.write(f',"{key}":[')
+        for index, info in enumerate(items):
+            out.write(("," if index else "") + "\n" + json.dumps(convert(info), ensure_ascii=False, separators=(",", ":")))
+        out.write("\n]")
+    out.write("}\n")
+
+
+def api_bundle_current(fingerprint: str) -> bool:
+    paths = [API_BUNDLE_MD_PATH, API_BUNDLE_JSON_PATH]
+    if not all(path.exists() and path.with_name(f"{path.name}.gz").exists() for path in paths):
+        return False
+    with API_BUNDLE_JSON_PATH.open(encoding="utf-8") as fh:
+        match = BUNDLE_FINGERPRINT_RE.search(fh.read(256))
+    return bool(match) and match.group(1) == fingerprint
+
+
+def write_api_bundle(
+    package_name: str,
+    fingerprint: str,
+    classes: List[ClassInfo],
+    modules: List[ModuleInfo],
+    enums: List[ClassInfo],
+) -> None:
+    with PrecompressedWriter(API_BUNDLE_MD_PATH) as out:
+        write_bundle_markdown(out, package_name, fingerprint, classes, modules, enums)
+    with PrecompressedWriter(API_BUNDLE_JSON_PATH) as out:
+        write_bundle_json(out, package_name, fingerprint, classes, modules, enums)
+
+
+def is_skipped_class(ref: ClassInfo | ClassRef) -> bool:
+    if ref.module_name and ref.module_name.split(".")[-1] == "cli":
+        return True
+    return ref.name.split(".")[-1] == "TerrainIndices"
+
+
+class ApiModel:
+    """The converted API kept resident for `--serve`, with lazily rendered pages.
+
+    The model is rebuilt when the installed package's (or the stubs') files
+    change; rendered pages are cached per model version. Fingerprinting walks
+    and stats every package file, so it runs at most once per
+    `FINGERPRINT_INTERVAL` seconds rather than on every request.
+    """
+
+    FINGERPRINT_INTERVAL = 2.0
+
+    def __init__(self, package_names: List[str], jobs: int = 1, stub_root: Optional[Path] = None) -> None:
+        self.package_names = package_names
+        self.jobs = jobs
+        self.stub_root = stub_root
+        self.version = ""
+        self.checked_at: Optional[float] = None
+        self.lock = threading.Lock()
+        self.pages: Dict[str, str] = {}
+        self.ensure_current()
+
+    def ensure_current(self) -> None:
+        now = time.monotonic()
+        if self.checked_at is not None and now - self.checked_at < self.FINGERPRINT_INTERVAL:
+            return
+        self.checked_at = now
+        version = text_digest(*(package_fingerprint(name, self.stub_root) for name in self.package_names))
+        if version == self.version:
+            return
+
+        api = merge_api_slices(extract_packages(self.package_names, self.jobs, self.stub_root))
+        classes_by_name = {name: info for name, info in api.classes.items() if not is_skipped_class(info)}
+        modules = {info.name: info for info in api.modules.values()}
+
+        self.classes = {camel_to_kebab(name): info for name, info in classes_by_name.items() if not info.is_enum}
+        self.hierarchy = ClassHierarchy({info.name: info for info in self.classes.values()})
+        self.enums = [info for info in classes_by_name.values() if info.is_enum]
+        for name in self.package_names if self.stub_root is None else []:
+            enrich_enum_member_docs(
+                [info for info in self.enums if owning_package(info.module_name, self.package_names) == name], name
+            )
+        self.modules = {camel_to_kebab(name): info for name, info in modules.items()}
+        self.linkable_classes = {name: class_ref(info) for name, info in classes_by_name.items()}
+        self.pages = {}
+        self.anchors: Dict[str, Dict[str, str]] = {}
+        self.version = version
+        print(f"Loaded {api.package_name} model {version[:12]}: {len(self.classes)} class(es), {len(self.modules)} module(s)")
+
+    def render(self, route: str) -> Optional[str]:
+        with self.lock:
+            self.ensure_current()
+            return self._render(route)
+
+    def _render(self, route: str) -> Optional[str]:
+        if route in self.pages:
+            return self.pages[route]
+
+        text: Optional[str] = None
+        section, _, slug = route.strip("/").partition("/")[2].partition("/")
+        if section == "classes" and slug in self.classes:
+            info = self.classes[slug]
+            # ancestors are rendered first for the anchors of their members
+            for ancestor in self.hierarchy.mro(info.name)[1:]:
+                self._render(f"/docs/classes/{camel_to_kebab(ancestor)}")
+            pkg = owning_package(info.module_name, self.package_names)
+            text = render_class_page(info, pkg, self.linkable_classes, self.hierarchy, self.anchors)
+            self.anchors[info.name] = member_anchors(info, page_entry(Path(route), text)["toc"])
+        elif section == "functions" and slug in self.modules:
+            mod = self.modules[slug]
+            pkg = owning_package(mod.module_name, self.package_names)
+            text = render_module_page(mod, pkg, self.linkable_classes)
+        elif route == "/docs/manual/constants":
+            text = render_constants_page(list(self.enums))
+
+        if text is not None:
+            self.pages[route] = text
+        return text
+
+    def routes(self) -> Dict[str, List[Tuple[str, str]]]:
+        with self.lock:
+            self.ensure_current()
+            return {
+                "classes": class_route_items([info.name for info in self.classes.values()]),
+                "functions": module_route_items([info.name for info in self.modules.values()]),
+            }
+
+    def type_links(self) -> Dict[str, str]:
+        with self.lock:
+            self.ensure_current()
+            class_names = [info.name for info in self.classes.values()]
+            enum_names = [info.name for info in self.enums]
+            return dict(type_link_items(class_names, enum_names))
+
+
+def serve_api_docs(
+    package_names: List[str], host: str, port: int, jobs: int = 1, stub_root: Optional[Path] = None
+) -> int:
+    """Serve rendered API pages over HTTP for the Next dev server.
+
+    Endpoints:
+      GET /page/docs/classes/<slug>, /page/docs/functions/<slug>,
+          /page/docs/manual/constants   -> MDX text
+      GET /routes, /type-links, /version -> JSON
+    """
+    model = ApiModel(package_names, jobs, stub_root)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            path = self.path.split("?", 1)[0]
+            if path.startswith("/page/"):
+                text = model.render(path[len("/page") :])
+                if text is None:
+                    self.send_error(404, "No generated page for this route")
+                    return
+                self.respond(text, "text/markdown; charset=utf-8")
+            elif path == "/routes":
+                self.respond(json.dumps(model.routes()), "application/json")
+            elif path == "/type-links":
+                self.respond(json.dumps(model.type_links()), "application/json")
+            elif path == "/version":
+                self.respond(json.dumps({"version": model.version}), "application/json")
+            else:
+                self.send_error(404)
+
+        def respond(self, body: str, content_type: str) -> None:
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"Serving {', '.join(package_names)} API pages on http://{host}:{port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Generate MDX API docs from PyKraken with Griffe.")
-    parser.add_argument("--package", default="pykraken", help="Package name (default: pykraken)")
-    parser.add_argument("--out", default=str(Path("contents") / "docs"), help="Docs output directory")
+    parser.add_argument(
+        "--package",
+        nargs="+",
+        default=["pykraken"],
+        help="Package name(s); several are documented as one API (default: pykraken)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Parallel extraction workers, one package per worker",
+    )
+    parser.add_argument(
+        "--stubs",
+        help="Read the API statically from .pyi stubs: a directory or an sdist/wheel (the package is never imported)",
+    )
+    parser.add_argument("--out", default=str(SITE_DOCS_DIR), help="Docs output directory")
     parser.add_argument("--prune", action="store_true", help="Remove stale class/function directories")
     parser.add_argument(
-        "--routes",
-        default=str(Path("lib") / "routes-config.ts"),
-        help="Path to routes-config.ts (default: lib/routes-config.ts)",
+        "--routes-dir",
+        default=str(ROUTES_DIR),
+        help="Directory for the generated sidebar sections (default: lib/routes)",
+    )
+    parser.add_argument(
+        "--manifest",
+        default=str(MANIFEST_PATH),
+        help="Path to the page manifest (default: lib/page-manifest.json)",
+    )
+    parser.add_argument(
+        "--budget",
+        choices=["warn", "fail", "off"],
+        default="warn",
+        help="What to do when a written page exceeds page-budgets.json (default: warn)",
     )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep the model loaded and serve rendered pages over HTTP instead of writing files",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Host for --serve (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port for --serve (default: 8765)")
 
     args = parser.parse_args()
 
-    pkg = args.package
+    packages: List[str] = list(dict.fromkeys(args.package))
     out_dir = Path(args.out)
+    stub_root: Optional[Path] = None
+    if args.stubs:
+        stub_root = find_stub_root(Path(args.stubs), packages)
+        if stub_root is None:
+            parser.error(f"no stubs for {', '.join(packages)} under {args.stubs}")
+        print(f"Reading stubs from {stub_root}")
+
+    if args.serve:
+        return serve_api_docs(packages, args.host, args.port, args.jobs, stub_root)
+
+    slices = extract_packages(packages, args.jobs, stub_root)
+    for part in slices:
+        print(
+            f"Loaded {part.package_name} with Griffe: {len(part.classes)} class(es), {len(part.modules)} module(s)"
+        )
+    api = merge_api_slices(slices)
+    slices.clear()  # the merged model is the only owner of each class from here on
 
-    package_module = load(pkg)
-    classes_by_name = collect_griffe_classes(package_module, pkg)
-    modules = collect_griffe_modules(package_module, pkg)
+    class_refs = {name: class_ref(info) for name, info in api.classes.items()}
+    linkable_classes = {name: ref for name, ref in class_refs.items() if not is_skipped_class(ref)}
+    class_names = sorted(name for name, ref in linkable_classes.items() if not ref.is_enum)
+    enum_names = sorted(name for name, ref in linkable_classes.items() if ref.is_enum)
+    print(f"Selected {len(class_names)} class(es) and {len(enum_names)} enum(s)")
 
-    print(f"Loaded {pkg} with Griffe")
-    print(f"Parsed {len(classes_by_name)} class(es) and {len(modules)} module(s)")
+    hierarchy = ClassHierarchy({name: api.classes[name] for name in class_names})
+    # ApiSig types on the written pages resolve through these, as on the site
+    type_links = dict(type_link_items(class_names, enum_names))
 
     classes_dir = out_dir / "classes"
     functions_dir = out_dir / "functions"
     classes_dir.mkdir(parents=True, exist_ok=True)
     functions_dir.mkdir(parents=True, exist_ok=True)
 
-    # Separate enums and skip some classes
-    normal_classes: List[ClassInfo] = []
-    enums: List[ClassInfo] = []
-    for cls in classes_by_name.values():
-        if cls.module_name and cls.module_name.split(".")[-1] == "cli":
-            continue
-        if cls.name.split('.')[-1] == "TerrainIndices":
-            continue
+    manifest_entries: Dict[str, Dict[str, object]] = {}
+    budgets = load_budgets() if args.budget != "off" else {}
+    violations: List[Violation] = []
+    param_table = ParamTable()
 
-        if cls.is_enum:
-            enums.append(cls)
-        else:
-            normal_classes.append(cls)
+    symbols: List[Symbol] = []
 
-    linkable_classes = {cls.name: cls for cls in normal_classes}
-    linkable_classes.update({enum.name: enum for enum in enums})
+    def write_page(target: Path, render: Callable[[TextIO], None]) -> Tuple[str, Dict[str, object]]:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with target.open("w", encoding="utf-8", newline="\n") as fh:
+            tee = TeeWriter(fh)
+            render(tee)
+        route = route_for(target, out_dir.parent)
+        manifest_entries[route] = page_entry(target, tee.getvalue(), route, type_links, param_table.entries)
+        violations.extend(check_budgets({route: measure_page(tee.getvalue())}, budgets))
+        return route, manifest_entries[route]
+
+    enums = [api.classes[name] for name in linkable_classes if api.classes[name].is_enum]
+    # Enrich enum member docs from runtime, if available (stubs only: from comments)
+    for pkg in packages if stub_root is None else []:
+        enrich_enum_member_docs([info for info in enums if owning_package(info.module_name, packages) == pkg], pkg)
+
+    # The bundle reads the whole model, so it is written before the pages
+    # below release their classes and modules.
+    bundle_fingerprint = text_digest(
+        *(package_fingerprint(pkg, stub_root) for pkg in packages), file_digest(Path(__file__))
+    )[:16]
+    if api_bundle_current(bundle_fingerprint):
+        print("API bundle unchanged")
+    else:
+        write_api_bundle(
+            api.package_name,
+            bundle_fingerprint,
+            [api.classes[name] for name in class_names],
+            list(api.modules.values()),
+            sorted(enums, key=lambda info: info.name),
+        )
+        print(f"Wrote API bundle to {API_BUNDLE_MD_PATH} and {API_BUNDLE_JSON_PATH}")
 
+    # Each class and module is dropped from the model once its page is
+    # written; only the enums are kept, for the constants page. Ancestors are
+    # written first so their pages' anchors are known to their subclasses.
     generated_class_dirs: List[str] = []
-    for cls in normal_classes:
+    anchors: Dict[str, Dict[str, str]] = {}
+    for name in hierarchy.ancestors_first(class_names):
+        cls = api.classes.pop(name)
         slug = camel_to_kebab(cls.name)
         generated_class_dirs.append(slug)
-        target = classes_dir / slug / "index.mdx"
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_text(
-            render_class_page(cls, pkg, linkable_classes), encoding="utf-8"
+        route, entry = write_page(
+            classes_dir / slug / "index.mdx",
+            lambda out: write_class_page(
+                out, cls, owning_package(cls.module_name, packages), linkable_classes, hierarchy, param_table, anchors
+            ),
         )
-
-    # Enrich enum member docs from runtime, if available
-    enrich_enum_member_docs(enums, pkg)
+        anchors[name] = member_anchors(cls, entry["toc"])
+        symbols.extend(class_symbols(cls, route, anchors[name]))
+    api.classes.clear()
 
     # Generate Constants Page
-    constants_path = out_dir / "manual" / "constants" / "index.mdx"
-    constants_path.parent.mkdir(parents=True, exist_ok=True)
-    constants_path.write_text(render_constants_page(enums), encoding="utf-8")
+    constants_path = out_dir / CONSTANTS_PAGE
+    _, constants_entry = write_page(constants_path, lambda out: write_constants_page(out, enums))
     print(f"Wrote constants page to {constants_path}")
+    written = write_constants_data(CONSTANTS_DATA_DIR, enums, pages_dirs(out_dir))
+    print(f"Wrote {written} of {len(enums)} enum data file(s) to {CONSTANTS_DATA_DIR}")
+    for info in enums:
+        symbols.extend(enum_symbols(info))
 
     generated_module_dirs: List[str] = []
-    for mod in modules.values():
-        # Skip the main package module and internal _pykraken module
-        if mod.name in [pkg, "_pykraken", "cli"]:
-            continue
+    module_names = set()
+    for module_path in list(api.modules):
+        mod = api.modules.pop(module_path)
         slug = camel_to_kebab(mod.name)
         generated_module_dirs.append(slug)
-        target = functions_dir / slug / "index.mdx"
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_text(
-            render_module_page(mod, pkg, classes_by_name), encoding="utf-8"
+        module_names.add(mod.name)
+        route, entry = write_page(
+            functions_dir / slug / "index.mdx",
+            lambda out: write_module_page(
+                out, mod, owning_package(mod.module_name, packages), class_refs, param_table
+            ),
         )
+        symbols.extend(module_symbols(mod, route, toc_hrefs(entry)))
 
     print(f"Wrote {len(generated_class_dirs)} class page(s)")
     print(f"Wrote {len(generated_module_dirs)} function module page(s)")
@@ -1151,27 +2276,51 @@ def main() -> int:
         prune_dirs(functions_dir, generated_module_dirs)
         print("Pruned stale class/function directories")
 
-    routes_path = Path(args.routes)
-    updated_routes = update_routes_config(
-        routes_path,
-        sorted(c.name for c in normal_classes),
-        sorted({mod.name for mod in modules.values() if mod.name not in (pkg, "_pykraken", "cli")}),
-    )
-    if updated_routes:
-        print(f"Updated routes config at {routes_path}")
+    if write_param_table(API_PARAMS_PATH, param_table, pages_dirs(out_dir)):
+        print(f"Updated parameter table at {API_PARAMS_PATH} ({len(param_table.entries)} list(s))")
     else:
-        print("Routes config unchanged")
+        print("Parameter table unchanged")
+
+    routes_dir = Path(args.routes_dir)
+    route_sections = {
+        "classes": class_route_items(class_names),
+        "functions": module_route_items(sorted(module_names)),
+        "constants": [(str(constants_entry["title"]), "constants")],
+    }
+    for section, items in route_sections.items():
+        if write_route_module(section, items, "generate_api_docs.py", routes_dir):
+            print(f"Updated {section} routes at {routes_dir / section}.ts")
+        else:
+            print(f"{section.capitalize()} routes unchanged")
 
     type_links_path = Path("lib") / "type-links.ts"
-    if write_type_links_file(
-        type_links_path,
-        sorted(c.name for c in normal_classes),
-        sorted(e.name for e in enums),
-    ):
+    if write_type_links_file(type_links_path, class_names, enum_names):
         print(f"Updated type links at {type_links_path}")
     else:
         print("Type links unchanged")
 
+    if write_class_hierarchy(CLASS_HIERARCHY_PATH, hierarchy):
+        print(f"Updated class hierarchy at {CLASS_HIERARCHY_PATH}")
+    else:
+        print("Class hierarchy unchanged")
+
+    if write_symbol_index(SYMBOL_INDEX_PATH, symbols):
+        print(f"Updated symbol index at {SYMBOL_INDEX_PATH} ({len(symbols)} symbol(s))")
+    else:
+        print("Symbol index unchanged")
+
+    manifest_path = Path(args.manifest)
+    if update_manifest_entries(manifest_entries, manifest_path):
+        print(f"Updated page manifest at {manifest_path}")
+    else:
+        print("Page manifest unchanged")
+
+    if args.budget != "off":
+        for violation in sorted(violations, key=lambda violation: violation[0]):
+            print(f"{'Error' if args.budget == 'fail' else 'Warning'}: {format_violation(violation)}")
+        if violations and args.budget == "fail":
+            return 1
+
     return 0
 
 
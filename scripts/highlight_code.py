@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Highlight fenced code blocks ahead of time with Pygments.
+
+Usage:
+  python scripts/highlight_code.py [--root contents] [--force]
+
+Notes:
+- Requires Pygments (`pip install -r requirements-dev.txt`).
+- Writes lib/highlighted-code.json: the tokens of every fenced block under
+  contents/, keyed by a hash of the language and the code. lib/markdown.ts
+  swaps them in before rehypePrism, which then leaves those blocks alone;
+  blocks missing from the file (edited since the last run, or in a language
+  Pygments does not know) are still highlighted by Prism, so a stale file
+  only costs build time.
+- Token classes follow Prism's names, so styles/syntax.css applies as is.
+- Blocks already in the file are reused without lexing; blocks no longer in
+  any page are dropped. A new Pygments version re-highlights everything.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pygments
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name
+from pygments.token import Comment, Generic, Keyword, Name, Number, Operator, Punctuation, String
+from pygments.util import ClassNotFound
+
+from build_cache import text_digest
+from mdx_index import CONTENT_ROOT, FENCE_RE, iter_content_files
+
+HIGHLIGHT_PATH = Path("lib") / "highlighted-code.json"
+# Bump when the token classes below change.
+HIGHLIGHT_VERSION = 1
+
+# Languages Prism renders as plain text anyway.
+PLAIN_LANGS = {"", "text", "plaintext", "txt"}
+
+# A Pygments token type (pygments.token.Token or one of its children); the
+# class behind them is private to Pygments.
+TokenType = Any
+
+# Most specific first; the first type a token belongs to decides its class.
+TOKEN_CLASSES: List[Tuple[TokenType, str]] = [
+    (Comment, "comment"),
+    (Keyword.Constant, "boolean"),
+    (Keyword, "keyword"),
+    (Operator.Word, "keyword"),
+    (Operator, "operator"),
+    (Punctuation, "punctuation"),
+    (String.Regex, "regex"),
+    (String, "string"),
+    (Number, "number"),
+    (Name.Builtin, "builtin"),
+    (Name.Exception, "builtin"),
+    (Name.Function, "function"),
+    (Name.Class, "class-name"),
+    (Name.Decorator, "decorator"),
+    (Name.Variable, "variable"),
+    (Name.Constant, "constant"),
+    (Name.Attribute, "attr-name"),
+    (Name.Tag, "tag"),
+    (Name.Entity, "entity"),
+    (Generic.Deleted, "deleted"),
+    (Generic.Inserted, "inserted"),
+    (Generic.Emph, "italic"),
+    (Generic.Strong, "bold"),
+]
+
+# Attribute access dots are operators to Pygments but punctuation to Prism.
+PUNCTUATION_OPERATORS = {"."}
+
+# Plain text, or [class, text]
+Token = Union[str, List[str]]
+
+
+def token_class(ttype: TokenType) -> Optional[str]:
+    for parent, name in TOKEN_CLASSES:
+        if ttype in parent:
+            return name
+    return None
+
+
+def highlight(code: str, lexer: Lexer) -> List[Token]:
+    tokens: List[Token] = []
+    for ttype, value in lexer.get_tokens(code):
+        name = token_class(ttype)
+        if name == "operator" and value in PUNCTUATION_OPERATORS:
+            name = "punctuation"
+        last = tokens[-1] if tokens else None
+        # merge runs of the same class so the JSON and the hast stay small
+        if name is None:
+            if isinstance(last, str):
+                tokens[-1] = last + value
+            else:
+                tokens.append(value)
+        elif isinstance(last, list) and last[0] == name:
+            last[1] += value
+        else:
+            tokens.append([name, value])
+    # Pygments always ends with a newline; the code element has none of its own
+    if tokens and code and not code.endswith("\n"):
+        last = tokens[-1]
+        text = last if isinstance(last, str) else last[1]
+        if text.endswith("\n"):
+            text = text[:-1]
+            if isinstance(last, str):
+                tokens[-1] = text
+            else:
+                last[1] = text
+            if not text:
+                tokens.pop()
+    return tokens
+
+
+def block_key(lang: str, code: str) -> str:
+    """Must match `highlightKey` in lib/markdown.ts."""
+    return text_digest(lang, code)[:16]
+
+
+def fenced_blocks(text: str) -> List[Tuple[str, str]]:
+    """(language, code) of each fenced block, with the fence's indentation
+    removed from the code lines the way the Markdown parser does."""
+    blocks: List[Tuple[str, str]] = []
+    fence: Optional[str] = None
+    indent = 0
+    lang = ""
+    body: List[str] = []
+
+    for line in text.splitlines():
+        fence_match = FENCE_RE.match(line)
+        if fence:
+            if (
+                fence_match
+                and fence_match.group(1)[0] == fence[0]
+                and len(fence_match.group(1)) >= len(fence)
+                and not line.strip()[len(fence_match.group(1)) :].strip()
+            ):
+                blocks.append((lang, "\n".join(body)))
+                fence = None
+            else:
+                stripped = line.lstrip(" ")
+                body.append(line[min(indent, len(line) - len(stripped)) :])
+            continue
+        if fence_match:
+            fence = fence_match.group(1)
+            indent = len(line) - len(line.lstrip(" "))
+            info = line.strip()[len(fence) :].strip()
+            lang = info.split(":", 1)[0].split(" ", 1)[0].lower()
+            body = []
+
+    return blocks
+
+
+def load_highlighted(path: Path = HIGHLIGHT_PATH) -> Dict[str, List[Token]]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except ValueError:
+        return {}
+    if data.get("version") != HIGHLIGHT_VERSION or data.get("pygments") != pygments.__version__:
+        return {}
+    return data.get("blocks", {})
+
+
+def dump_highlighted(blocks: Dict[str, List[Token]]) -> str:
+    lines = [
+        f"    {json.dumps(key)}: {json.dumps(blocks[key], ensure_ascii=False, separators=(',', ':'))}"
+        for key in sorted(blocks)
+    ]
+    body = ",\n".join(lines)
+    return (
+        f'{{\n  "version": {HIGHLIGHT_VERSION},\n  "pygments": {json.dumps(pygments.__version__)},\n'
+        f'  "blocks": {{\n{body}\n  }}\n}}\n'
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pre-highlight fenced code blocks with Pygments.")
+    parser.add_argument("--root", default=str(CONTENT_ROOT), help="Content directory (default: contents)")
+    parser.add_argument("--out", default=str(HIGHLIGHT_PATH), help="Output path")
+    parser.add_argument("--force", action="store_true", help="Re-highlight every block")
+    args = parser.parse_args()
+
+    out = Path(args.out)
+    previous = {} if args.force else load_highlighted(out)
+    lexers: Dict[str, Optional[Lexer]] = {}
+    blocks: Dict[str, List[Token]] = {}
+    lexed = 0
+    skipped = 0
+
+    for path in iter_content_files(Path(args.root)):
+        for lang, code in fenced_blocks(path.read_text(encoding="utf-8")):
+            if lang in PLAIN_LANGS:
+                continue
+            key = block_key(lang, code)
+            if key in blocks:
+                continue
+            if key in previous:
+                blocks[key] = previous[key]
+                continue
+            if lang not in lexers:
+                try:
+                    lexers[lang] = get_lexer_by_name(lang, stripnl=False, ensurenl=True)
+                except ClassNotFound:
+                    lexers[lang] = None
+            lexer = lexers[lang]
+            if lexer is None:
+                skipped += 1
+                continue
+            blocks[key] = highlight(code, lexer)
+            lexed += 1
+
+    dropped = sum(1 for key in previous if key not in blocks)
+    content = dump_highlighted(blocks)
+    if out.exists() and out.read_text(encoding="utf-8") == content:
+        print(f"Highlighted code unchanged ({len(blocks)} block(s))")
+        return 0
+    out.write_text(content, encoding="utf-8")
+    print(
+        f"Wrote {len(blocks)} highlighted block(s) to {out}: {lexed} highlighted, "
+        f"{len(blocks) - lexed} reused, {dropped} dropped, {skipped} in unknown languages"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Record image sizes and render responsive variants for the images in public/.
+
+Usage:
+  python scripts/image_assets.py [--jobs N] [--force]
+
+Notes:
+- Requires Pillow (`pip install pillow`).
+- Writes lib/image-manifest.json: width, height and content hash of every
+  image under public/ that a page under contents/ embeds (SVG sizes come from
+  its width/height or viewBox), plus the resized variants of raster images.
+  The markdown image component reads it to reserve the image's box before it
+  loads and to offer the variants as a srcset, so the browser downloads a
+  file sized for the content column. Images used elsewhere (the showcase and
+  landing pages go through next/image) are left out.
+- Variants are WebP at each breakpoint narrower than the original, written
+  to public/images/variants/<name>-<hash>-<width>.webp. A variant that is not
+  smaller than its original (already well-compressed images) is dropped.
+  Variants of replaced or no longer embedded images are removed.
+- Sizes and variant outcomes are cached in `.cache/image-assets.json` by file
+  hash, so unchanged images are neither opened nor re-encoded. Encoding is
+  spread over a process pool.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from build_cache import JsonCache, file_digest
+from mdx_index import CONTENT_ROOT, iter_content_files, scan_mdx
+
+PUBLIC_DIR = Path("public")
+VARIANTS_DIR = PUBLIC_DIR / "images" / "variants"
+IMAGE_MANIFEST_PATH = Path("lib") / "image-manifest.json"
+IMAGE_MANIFEST_VERSION = 1
+
+BREAKPOINTS = [480, 960, 1600]
+WEBP_QUALITY = 60
+RASTER_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp", ".gif"}
+
+SVG_TAG_RE = re.compile(r"<svg\b[^>]*>", re.IGNORECASE | re.DOTALL)
+SVG_ATTR_RE = re.compile(r"""\b(width|height|viewBox)\s*=\s*["']([^"']*)["']""")
+SVG_LENGTH_RE = re.compile(r"^\s*([\d.]+)\s*(?:px)?\s*$")
+
+# (source path, target path, width)
+Job = Tuple[str, str, int]
+
+
+def svg_size(path: Path) -> Optional[Tuple[int, int]]:
+    match = SVG_TAG_RE.search(path.read_text(encoding="utf-8", errors="replace"))
+    if not match:
+        return None
+    attrs = dict(SVG_ATTR_RE.findall(match.group(0)))
+    width = SVG_LENGTH_RE.match(attrs.get("width", ""))
+    height = SVG_LENGTH_RE.match(attrs.get("height", ""))
+    if width and height:
+        return round(float(width.group(1))), round(float(height.group(1)))
+    box = attrs.get("viewBox", "").replace(",", " ").split()
+    if len(box) == 4:
+        return round(float(box[2])), round(float(box[3]))
+    return None
+
+
+def image_size(path: Path) -> Optional[Tuple[int, int]]:
+    if path.suffix.lower() == ".svg":
+        return svg_size(path)
+    with Image.open(path) as image:
+        return image.size
+
+
+def variant_path(path: Path, digest: str, width: int) -> Path:
+    return VARIANTS_DIR / f"{path.stem}-{digest[:8]}-{width}.webp"
+
+
+def render_variant(job: Job) -> int:
+    source, target, width = job
+    with Image.open(source) as image:
+        height = max(1, round(image.height * width / image.width))
+        mode = "RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB"
+        resized = image.convert(mode).resize((width, height), Image.Resampling.LANCZOS)
+    Path(target).parent.mkdir(parents=True, exist_ok=True)
+    resized.save(target, format="WEBP", quality=WEBP_QUALITY)
+    return Path(target).stat().st_size
+
+
+def collect_images(root: Path = CONTENT_ROOT) -> List[Path]:
+    """Files under public/ that pages link to or embed, by site-absolute URL."""
+    suffixes = RASTER_SUFFIXES | {".svg"}
+    found = set()
+    for page in iter_content_files(root):
+        for href, _ in scan_mdx(page.read_text(encoding="utf-8"))["links"]:
+            url = href.partition("#")[0].partition("?")[0]
+            if not url.startswith("/") or url.startswith("//"):
+                continue
+            path = PUBLIC_DIR / url.lstrip("/")
+            if path.suffix.lower() in suffixes and path.is_file() and not path.is_relative_to(VARIANTS_DIR):
+                found.add(path)
+    return sorted(found)
+
+
+def dump_image_manifest(images: Dict[str, Dict[str, object]]) -> str:
+    lines = [
+        f"    {json.dumps(url)}: {json.dumps(images[url], separators=(',', ':'))}" for url in sorted(images)
+    ]
+    body = ",\n".join(lines)
+    return f'{{\n  "version": {IMAGE_MANIFEST_VERSION},\n  "images": {{\n{body}\n  }}\n}}\n'
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Record image sizes and render responsive variants.")
+    parser.add_argument("--out", default=str(IMAGE_MANIFEST_PATH), help="Manifest path (default: lib/image-manifest.json)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Parallel encoding workers")
+    parser.add_argument("--force", action="store_true", help="Re-encode every variant")
+    args = parser.parse_args()
+
+    cache = JsonCache("image-assets", version=str(IMAGE_MANIFEST_VERSION))
+    images: Dict[str, Dict[str, object]] = {}
+    jobs: List[Job] = []
+    # per job: (manifest url, cache key, original size in bytes)
+    pending: List[Tuple[str, str, int]] = []
+    keep = set()
+
+    for path in collect_images():
+        digest = file_digest(path)
+        size = cache.get(digest)
+        if size is None:
+            size = image_size(path)
+            cache.set(digest, size)
+        if size is None:
+            print(f"Skipping {path}: size unknown")
+            continue
+        width, height = size
+        url = f"/{path.relative_to(PUBLIC_DIR).as_posix()}"
+        variants: List[List[object]] = []
+        images[url] = {"width": width, "height": height, "hash": digest[:16], "variants": variants}
+        if path.suffix.lower() not in RASTER_SUFFIXES:
+            continue
+
+        for breakpoint in BREAKPOINTS:
+            if breakpoint >= width:
+                break
+            target = variant_path(path, digest, breakpoint)
+            key = f"{digest}:{breakpoint}"
+            # bytes of the variant, or 0 when it was not smaller than the original
+            known = None if args.force else cache.get(key)
+            if known == 0:
+                continue
+            if known and target.exists():
+                keep.add(target)
+                variants.append([breakpoint, f"/{target.relative_to(PUBLIC_DIR).as_posix()}"])
+                continue
+            jobs.append((str(path), str(target), breakpoint))
+            pending.append((url, key, path.stat().st_size))
+
+    if jobs:
+        if args.jobs > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+                written = list(pool.map(render_variant, jobs))
+        else:
+            written = [render_variant(job) for job in jobs]
+        dropped = 0
+        for (_, target, breakpoint), (url, key, original), size in zip(jobs, pending, written):
+            if size >= original:
+                Path(target).unlink()
+                cache.set(key, 0)
+                dropped += 1
+                continue
+            cache.set(key, size)
+            keep.add(Path(target))
+            images[url]["variants"].append([breakpoint, f"/{Path(target).relative_to(PUBLIC_DIR).as_posix()}"])
+        for info in images.values():
+            info["variants"].sort()
+        print(f"Rendered {len(jobs)} variant(s), {dropped} dropped as no smaller than the original")
+    cache.save()
+
+    removed = 0
+    for stale in VARIANTS_DIR.glob("*.webp") if VARIANTS_DIR.exists() else []:
+        if stale not in keep:
+            stale.unlink()
+            removed += 1
+
+    out = Path(args.out)
+    content = dump_image_manifest(images)
+    if out.exists() and out.read_text(encoding="utf-8") == content:
+        print(f"Image manifest unchanged ({len(images)} image(s), {removed} stale variant(s) removed)")
+    else:
+        out.write_text(content, encoding="utf-8")
+        print(f"Wrote {len(images)} image(s) to {out} ({len(keep)} variant(s), {removed} stale removed)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,181 @@
+"""
+Lightweight MDX scanning helpers shared by the docs scripts.
+
+These do not compile MDX; they read just enough structure (frontmatter,
+headings, explicit anchors and links) to index pages quickly. Heading slugs
+follow the same rules as `rehypeSlug` (github-slugger), so anchors computed
+here match the ids in the rendered site.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+CONTENT_ROOT = Path("contents")
+
+FENCE_RE = re.compile(r"^\s*(`{3,}|~{3,})")
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+ANCHOR_ID_RE = re.compile(r"""<[A-Za-z][^>]*?\sid=["']([^"']+)["']""")
+MD_LINK_RE = re.compile(r"""!?\[(?:[^\[\]]|\[[^\]]*\])*\]\(\s*<?([^)\s>]+)>?(?:\s+["'][^"']*["'])?\s*\)""")
+ATTR_LINK_RE = re.compile(r"""\b(?:href|src)=(?:\{\s*)?["']([^"']+)["']""")
+INLINE_CODE_RE = re.compile(r"(`+)(?:(?!\1).)+?\1")
+# `type: "Vec2 | None"` params and `returns="Rect"` on generated <ApiSig> tags
+API_SIG_TYPE_RE = re.compile(r'(?:\btype: |\breturns=)"([^"]*)"')
+# `paramsId="..."`: a parameter list kept in lib/api-params.json instead
+API_SIG_PARAMS_ID_RE = re.compile(r'\bparamsId="([^"]*)"')
+SLUG_STRIP_RE = re.compile(r"[^\w\- ]", re.UNICODE)
+
+
+def github_slug(text: str) -> str:
+    """Slugify heading text like github-slugger (used by rehypeSlug)."""
+    return SLUG_STRIP_RE.sub("", text.lower()).replace(" ", "-")
+
+
+class Slugger:
+    """Produces unique slugs per document, suffixing repeats with -1, -2, ..."""
+
+    def __init__(self) -> None:
+        self.occurrences: Dict[str, int] = {}
+
+    def slug(self, text: str) -> str:
+        result = github_slug(text)
+        original = result
+        while result in self.occurrences:
+            self.occurrences[original] += 1
+            result = f"{original}-{self.occurrences[original]}"
+        self.occurrences[result] = 0
+        return result
+
+
+def heading_text(raw: str) -> str:
+    """Approximate the rendered text content of a Markdown heading."""
+    text = re.sub(r"!?\[([^\]]*)\]\([^)]*\)", r"\1", raw)
+    text = re.sub(r"<[^>]+>", "", text)
+    text = text.replace("`", "")
+    text = re.sub(r"(\*\*|__)(.+?)\1", r"\2", text)
+    text = re.sub(r"(?<!\w)[*_](.+?)[*_](?!\w)", r"\1", text)
+    return html.unescape(text).strip()
+
+
+def split_frontmatter(text: str) -> Tuple[Dict[str, str], str, int]:
+    """Returns (frontmatter, body, number of lines consumed by the frontmatter)."""
+    if not text.startswith("---"):
+        return {}, text, 0
+
+    lines = text.splitlines(keepends=True)
+    for idx in range(1, len(lines)):
+        if lines[idx].strip() == "---":
+            data: Dict[str, str] = {}
+            for line in lines[1:idx]:
+                key, sep, value = line.partition(":")
+                if sep and key.strip() and not key.startswith((" ", "\t")):
+                    data[key.strip()] = value.strip().strip("\"'")
+            return data, "".join(lines[idx + 1 :]), idx + 1
+    return {}, text, 0
+
+
+def route_for(path: Path, root: Path = CONTENT_ROOT) -> str:
+    """contents/docs/classes/vec2/index.mdx -> /docs/classes/vec2"""
+    rel = path.relative_to(root).with_suffix("")
+    parts = list(rel.parts)
+    if parts and parts[-1] == "index":
+        parts = parts[:-1]
+    return "/" + "/".join(parts)
+
+
+def iter_content_files(root: Path = CONTENT_ROOT) -> List[Path]:
+    return sorted(root.rglob("*.mdx"))
+
+
+def scan_mdx(text: str) -> Dict[str, object]:
+    """Scan one MDX document for frontmatter, headings, anchor ids and links.
+
+    Lines inside fenced code blocks are ignored, and inline code is blanked
+    out before looking for links so examples are not reported. Type strings
+    of <ApiSig> tags are collected too (the component links them client-side),
+    along with the ids of the parameter lists they reference.
+    """
+    frontmatter, body, offset = split_frontmatter(text)
+    slugger = Slugger()
+    headings: List[Dict[str, object]] = []
+    anchors: List[str] = []
+    links: List[Tuple[str, int]] = []
+    types: List[str] = []
+    param_ids: List[str] = []
+    fence: Optional[str] = None
+
+    for lineno, line in enumerate(body.splitlines(), start=offset + 1):
+        fence_match = FENCE_RE.match(line)
+        if fence:
+            if fence_match and fence_match.group(1)[0] == fence[0] and len(fence_match.group(1)) >= len(fence):
+                fence = None
+            continue
+        if fence_match:
+            fence = fence_match.group(1)
+            continue
+
+        heading_match = HEADING_RE.match(line)
+        if heading_match:
+            text_value = heading_text(heading_match.group(2))
+            headings.append(
+                {
+                    "depth": len(heading_match.group(1)),
+                    "text": text_value,
+                    "slug": slugger.slug(text_value),
+                    "line": lineno,
+                }
+            )
+
+        anchors.extend(ANCHOR_ID_RE.findall(line))
+
+        searchable = INLINE_CODE_RE.sub(lambda m: "x" * len(m.group(0)), line)
+        for match in MD_LINK_RE.finditer(searchable):
+            links.append((line[match.start(1) : match.end(1)], lineno))
+        for match in ATTR_LINK_RE.finditer(searchable):
+            links.append((line[match.start(1) : match.end(1)], lineno))
+        if "<ApiSig" in line:
+            types.extend(API_SIG_TYPE_RE.findall(line))
+            param_ids.extend(API_SIG_PARAMS_ID_RE.findall(line))
+
+    return {
+        "frontmatter": frontmatter,
+        "headings": headings,
+        "anchors": anchors,
+        "links": links,
+        "types": types,
+        "param_ids": param_ids,
+    }
+
+
+def iter_code_blocks(text: str) -> List[Tuple[str, str, int]]:
+    """Returns (info string, code, first code line number) for each fenced block."""
+    blocks: List[Tuple[str, str, int]] = []
+    fence: Optional[str] = None
+    info = ""
+    start = 0
+    body: List[str] = []
+
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        fence_match = FENCE_RE.match(line)
+        if fence:
+            if (
+                fence_match
+                and fence_match.group(1)[0] == fence[0]
+                and len(fence_match.group(1)) >= len(fence)
+                and not line.strip()[len(fence_match.group(1)) :].strip()
+            ):
+                blocks.append((info, "\n".join(body), start))
+                fence = None
+            else:
+                body.append(line)
+            continue
+        if fence_match:
+            fence = fence_match.group(1)
+            info = line.strip()[len(fence) :].strip()
+            start = lineno + 1
+            body = []
+
+    return blocks
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Pre-render Open Graph images for every docs and guide page.
+
+Usage:
+  python scripts/og_images.py [--jobs N] [--force]
+
+Notes:
+- Requires Pillow (`pip install -r requirements-dev.txt`). `pnpm build` runs
+  this script first, so deploys need `python3` with Pillow on the path.
+- Titles and descriptions come from lib/page-manifest.json, so run
+  `page_manifest.py` / `generate_api_docs.py` first.
+- Text is set in DejaVu Sans, vendored in scripts/fonts/ (see its LICENSE),
+  so images come out the same on every machine.
+- Writes public/og/<route>.png (e.g. public/og/docs/classes/vec2.png); page
+  metadata points at these when present and falls back to the dynamic
+  app/opengraph-image.tsx otherwise.
+- Images are keyed in `.cache/og-images.json` by a hash of the title,
+  description, this script (the template) and the fonts, so only pages whose
+  inputs changed are re-rendered. Rendering is spread over a process pool.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from build_cache import JsonCache, bytes_digest, file_digest, text_digest
+from page_manifest import MANIFEST_PATH, load_manifest
+
+OG_DIR = Path("public") / "og"
+SIZE = (1200, 630)
+PADDING = 56
+TEXT_WIDTH = 1040
+
+# Same palette as app/opengraph-image.tsx.
+BRAND = {
+    "mint": (84, 182, 155),
+    "deep": (29, 53, 60),
+    "cream": (252, 227, 186),
+    "sand": (212, 191, 156),
+    "night": (14, 29, 34),
+    "teal": (45, 81, 88),
+}
+
+FONT_DIR = Path(__file__).resolve().parent / "fonts"
+FONT_REGULAR = "DejaVuSans.ttf"
+FONT_BOLD = "DejaVuSans-Bold.ttf"
+
+# (route, title, description, target)
+Job = Tuple[str, str, str, str]
+
+_BACKGROUND: Optional[Image.Image] = None
+
+
+def load_font(name: str, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(str(FONT_DIR / name), size)
+
+
+def stop_lut(stops: List[Tuple[float, Tuple[int, int, int]]], channel: int) -> List[int]:
+    """256-entry lookup table interpolating one colour channel between stops."""
+    lut: List[int] = []
+    for i in range(256):
+        t = i / 255
+        for (t0, c0), (t1, c1) in zip(stops, stops[1:]):
+            if t <= t1:
+                f = (t - t0) / (t1 - t0) if t1 > t0 else 0
+                lut.append(round(c0[channel] + (c1[channel] - c0[channel]) * f))
+                break
+    return lut
+
+
+def render_background() -> Image.Image:
+    """The page-independent part: gradient, glow and decorative circles."""
+    width, height = SIZE
+
+    # 140deg linear gradient, night -> deep (62%) -> teal, computed at a
+    # quarter of the size and scaled up (it is smooth, so nothing is lost)
+    small = (width // 4, height // 4)
+    dx, dy = math.sin(math.radians(140)), -math.cos(math.radians(140))
+    span = abs(small[0] * dx) + abs(small[1] * dy)
+    ramp = Image.new("L", small)
+    ramp.putdata(
+        [
+            round(255 * min(1.0, max(0.0, ((x - small[0] / 2) * dx + (y - small[1] / 2) * dy) / span + 0.5)))
+            for y in range(small[1])
+            for x in range(small[0])
+        ]
+    )
+    ramp = ramp.resize(SIZE, Image.Resampling.BICUBIC)
+    stops = [(0.0, BRAND["night"]), (0.62, BRAND["deep"]), (1.0, BRAND["teal"])]
+    image = Image.merge("RGB", [ramp.point(stop_lut(stops, c)) for c in range(3)]).convert("RGBA")
+
+    # mint glow in the top right corner
+    glow_size = int(width * 0.92)
+    falloff = Image.radial_gradient("L").resize((glow_size, glow_size), Image.Resampling.BICUBIC)
+    glow_alpha = falloff.point(lambda v: max(0, round((1 - v / 255 / 0.5) * 0.36 * 255)))
+    glow = Image.new("RGBA", (glow_size, glow_size), BRAND["mint"] + (0,))
+    glow.putalpha(glow_alpha)
+    image.alpha_composite(glow, (int(width * 0.82) - glow_size // 2, int(-height * 0.08) - glow_size // 2))
+
+    overlay = Image.new("RGBA", SIZE, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    draw.ellipse(
+        (width - 260, -120, width + 120, 260),
+        fill=BRAND["mint"] + (46,),
+        outline=BRAND["mint"] + (97,),
+        width=2,
+    )
+    draw.ellipse(
+        (-100, height - 180, 200, height + 120),
+        fill=BRAND["sand"] + (26,),
+        outline=BRAND["cream"] + (64,),
+        width=2,
+    )
+    image.alpha_composite(overlay)
+
+    brand = load_font(FONT_BOLD, 30)
+    draw = ImageDraw.Draw(image)
+    draw.text((PADDING, PADDING), "KRAKEN ENGINE", font=brand, fill=BRAND["mint"])
+    draw.text((PADDING, height - PADDING - 28), "krakenengine.org", font=load_font(FONT_REGULAR, 28), fill=BRAND["cream"])
+    return image
+
+
+def wrap_text(text: str, font: ImageFont.FreeTypeFont, width: int) -> List[str]:
+    lines: List[str] = []
+    current = ""
+    for word in text.split():
+        candidate = f"{current} {word}".strip()
+        if current and font.getlength(candidate) > width:
+            lines.append(current)
+            current = word
+        else:
+            current = candidate
+    if current:
+        lines.append(current)
+    return lines
+
+
+def clamp_lines(lines: List[str], font: ImageFont.FreeTypeFont, width: int, limit: int) -> List[str]:
+    if len(lines) <= limit:
+        return lines
+    last = " ".join(lines[limit - 1 :])
+    while last and font.getlength(f"{last}...") > width:
+        last = last[:-1]
+    return lines[: limit - 1] + [f"{last.rstrip()}..."]
+
+
+def fit_title(title: str) -> Tuple[ImageFont.FreeTypeFont, List[str]]:
+    """Largest title size (84px down to 48px) that fits in three lines."""
+    for size in range(84, 47, -6):
+        font = load_font(FONT_BOLD, size)
+        lines = wrap_text(title, font, TEXT_WIDTH)
+        if len(lines) <= 3:
+            return font, lines
+    return font, clamp_lines(lines, font, TEXT_WIDTH, 3)
+
+
+def render_image(route: str, title: str, description: str) -> bytes:
+    global _BACKGROUND
+    if _BACKGROUND is None:
+        _BACKGROUND = render_background()
+
+    image = _BACKGROUND.copy()
+    draw = ImageDraw.Draw(image)
+
+    section = route.strip("/").split("/", 1)[0].upper() or "DOCS"
+    badge_font = load_font(FONT_BOLD, 21)
+    badge_width = int(draw.textlength(section, font=badge_font)) + 28
+    badge_box = (SIZE[0] - PADDING - badge_width, SIZE[1] - PADDING - 36, SIZE[0] - PADDING, SIZE[1] - PADDING)
+    draw.rounded_rectangle(badge_box, radius=10, fill=BRAND["sand"])
+    draw.text((badge_box[0] + 14, badge_box[1] + 6), section, font=badge_font, fill=BRAND["deep"])
+
+    title_font, title_lines = fit_title(title)
+    desc_font = load_font(FONT_REGULAR, 33)
+    desc_lines = clamp_lines(wrap_text(description, desc_font, TEXT_WIDTH), desc_font, TEXT_WIDTH, 3)
+
+    title_step = int(title_font.size * 1.05)
+    desc_step = int(desc_font.size * 1.22)
+    block = len(title_lines) * title_step + (14 + len(desc_lines) * desc_step if desc_lines else 0)
+    y = (SIZE[1] - block) // 2 + 10
+    for line in title_lines:
+        draw.text((PADDING, y), line, font=title_font, fill=BRAND["cream"])
+        y += title_step
+    y += 14
+    for line in desc_lines:
+        draw.text((PADDING, y), line, font=desc_font, fill=BRAND["sand"])
+        y += desc_step
+
+    out = io.BytesIO()
+    image.convert("RGB").save(out, format="PNG")
+    return out.getvalue()
+
+
+def render_job(job: Job) -> str:
+    route, title, description, target = job
+    data = render_image(route, title, description)
+    path = Path(target)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return bytes_digest(data)
+
+
+def og_path(route: str, out_dir: Path = OG_DIR) -> Path:
+    return out_dir / f"{route.strip('/')}.png"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pre-render Open Graph images for docs and guide pages.")
+    parser.add_argument("--manifest", default=str(MANIFEST_PATH), help="Page manifest to read titles from")
+    parser.add_argument("--out", default=str(OG_DIR), help="Output directory (default: public/og)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Parallel render workers")
+    parser.add_argument("--force", action="store_true", help="Re-render every image")
+    args = parser.parse_args()
+
+    out_dir = Path(args.out)
+    pages = load_manifest(Path(args.manifest))
+    template = text_digest(
+        file_digest(Path(__file__)), *(file_digest(FONT_DIR / name) for name in (FONT_REGULAR, FONT_BOLD))
+    )
+    cache = JsonCache("og-images")
+
+    jobs: List[Job] = []
+    keys: Dict[str, str] = {}
+    keep = set()
+    for route, entry in sorted(pages.items()):
+        title = str(entry.get("title") or "")
+        description = str(entry.get("description") or "")
+        target = og_path(route, out_dir)
+        keep.add(target)
+        key = text_digest(template, route, title, description)
+        cached = None if args.force else cache.get(key)
+        if cached is not None and target.exists() and file_digest(target) == cached:
+            continue
+        jobs.append((route, title, description, str(target)))
+        keys[str(target)] = key
+
+    if jobs:
+        if args.jobs > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+                digests = list(pool.map(render_job, jobs, chunksize=4))
+        else:
+            digests = [render_job(job) for job in jobs]
+        for job, digest in zip(jobs, digests):
+            cache.set(keys[job[3]], digest)
+    cache.save()
+
+    removed = 0
+    for stale in out_dir.rglob("*.png") if out_dir.exists() else []:
+        if stale not in keep:
+            stale.unlink()
+            removed += 1
+
+    print(f"Rendered {len(jobs)} of {len(pages)} Open Graph image(s) to {out_dir} ({removed} stale removed)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
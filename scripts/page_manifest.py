@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Build lib/page-manifest.json: frontmatter and headings for every content page.
+
+Usage:
+  python scripts/page_manifest.py [--full]
+
+Notes:
+- The site reads titles, descriptions and tables of contents from this
+  manifest instead of re-parsing MDX for every page and TOC lookup.
+- `generate_api_docs.py` updates the entries of the pages it writes directly
+  from the rendered text; this script covers hand-written pages. Entries are
+  keyed by route and carry a content hash, so unchanged pages are reused.
+- Anchor slugs follow rehypeSlug (github-slugger), matching the rendered ids.
+- Each entry records when its content hash last changed (`updated`, UTC);
+  next-sitemap uses it as the page's `lastmod`, so regenerating unchanged
+  pages does not advertise them as fresh.
+- `prefetch` lists the pages a page links to most (Markdown/HTML links plus
+  <ApiSig> types, including those of the parameter lists in
+  lib/api-params.json, resolved through lib/type-links.ts); the page component
+  prefetches those routes once it has loaded. `linksHash` digests those link
+  inputs, so an entry is rebuilt when they change even if its text did not.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional
+
+from build_cache import bytes_digest, text_digest
+from mdx_index import API_SIG_PARAMS_ID_RE, CONTENT_ROOT, iter_content_files, route_for, scan_mdx
+
+MANIFEST_PATH = Path("lib") / "page-manifest.json"
+MANIFEST_VERSION = 1
+
+# Written by generate_api_docs.py; maps type names to their pages.
+TYPE_LINKS_PATH = Path("lib") / "type-links.ts"
+TYPE_LINK_ITEM_RE = re.compile(r'^\s*"([^"]+)": "([^"]+)",$', re.MULTILINE)
+
+# Also written by generate_api_docs.py; the parameter lists <ApiSig> tags
+# reference by `paramsId`.
+API_PARAMS_PATH = Path("lib") / "api-params.json"
+API_PARAMS_VERSION = 1
+
+PREFETCH_LIMIT = 4
+
+
+def load_type_links(path: Path = TYPE_LINKS_PATH) -> Dict[str, str]:
+    if not path.exists():
+        return {}
+    return dict(TYPE_LINK_ITEM_RE.findall(path.read_text(encoding="utf-8")))
+
+
+def load_api_params(path: Path = API_PARAMS_PATH) -> Dict[str, List[Dict[str, str]]]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except ValueError:
+        return {}
+    if data.get("version") != API_PARAMS_VERSION:
+        return {}
+    return data.get("params", {})
+
+
+def link_counts(
+    scan: Mapping[str, object],
+    type_links: Mapping[str, str],
+    api_params: Optional[Mapping[str, List[Dict[str, str]]]] = None,
+) -> Counter:
+    """Site route -> number of links to it from one scanned page."""
+    counts: Counter = Counter()
+    for href, _ in scan["links"]:
+        route = href.partition("#")[0].partition("?")[0].rstrip("/")
+        if route.startswith(("/docs", "/guides")):
+            counts[route] += 1
+    types = list(scan["types"])
+    for key in scan["param_ids"]:
+        types.extend(param["type"] for param in (api_params or {}).get(key, []) if "type" in param)
+    if type_links and types:
+        # same alternation as components/ApiSig.tsx, so the same names link
+        pattern = re.compile(r"\b(" + "|".join(re.escape(name) for name in type_links) + r")\b")
+        for value in types:
+            for name in pattern.findall(value):
+                counts[type_links[name].partition("#")[0]] += 1
+    return counts
+
+
+def links_digest(
+    text: str,
+    type_links: Mapping[str, str],
+    api_params: Optional[Mapping[str, List[Dict[str, str]]]] = None,
+) -> str:
+    """Digest of a page's link inputs besides its text: the type links and its parameter lists."""
+    ids = sorted(set(API_SIG_PARAMS_ID_RE.findall(text)))
+    params = [(api_params or {}).get(key) for key in ids]
+    return text_digest(json.dumps(type_links, sort_keys=True), json.dumps(params, sort_keys=True))[:16]
+
+
+def prefetch_routes(route: str, counts: Counter, limit: int = PREFETCH_LIMIT) -> List[str]:
+    ranked = sorted((target for target in counts if target != route), key=lambda target: (-counts[target], target))
+    return ranked[:limit]
+
+
+def page_entry(
+    path: Path,
+    text: str,
+    route: str = "",
+    type_links: Optional[Mapping[str, str]] = None,
+    api_params: Optional[Mapping[str, List[Dict[str, str]]]] = None,
+) -> Dict[str, object]:
+    scan = scan_mdx(text)
+    frontmatter = scan["frontmatter"]
+    return {
+        "path": path.as_posix(),
+        "hash": bytes_digest(text.encode("utf-8")),
+        "title": frontmatter.get("title", ""),
+        "description": frontmatter.get("description", ""),
+        "toc": [
+            {"level": h["depth"], "text": h["text"], "href": f"#{h['slug']}"}
+            for h in scan["headings"]
+        ],
+        "prefetch": prefetch_routes(route, link_counts(scan, type_links or {}, api_params)),
+        "linksHash": links_digest(text, type_links or {}, api_params),
+    }
+
+
+def utc_now() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def carry_timestamps(
+    pages: Dict[str, Dict[str, object]],
+    previous: Dict[str, Dict[str, object]],
+    now: Optional[str] = None,
+) -> None:
+    """Keep each page's `updated` time unless its content hash changed."""
+    now = now or utc_now()
+    for route, entry in pages.items():
+        old = previous.get(route)
+        if old is not None and old.get("hash") == entry["hash"] and old.get("updated"):
+            entry["updated"] = old["updated"]
+        else:
+            entry["updated"] = now
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> Dict[str, Dict[str, object]]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except ValueError:
+        return {}
+    if data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("pages", {})
+
+
+def dump_manifest(pages: Dict[str, Dict[str, object]]) -> str:
+    # One page per line keeps diffs of the committed file readable.
+    lines = [
+        f"    {json.dumps(route)}: {json.dumps(pages[route], ensure_ascii=False, separators=(',', ':'))}"
+        for route in sorted(pages)
+    ]
+    body = ",\n".join(lines)
+    return f'{{\n  "version": {MANIFEST_VERSION},\n  "pages": {{\n{body}\n  }}\n}}\n'
+
+
+def write_manifest(pages: Dict[str, Dict[str, object]], path: Path = MANIFEST_PATH) -> bool:
+    content = dump_manifest(pages)
+    if path.exists() and path.read_text(encoding="utf-8") == content:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return True
+
+
+def update_manifest_entries(
+    entries: Dict[str, Dict[str, object]], manifest_path: Path = MANIFEST_PATH
+) -> bool:
+    """Merge freshly computed entries (route -> entry) into the manifest."""
+    pages = load_manifest(manifest_path)
+    carry_timestamps(entries, pages)
+    pages.update(entries)
+    pages = {route: entry for route, entry in pages.items() if Path(entry["path"]).exists()}
+    return write_manifest(pages, manifest_path)
+
+
+def scan_pages(
+    root: Path = CONTENT_ROOT,
+    previous: Optional[Dict[str, Dict[str, object]]] = None,
+    reuse: bool = True,
+) -> Dict[str, Dict[str, object]]:
+    previous = previous or {}
+    type_links = load_type_links()
+    api_params = load_api_params()
+    pages: Dict[str, Dict[str, object]] = {}
+    for path in iter_content_files(root):
+        text = path.read_text(encoding="utf-8")
+        route = route_for(path, root)
+        entry = previous.get(route)
+        if (
+            not reuse
+            or entry is None
+            or entry.get("hash") != bytes_digest(text.encode("utf-8"))
+            or entry.get("linksHash") != links_digest(text, type_links, api_params)
+        ):
+            entry = page_entry(path, text, route, type_links, api_params)
+        pages[route] = entry
+    carry_timestamps(pages, previous)
+    return pages
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the page manifest for docs and guides.")
+    parser.add_argument("--root", default=str(CONTENT_ROOT), help="Content directory (default: contents)")
+    parser.add_argument("--out", default=str(MANIFEST_PATH), help="Manifest path (default: lib/page-manifest.json)")
+    parser.add_argument("--full", action="store_true", help="Rebuild every entry instead of reusing unchanged ones")
+    args = parser.parse_args()
+
+    out = Path(args.out)
+    # --full re-parses every page but still keeps the timestamps of pages
+    # whose content did not change.
+    pages = scan_pages(Path(args.root), load_manifest(out), reuse=not args.full)
+    if write_manifest(pages, out):
+        print(f"Wrote {len(pages)} page(s) to {out}")
+    else:
+        print("Page manifest unchanged")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
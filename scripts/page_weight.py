@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Profile the weight of MDX pages and check them against budgets.
+
+Usage:
+  python scripts/page_weight.py [PATH ...] [--top N] [--check] [--update-baseline]
+
+Notes:
+- Measures every page under contents/ (generated and hand-written): bytes,
+  JSX/HTML elements, <ApiSig> cards, table rows, HTML entities, fenced code
+  lines, and an estimated compile cost combining them (see COST_WEIGHTS).
+- The cost is in relative units, roughly one per KB of plain Markdown; it is
+  meant for ranking pages and spotting growth, not as a time.
+- page-weight-baseline.json records the last accepted measurements (one page
+  per line, committed), so the report shows what grew since then. Refresh
+  it with `--update-baseline` after an intended change.
+- Budgets live in page-budgets.json: a `default` limit per metric, and
+  `routes` overrides keyed by route or glob (later matches win).
+  `generate_api_docs.py` checks the pages it writes against them too.
+- With `--check`, the exit status is 1 if any page is over budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from dataclasses import asdict, dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from mdx_index import CONTENT_ROOT, FENCE_RE, INLINE_CODE_RE, iter_content_files, route_for, split_frontmatter
+
+BUDGETS_PATH = Path("page-budgets.json")
+BASELINE_PATH = Path("page-weight-baseline.json")
+BASELINE_VERSION = 1
+
+METRICS = ["bytes", "elements", "api_sigs", "table_rows", "entities", "code_lines", "cost"]
+
+# Cost per unit of each metric. Parsing scales with size; every element is a
+# JSX node to compile and render, an ApiSig additionally evaluates its props
+# expression, and table cells, entities and code lines each become nodes.
+COST_WEIGHTS = {
+    "kb": 1.0,
+    "elements": 0.05,
+    "api_sigs": 0.5,
+    "table_cells": 0.02,
+    "entities": 0.01,
+    "code_lines": 0.02,
+}
+
+ELEMENT_RE = re.compile(r"<([A-Za-z][\w.]*)")
+ENTITY_RE = re.compile(r"&(?:#\d+|#x[0-9a-fA-F]+|[A-Za-z]+);")
+TABLE_RULE_RE = re.compile(r"^\s*\|[\s:|-]+\|\s*$")
+
+# (route, metric, value, limit)
+Violation = Tuple[str, str, float, float]
+
+
+@dataclass
+class PageWeight:
+    bytes: int = 0
+    elements: int = 0
+    api_sigs: int = 0
+    table_rows: int = 0
+    entities: int = 0
+    code_lines: int = 0
+    cost: float = 0.0
+
+
+def measure_page(text: str) -> PageWeight:
+    """Measure one MDX document; fenced code only counts towards its lines."""
+    _, body, _ = split_frontmatter(text)
+    weight = PageWeight(bytes=len(text.encode("utf-8")))
+    table_cells = 0
+    fence: Optional[str] = None
+
+    for line in body.splitlines():
+        fence_match = FENCE_RE.match(line)
+        if fence:
+            if fence_match and fence_match.group(1)[0] == fence[0] and len(fence_match.group(1)) >= len(fence):
+                fence = None
+            else:
+                weight.code_lines += 1
+            continue
+        if fence_match:
+            fence = fence_match.group(1)
+            continue
+
+        searchable = INLINE_CODE_RE.sub("", line)
+        for match in ELEMENT_RE.finditer(searchable):
+            weight.elements += 1
+            if match.group(1) == "ApiSig":
+                weight.api_sigs += 1
+        weight.entities += len(ENTITY_RE.findall(searchable))
+        if line.lstrip().startswith("|") and not TABLE_RULE_RE.match(line):
+            weight.table_rows += 1
+            table_cells += max(1, line.strip().strip("|").count("|") + 1)
+
+    weight.cost = round(
+        weight.bytes / 1024 * COST_WEIGHTS["kb"]
+        + weight.elements * COST_WEIGHTS["elements"]
+        + weight.api_sigs * COST_WEIGHTS["api_sigs"]
+        + table_cells * COST_WEIGHTS["table_cells"]
+        + weight.entities * COST_WEIGHTS["entities"]
+        + weight.code_lines * COST_WEIGHTS["code_lines"],
+        1,
+    )
+    return weight
+
+
+def load_budgets(path: Path = BUDGETS_PATH) -> Dict[str, object]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def page_budget(route: str, budgets: Mapping[str, object]) -> Dict[str, float]:
+    limits = dict(budgets.get("default", {}))
+    for pattern, overrides in budgets.get("routes", {}).items():
+        if fnmatchcase(route, pattern):
+            limits.update(overrides)
+    return limits
+
+
+def check_budgets(weights: Mapping[str, PageWeight], budgets: Mapping[str, object]) -> List[Violation]:
+    violations: List[Violation] = []
+    for route in sorted(weights):
+        values = asdict(weights[route])
+        for metric, limit in page_budget(route, budgets).items():
+            if limit is not None and values.get(metric, 0) > limit:
+                violations.append((route, metric, values[metric], limit))
+    return violations
+
+
+def format_violation(violation: Violation) -> str:
+    route, metric, value, limit = violation
+    return f"{route}: {metric} {value:g} over budget {limit:g}"
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, PageWeight]:
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("version") != BASELINE_VERSION:
+        return {}
+    return {route: PageWeight(**values) for route, values in data.get("pages", {}).items()}
+
+
+def dump_baseline(weights: Mapping[str, PageWeight]) -> str:
+    # One page per line, like the page manifest, so growth shows up in diffs.
+    lines = [
+        f"    {json.dumps(route)}: {json.dumps(asdict(weights[route]), separators=(',', ':'))}"
+        for route in sorted(weights)
+    ]
+    body = ",\n".join(lines)
+    return f'{{\n  "version": {BASELINE_VERSION},\n  "pages": {{\n{body}\n  }}\n}}\n'
+
+
+def measure_files(paths: List[Path]) -> Dict[str, PageWeight]:
+    weights: Dict[str, PageWeight] = {}
+    for path in paths:
+        route = route_for(path) if path.is_relative_to(CONTENT_ROOT) else path.as_posix()
+        weights[route] = measure_page(path.read_text(encoding="utf-8"))
+    return weights
+
+
+def delta(value: float, previous: Optional[float]) -> str:
+    if previous is None:
+        return "new"
+    change = value - previous
+    return f"{change:+g}" if change else "="
+
+
+def print_report(weights: Mapping[str, PageWeight], baseline: Mapping[str, PageWeight], top: int) -> None:
+    ranked = sorted(weights.items(), key=lambda item: (-item[1].cost, item[0]))
+    print(f"{'cost':>7} {'(delta)':>9} {'KB':>7} {'elems':>6} {'sigs':>5} {'rows':>5} {'ents':>6}  route")
+    for route, weight in ranked[:top]:
+        previous = baseline.get(route)
+        print(
+            f"{weight.cost:>7g} {delta(weight.cost, previous.cost if previous else None):>9} "
+            f"{weight.bytes / 1024:>7.1f} {weight.elements:>6} {weight.api_sigs:>5} "
+            f"{weight.table_rows:>5} {weight.entities:>6}  {route}"
+        )
+
+    total = sum(weight.cost for weight in weights.values())
+    shared = [route for route in weights if route in baseline]
+    grown = sum(1 for route in shared if weights[route].cost > baseline[route].cost)
+    shrunk = sum(1 for route in shared if weights[route].cost < baseline[route].cost)
+    print(
+        f"{len(weights)} page(s), total cost {total:g} "
+        f"(baseline {sum(weight.cost for weight in baseline.values()):g}): "
+        f"{grown} grew, {shrunk} shrank, {len(weights) - len(shared)} new, "
+        f"{sum(1 for route in baseline if route not in weights)} gone"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Report MDX page weights and check them against budgets.")
+    parser.add_argument("paths", nargs="*", help="Files or directories (default: contents/)")
+    parser.add_argument("--top", type=int, default=20, help="Number of heaviest pages to list")
+    parser.add_argument("--budgets", default=str(BUDGETS_PATH), help="Budget file")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="Baseline file")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these measurements as the baseline")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if any page is over budget")
+    args = parser.parse_args()
+
+    files: List[Path] = []
+    for path in [Path(p) for p in args.paths] or [CONTENT_ROOT]:
+        files.extend(iter_content_files(path) if path.is_dir() else [path])
+    weights = measure_files(files)
+
+    baseline_path = Path(args.baseline)
+    print_report(weights, load_baseline(baseline_path), args.top)
+
+    violations = check_budgets(weights, load_budgets(Path(args.budgets)))
+    for violation in violations:
+        print(format_violation(violation))
+    print(f"{len(violations)} budget violation(s)")
+
+    if args.update_baseline:
+        baseline_path.write_text(dump_baseline(weights), encoding="utf-8")
+        print(f"Wrote baseline for {len(weights)} page(s) to {baseline_path}")
+
+    return 1 if args.check and violations else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Write the offline precache manifest used by the service worker (public/sw.js).
+
+Usage:
+  python scripts/precache_manifest.py [--sections docs guides] [--out PATH]
+
+Notes:
+- Run after `generate_api_docs.py` / `page_manifest.py` and before
+  `next build`; writes public/precache-manifest.json (ignored by git).
+  `pnpm build` runs it first (the `prebuild` script), so every deploy
+  serves a manifest matching its pages. It only needs the standard library.
+- Every entry is [url, revision]:
+    pages       content hash from lib/page-manifest.json, mixed with a digest
+                of the site shell (app/, components/, lib/, styles/ and the
+                package files), since cached HTML also embeds the build's
+                script URLs and navigation
+    data files  public/data/**/*.json, by file hash
+    images      /images/... referenced from the cached pages, and their
+                responsive variants from lib/image-manifest.json, by file hash
+- `version` is a hash of all entries. The service worker keeps the revision
+  of everything it cached and, when the version changes, downloads only the
+  entries whose revision differs and drops the ones that disappeared.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from build_cache import file_digest, text_digest
+from mdx_index import scan_mdx
+from page_manifest import MANIFEST_PATH, load_manifest
+
+PRECACHE_MANIFEST_PATH = Path("public") / "precache-manifest.json"
+PRECACHE_VERSION = 1
+PUBLIC_DIR = Path("public")
+DATA_DIR = PUBLIC_DIR / "data"
+IMAGE_MANIFEST_PATH = Path("lib") / "image-manifest.json"
+
+# Files whose changes alter every rendered page. The page manifest and the
+# highlighted code are left out: each page's own hash already covers its entry
+# and its code blocks.
+SHELL_DIRS = [Path("app"), Path("components"), Path("lib"), Path("styles")]
+SHELL_FILES = [Path("package.json"), Path("pnpm-lock.yaml"), Path("next.config.ts")]
+SHELL_SUFFIXES = {".ts", ".tsx", ".js", ".mjs", ".css", ".json"}
+SHELL_EXCLUDE = {MANIFEST_PATH, Path("lib") / "highlighted-code.json"}
+
+DEFAULT_SECTIONS = ["docs"]
+
+# (url, revision)
+Entry = Tuple[str, str]
+
+
+def shell_digest() -> str:
+    files = [path for path in SHELL_FILES if path.exists()]
+    for root in SHELL_DIRS:
+        files.extend(
+            path
+            for path in root.rglob("*")
+            if path.is_file() and path.suffix in SHELL_SUFFIXES and path not in SHELL_EXCLUDE
+        )
+    return text_digest(*(f"{path.as_posix()}:{file_digest(path)}" for path in sorted(files)))
+
+
+def page_images(path: Path) -> List[str]:
+    """Site-absolute image URLs a page references (links into public/images)."""
+    if not path.exists():
+        return []
+    scan = scan_mdx(path.read_text(encoding="utf-8"))
+    return [href for href, _ in scan["links"] if href.startswith("/images/")]
+
+
+def image_variants(path: Path = IMAGE_MANIFEST_PATH) -> Dict[str, List[str]]:
+    """Variant URLs of each image, as written by image_assets.py."""
+    if not path.exists():
+        return {}
+    images = json.loads(path.read_text(encoding="utf-8")).get("images", {})
+    return {url: [variant for _, variant in info.get("variants", [])] for url, info in images.items()}
+
+
+def collect_entries(pages: Dict[str, Dict[str, object]], sections: List[str]) -> List[Entry]:
+    shell = shell_digest()
+    entries: Dict[str, str] = {}
+    assets = set()
+    for route, entry in pages.items():
+        if route.strip("/").split("/", 1)[0] not in sections:
+            continue
+        entries[route] = text_digest(shell, str(entry["hash"]))[:16]
+        assets.update(page_images(Path(str(entry["path"]))))
+
+    for path in sorted(DATA_DIR.rglob("*.json")) if DATA_DIR.exists() else []:
+        entries[f"/{path.relative_to(PUBLIC_DIR).as_posix()}"] = file_digest(path)[:16]
+    # the browser may pick any variant from the srcset
+    variants = image_variants()
+    for url in list(assets):
+        assets.update(variants.get(url, []))
+    for url in sorted(assets):
+        path = PUBLIC_DIR / url.lstrip("/")
+        if path.is_file():
+            entries[url] = file_digest(path)[:16]
+
+    return sorted(entries.items())
+
+
+def build_precache_manifest(entries: List[Entry]) -> Dict[str, object]:
+    return {
+        "version": text_digest(str(PRECACHE_VERSION), *(f"{url} {rev}" for url, rev in entries))[:16],
+        "entries": [list(entry) for entry in entries],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Write the offline precache manifest for the docs.")
+    parser.add_argument("--manifest", default=str(MANIFEST_PATH), help="Page manifest to read routes and hashes from")
+    parser.add_argument("--out", default=str(PRECACHE_MANIFEST_PATH), help="Output path")
+    parser.add_argument(
+        "--sections",
+        nargs="+",
+        default=DEFAULT_SECTIONS,
+        help="Top-level sections whose pages are cached (default: docs)",
+    )
+    args = parser.parse_args()
+
+    pages = load_manifest(Path(args.manifest))
+    if not pages:
+        print(f"No pages in {args.manifest}; run page_manifest.py first")
+        return 1
+
+    entries = collect_entries(pages, args.sections)
+    content = json.dumps(build_precache_manifest(entries), separators=(",", ":")) + "\n"
+
+    out = Path(args.out)
+    if out.exists() and out.read_text(encoding="utf-8") == content:
+        print(f"Precache manifest unchanged ({len(entries)} entries)")
+        return 0
+
+    previous = {}
+    if out.exists():
+        try:
+            previous = dict(json.loads(out.read_text(encoding="utf-8")).get("entries", []))
+        except ValueError:
+            previous = {}
+    changed = sum(1 for url, rev in entries if previous.get(url) != rev)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(content, encoding="utf-8")
+    print(f"Wrote {len(entries)} precache entries to {out} ({changed} new or changed)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,50 @@
+"""
+Generated sidebar sections under lib/routes/, shared by the docs scripts.
+
+Each section (classes, functions, constants, changelog) is its own module
+exporting `ROUTES: EachRoute[]`. lib/routes-config.ts imports all of them for
+the server-side route lists. Of the large ones (classes, functions), the docs
+sidebar gets the current page's section from the server (app/docs/@menu) and
+loads the others on demand through `loadRouteSection` in lib/routes-tree.ts.
+
+The first line of a module carries a hash of its routes, so an unchanged
+section is detected from that line alone and is not rewritten.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import List, Tuple
+
+from build_cache import text_digest
+
+ROUTES_DIR = Path("lib") / "routes"
+# Bump when the module layout below changes.
+ROUTE_MODULE_VERSION = "1"
+
+
+def route_module_header(source: str, items: List[Tuple[str, str]]) -> str:
+    digest = text_digest(ROUTE_MODULE_VERSION, json.dumps(items))[:16]
+    return f"// Generated by scripts/{source}; do not edit. content-hash: {digest}"
+
+
+def route_module_text(header: str, items: List[Tuple[str, str]]) -> str:
+    lines = [header, 'import type { EachRoute } from "@/lib/routes-tree";', "", "export const ROUTES: EachRoute[] = ["]
+    lines.extend(f"  {{ title: {json.dumps(title)}, href: {json.dumps('/' + slug)} }}," for title, slug in items)
+    lines.append("];")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def write_route_module(section: str, items: List[Tuple[str, str]], source: str, routes_dir: Path = ROUTES_DIR) -> bool:
+    """Write lib/routes/<section>.ts from (title, slug) pairs; False when unchanged."""
+    target = routes_dir / f"{section}.ts"
+    header = route_module_header(source, items)
+    if target.exists():
+        with target.open(encoding="utf-8") as fh:
+            if fh.readline().rstrip("\n") == header:
+                return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(route_module_text(header, items), encoding="utf-8")
+    return True
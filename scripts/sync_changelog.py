@@ -4,6 +4,14 @@ Sync CHANGELOG.md from the PyKraken GitHub repo into docs.
 
 Usage:
   python scripts/sync_changelog.py [--branch BRANCH]
+
+Notes:
+- Inline-code mentions of API symbols are linked to their reference pages
+  (see `autolink_symbols.py`), using the symbol index from the last
+  `generate_api_docs.py` run.
+- The changelog's page manifest entry is refreshed too, so its sitemap
+  `lastmod` only moves when the synced notes actually change, as is its
+  sidebar entry in lib/routes/changelog.ts.
 """
 
 from __future__ import annotations
@@ -13,6 +21,10 @@ from pathlib import Path
 from urllib.request import urlopen
 import re
 
+from autolink_symbols import link_symbols, load_symbol_links, page_route
+from page_manifest import load_type_links, page_entry, update_manifest_entries
+from route_modules import write_route_module
+
 MAX_VERSIONS = 10
 
 REMOVE_LINES = {
@@ -79,15 +91,18 @@ def normalize_changelog(content: str) -> str:
     return "\n".join(lines).strip() + "\n"
 
 
-def write_changelog(target: Path, content: str) -> None:
+def write_changelog(target: Path, content: str) -> int:
+    """Write the normalized changelog; returns the number of symbol links added."""
     frontmatter = """---
 title: Changelog
 description: Release notes for PyKraken.
 ---
 """
     body = normalize_changelog(content)
+    text, links = link_symbols(frontmatter + "\n" + body, load_symbol_links(), page_route(target))
     target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(frontmatter + "\n" + body, encoding="utf-8")
+    target.write_text(text, encoding="utf-8")
+    return links
 
 
 def main() -> int:
@@ -97,8 +112,14 @@ def main() -> int:
 
     content = fetch_changelog(args.branch)
     target = Path("contents") / "docs" / "manual" / "changelog" / "index.mdx"
-    write_changelog(target, content)
-    print(f"Wrote changelog to {target} (from branch: {args.branch})")
+    links = write_changelog(target, content)
+    print(f"Wrote changelog to {target} (from branch: {args.branch}, {links} symbol link(s))")
+    route = page_route(target)
+    entry = page_entry(target, target.read_text(encoding="utf-8"), route, load_type_links())
+    if update_manifest_entries({route: entry}):
+        print("Updated page manifest")
+    if write_route_module("changelog", [(str(entry["title"]), "changelog")], "sync_changelog.py"):
+        print("Updated changelog routes")
     return 0
 
 
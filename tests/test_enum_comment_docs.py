@@ -0,0 +1,54 @@
+"""Tests for enum member docs read from stub comments (`--stubs`)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Optional
+
+from generate_api_docs import load_api_model
+
+STUB = """\
+from enum import IntEnum
+
+class Mode(IntEnum):
+    \"\"\"Processing mode.\"\"\"
+
+    #: Skip checks.
+    FAST = 1
+    SLOW = 2  # Check everything.
+    EXTRA = 3  # Only in the stub.
+"""
+
+IMPLEMENTATION = """\
+from enum import IntEnum
+
+# Implementation notes that are
+# not part of the API.
+
+
+class Mode(IntEnum):
+    FAST = 1  # not a doc
+    SLOW = 2
+"""
+
+
+def member_docs(tmp_path: Path, package: str, files: Dict[str, str]) -> Dict[str, Optional[str]]:
+    (tmp_path / package).mkdir()
+    for name, text in files.items():
+        (tmp_path / package / name).write_text(text)
+    api = load_api_model(package, tmp_path)
+    return {prop.name: prop.doc for prop in api.classes["Mode"].properties}
+
+
+EXPECTED = {"FAST": "Skip checks.", "SLOW": "Check everything.", "EXTRA": "Only in the stub."}
+
+
+def test_stub_only_package(tmp_path: Path) -> None:
+    assert member_docs(tmp_path, "stubonly", {"__init__.pyi": STUB}) == EXPECTED
+
+
+def test_stub_merged_over_module(tmp_path: Path) -> None:
+    # Griffe keeps the .py path and line numbers on merged members; the docs
+    # must still come from the stub's lines.
+    files = {"__init__.py": IMPLEMENTATION, "__init__.pyi": STUB}
+    assert member_docs(tmp_path, "merged", files) == EXPECTED
@@ -0,0 +1,110 @@
+"""Tests for `escape_outside_code`, the docstring escaper behind every API page."""
+
+from __future__ import annotations
+
+import random
+import re
+import time
+
+import pytest
+
+from generate_api_docs import HTML_ESCAPES, escape_outside_code
+
+escape = escape_outside_code.__wrapped__  # bypass the lru_cache so timings measure the scan
+
+
+def legacy_escape(text: str) -> str:
+    """The regex implementation the single-pass scanner replaced."""
+    out = []
+    last_pos = 0
+    for match in re.finditer(r"(`+)(.*?)(\1)", text, re.DOTALL):
+        out.append(text[last_pos : match.start()].translate(HTML_ESCAPES))
+        out.append(match.group(0))
+        last_pos = match.end()
+    out.append(text[last_pos:].translate(HTML_ESCAPES))
+    return "".join(out)
+
+
+def random_prose(rng: random.Random) -> str:
+    return "".join(rng.choice("ab <>&{}|\n") for _ in range(rng.randint(1, 12)))
+
+
+def random_balanced(rng: random.Random) -> str:
+    """Prose and non-empty code spans, separated by prose so backtick runs never merge."""
+    parts = [random_prose(rng)]
+    for _ in range(rng.randint(0, 6)):
+        fence = "`" * rng.randint(1, 4)
+        code = "".join(rng.choice("x <>{}|&\n") for _ in range(rng.randint(1, 10)))
+        parts.append(f"{fence}{code}{fence}")
+        parts.append(random_prose(rng))
+    return "".join(parts)
+
+
+def test_matches_legacy_on_balanced_input() -> None:
+    rng = random.Random(20240611)
+    for _ in range(5000):
+        text = random_balanced(rng)
+        assert escape(text) == legacy_escape(text), text
+
+
+def test_cached_and_uncached_agree() -> None:
+    text = "Returns `Vec2 | None` if <x> {y}"
+    assert escape_outside_code(text) == escape(text) == "Returns `Vec2 | None` if &lt;x&gt; &#123;y&#125;"
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("plain <b> & {c} | d", "plain &lt;b&gt; &amp; &#123;c&#125; &#124; d"),
+        ("a ` b <c>", "a ` b &lt;c&gt;"),
+        ("``code` <x>", "``code` &lt;x&gt;"),
+        ("`a` ``b <c>", "`a` ``b &lt;c&gt;"),
+        # a run only closes on a run of the same length, not a prefix of a longer one
+        ("`a`` <b>", "`a`` &lt;b&gt;"),
+        ("``a`<b>``", "``a`<b>``"),
+        ("<`x`> `", "&lt;`x`&gt; `"),
+    ],
+)
+def test_unbalanced_backticks(text: str, expected: str) -> None:
+    assert escape(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("```` ``inner`` <x> ```` <y>", "```` ``inner`` <x> ```` &lt;y&gt;"),
+        (
+            "```python\ndef f() -> Dict[str, int]: {}\n```\n<after>",
+            "```python\ndef f() -> Dict[str, int]: {}\n```\n&lt;after&gt;",
+        ),
+        ("`" * 50 + " <kept> " + "`" * 50 + " <esc>", "`" * 50 + " <kept> " + "`" * 50 + " &lt;esc&gt;"),
+        ("`" * 50 + " <lost> " + "`" * 49, "`" * 50 + " &lt;lost&gt; " + "`" * 49),
+        ("`a` ```b` <c>``` `d`", "`a` ```b` <c>``` `d`"),
+    ],
+)
+def test_nested_and_long_fences(text: str, expected: str) -> None:
+    assert escape(text) == expected
+
+
+def best_time(text: str, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        escape(text)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_time_is_linear_in_backtick_runs() -> None:
+    # Runs of falling length never close; the regex rescanned to the end from
+    # every backtick of every run, growing with the cube of the run count.
+    small = "".join("`" * length + "<" for length in range(200, 0, -1))
+    large = "".join("`" * length + "<" for length in range(800, 0, -1))  # 16x the text
+    assert best_time(large) < 5 * best_time(large.replace("`", "x")) + 0.01
+    assert best_time(large) < 32 * best_time(small) + 0.01
+
+
+def test_time_is_linear_in_code_spans() -> None:
+    small = "`a` <b> " * 20_000
+    large = small * 4
+    assert best_time(large) < 8 * best_time(small) + 0.01